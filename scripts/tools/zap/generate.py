@@ -27,6 +27,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from split_python_cluster_objects import splitClusterObjects
 from zap_execution import ZapTool
 
 # TODO: Can we share this constant definition with zap_regen_all.py?
@@ -45,6 +46,7 @@ class CmdLineArgs:
     version_check: bool = True
     lock_file: Optional[str] = None
     delete_output_dir: bool = False
+    python_dataclass_slots: bool = False
     matter_file_name: Optional[str] = None
 
 
@@ -143,6 +145,8 @@ def runArgumentsParser() -> CmdLineArgs:
                         action='store_false', dest='version_check')
     parser.add_argument('--keep-output-dir', action='store_true',
                         help='Keep any created output directory. Useful for temporary directories.')
+    parser.add_argument('--python-dataclass-slots', action='store_true',
+                        help='Generate the Python cluster objects as slots dataclasses (requires Python 3.10)')
     parser.set_defaults(parallel=True)
     parser.set_defaults(prettify_output=True)
     parser.set_defaults(version_check=True)
@@ -185,6 +189,7 @@ def runArgumentsParser() -> CmdLineArgs:
         version_check=args.version_check,
         lock_file=args.lock_file,
         delete_output_dir=delete_output_dir,
+        python_dataclass_slots=args.python_dataclass_slots,
         matter_file_name=matter_file_name,
     )
 
@@ -327,6 +332,17 @@ def runClangPrettifier(templates_file, output_dir):
         print('clang-format error: %s', err)
 
 
+def runPythonClusterObjectsSplitter(templates_file, output_dir, slots=False):
+    # The Python cluster objects are generated into a single Objects.py, which is then split into
+    # one lazily imported module per cluster (see split_python_cluster_objects.py).
+    jsonData = json.loads(Path(templates_file).read_text())
+    for template in jsonData['templates']:
+        output = os.path.join(output_dir, template['output'])
+        if output.endswith(os.path.join('chip', 'clusters', 'Objects.py')):
+            splitClusterObjects(output, slots=slots)
+            print('Split %s into per-cluster modules' % output)
+
+
 class LockFileSerializer:
     def __init__(self, path):
         self.lock_file_path = path
@@ -387,6 +403,8 @@ def main():
             else:
                 del os.environ['TEMP']
 
+    runPythonClusterObjectsSplitter(cmdLineArgs.templateFile, cmdLineArgs.outputDir, cmdLineArgs.python_dataclass_slots)
+
     if cmdLineArgs.prettify_output:
         prettifiers = [
             runClangPrettifier,
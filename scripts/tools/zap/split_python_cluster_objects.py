@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+"""Splits the Python cluster objects generated by ZAP into one module per cluster.
+
+src/controller/python/templates/python-cluster-Objects-py.zapt generates every cluster into a single
+chip/clusters/Objects.py. Building all the classes it defines takes seconds, so the file is split
+after generation:
+
+  - chip/clusters/generated/<Name>.py holds the definition of the cluster <Name> (and Globals.py the
+    global enums, bitmaps and structs), with the imports it uses.
+  - chip/clusters/generated/files.gni lists these modules for the chip-clusters wheel.
+  - chip/clusters/Objects.py is replaced by an index importing each module on first access to its
+    cluster (PEP 562), and telling chip.clusters.ClusterObjects which module defines each cluster id.
+
+With --slots, the structs, events, commands and clusters are emitted as @dataclass(slots=True), without a
+per-instance __dict__, which makes the objects held in attribute caches smaller. The generated modules
+then require Python 3.10.
+
+Usage:
+    split_python_cluster_objects.py [--slots] src/controller/python/chip/clusters/Objects.py
+"""
+
+import argparse
+import ast
+import os
+import re
+from typing import Dict, List, Tuple
+
+GENERATED_PACKAGE = 'generated'
+LINE_LENGTH = 132
+
+_TOP_LEVEL_CLASS = re.compile(r'^class (\w+)\b')
+_DATACLASS_DECORATOR = re.compile(r'^( *)@dataclass$', re.MULTILINE)
+_CLUSTER_ID = re.compile(r'^    id: typing\.ClassVar\[int\] = (0x[0-9A-Fa-f]+)$', re.MULTILINE)
+
+_OBJECTS_INDEX_COMMENT = '''\
+# This file contains generated struct, enum, command definition.
+# Users are not expected to import this file, instead, users can use import chip.clusters,
+# which will import all symbols from this file and can get a readable, pretty naming like
+# clusters.OnOff.commands.OnCommand
+#
+# Every cluster is defined in its own module under chip/clusters/generated, which is imported on the
+# first access to the cluster (PEP 562) so that importing chip.clusters does not build all of them.
+'''
+
+_OBJECTS_INDEX_LOADER = '''\
+def __getattr__(name: str):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.generated.{name}', __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+RegisterLazyClusterModules({
+    clusterId: f'{__package__}.generated.{name}' for name, clusterId in _CLUSTER_IDS.items()})
+'''
+
+
+def _formatImport(statement: ast.stmt, names: List[str]) -> str:
+    ''' Formats an import of names the way isort does, wrapping at LINE_LENGTH. '''
+    if isinstance(statement, ast.Import):
+        return '\n'.join(f'import {name}' for name in names)
+
+    prefix = f"from {'.' * statement.level}{statement.module or ''} import "
+    line = prefix + ', '.join(names)
+    if len(line) <= LINE_LENGTH:
+        return line
+
+    indent = ' ' * len(prefix + '(')
+    lines = []
+    current = prefix + '('
+    for i, name in enumerate(names):
+        item = name + (')' if i == len(names) - 1 else ',')
+        lineStart = current.endswith('(') or current == indent
+        if not lineStart and len(current) + 1 + len(item) > LINE_LENGTH:
+            lines.append(current)
+            current = indent + item
+        else:
+            current += item if lineStart else ' ' + item
+    lines.append(current)
+    return '\n'.join(lines)
+
+
+def _isortKey(name: str):
+    ''' Sort key of isort for module names: case insensitive, with numbers compared by value. '''
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', name)]
+
+
+def _formatTypeCheckingImport(prefix: str, name: str) -> str:
+    if len(prefix) + len(name) <= LINE_LENGTH:
+        return prefix + name + '\n'
+    return f'{prefix}\\\n        {name}\n'
+
+
+def _boundNames(statement: ast.stmt) -> List[Tuple[str, str]]:
+    ''' Returns (imported name, name bound in the module) for each alias of an import statement. '''
+    result = []
+    for alias in statement.names:
+        if alias.asname:
+            result.append((f'{alias.name} as {alias.asname}', alias.asname))
+        else:
+            result.append((alias.name, alias.name.split('.')[0]))
+    return result
+
+
+def _moduleImports(header: str, body: str, extraLocalImports: List[str]) -> str:
+    ''' Returns the imports of the combined file header used by body, as isort-formatted groups.
+
+        Relative imports are moved one package level up since the modules live in a sub-package.
+    '''
+    tree = ast.parse(header)
+    groups: List[List[str]] = []
+    lastLine = None
+    for statement in tree.body:
+        if not isinstance(statement, (ast.Import, ast.ImportFrom)):
+            continue
+        if isinstance(statement, ast.ImportFrom) and statement.module == '__future__':
+            continue
+        if lastLine is None or statement.lineno > lastLine + 1:
+            groups.append([])
+        lastLine = statement.end_lineno
+
+        names = [imported for imported, bound in _boundNames(statement) if re.search(rf'\b{re.escape(bound)}\b', body)]
+        if not names:
+            continue
+        if isinstance(statement, ast.ImportFrom) and statement.level:
+            statement = ast.ImportFrom(module=statement.module, names=statement.names, level=statement.level + 1)
+        groups[-1].append(_formatImport(statement, names))
+
+    # The local imports sort after the relative imports of the parent package, in the same section.
+    groups[-1].extend(extraLocalImports)
+    return '\n\n'.join('\n'.join(group) for group in groups if group)
+
+
+def _splitBlocks(lines: List[str]) -> Tuple[Dict[str, str], int]:
+    ''' Returns the top-level class definitions (with their decorators) by class name, and the line
+        where the first one starts.
+    '''
+    starts = []
+    for i, line in enumerate(lines):
+        match = _TOP_LEVEL_CLASS.match(line)
+        if match:
+            start = i
+            while start > 0 and lines[start - 1].startswith('@'):
+                start -= 1
+            starts.append((match.group(1), start))
+    if not starts:
+        raise ValueError('No class definition found, the file is not the output of python-cluster-Objects-py.zapt')
+
+    blocks = {}
+    for k, (name, start) in enumerate(starts):
+        end = starts[k + 1][1] if k + 1 < len(starts) else len(lines)
+        blocks[name] = '\n'.join(lines[start:end]).rstrip() + '\n'
+    return blocks, starts[0][1]
+
+
+def splitClusterObjects(objectsPath: str, slots: bool = False):
+    with open(objectsPath) as f:
+        source = f.read()
+    lines = source.split('\n')
+
+    # The license docstring ends at the second ''' line.
+    docstringEnd = [i for i, line in enumerate(lines) if line == "'''"][1]
+    licenseHeader = '\n'.join(lines[:docstringEnd + 1]) + '\n'
+
+    blocks, firstClass = _splitBlocks(lines)
+    header = '\n'.join(lines[docstringEnd + 1:firstClass])
+    allNames = next(ast.literal_eval(statement.value) for statement in ast.parse(header).body
+                    if isinstance(statement, ast.Assign) and statement.targets[0].id == '__all__')
+    if sorted(blocks) != sorted(allNames):
+        raise ValueError(f'{objectsPath}: top-level classes do not match __all__')
+
+    packageDir = os.path.join(os.path.dirname(objectsPath), GENERATED_PACKAGE)
+    os.makedirs(packageDir, exist_ok=True)
+    for entry in os.listdir(packageDir):
+        if entry.endswith('.py') or entry.endswith('.gni'):
+            os.remove(os.path.join(packageDir, entry))
+
+    with open(os.path.join(packageDir, '__init__.py'), 'w') as f:
+        f.write(licenseHeader)
+        f.write('\n# Generated cluster definitions, see chip/clusters/Objects.py.\n')
+
+    clusterIds = {}
+    for name in allNames:
+        body = blocks[name]
+        if name != 'Globals':
+            clusterIds[name] = _CLUSTER_ID.search(body).group(1)
+        localImports = ['from .Globals import Globals'] if name != 'Globals' and re.search(r'\bGlobals\.', body) else []
+        with open(os.path.join(packageDir, f'{name}.py'), 'w') as f:
+            f.write(licenseHeader)
+            f.write('\n')
+            f.write(f'# This file contains the generated struct, enum, command definition of {name}.\n')
+            f.write('# Users are not expected to import this file, see chip/clusters/Objects.py.\n')
+            f.write('from __future__ import annotations\n\n')
+            f.write(_moduleImports(header, body, localImports))
+            f.write('\n\n\n')
+            f.write(_DATACLASS_DECORATOR.sub(r'\1@dataclass(slots=True)', body) if slots else body)
+
+    with open(os.path.join(packageDir, 'files.gni'), 'w') as f:
+        f.write('# Generated by scripts/tools/zap/split_python_cluster_objects.py, do not edit.\n\n')
+        f.write('chip_python_cluster_objects_sources = [\n')
+        f.write(f'  "chip/clusters/{GENERATED_PACKAGE}/__init__.py",\n')
+        for name in sorted(allNames):
+            f.write(f'  "chip/clusters/{GENERATED_PACKAGE}/{name}.py",\n')
+        f.write(']\n')
+
+    with open(objectsPath, 'w') as f:
+        f.write(licenseHeader)
+        f.write('\n')
+        f.write(_OBJECTS_INDEX_COMMENT)
+        f.write('from __future__ import annotations\n\n')
+        f.write('import importlib\nimport typing\n\n')
+        f.write('from .ClusterObjects import RegisterLazyClusterModules\n\n')
+        f.write('if typing.TYPE_CHECKING:\n')
+        for name in sorted(allNames, key=_isortKey):
+            f.write(_formatTypeCheckingImport(f'    from .{GENERATED_PACKAGE}.{name} import ', name))
+        f.write('\n\n__all__ = [\n')
+        for name in allNames:
+            f.write(f'    "{name}",\n')
+        f.write(']\n\n')
+        f.write('# Id of the cluster defined by each generated module.\n')
+        f.write('_CLUSTER_IDS = {\n')
+        for name, clusterId in clusterIds.items():
+            f.write(f'    "{name}": {clusterId},\n')
+        f.write('}\n\n\n')
+        f.write(_OBJECTS_INDEX_LOADER)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--slots', action='store_true', help='Generate the cluster objects as slots dataclasses')
+    parser.add_argument('objects', help='Path to the chip/clusters/Objects.py generated by ZAP')
+    args = parser.parse_args()
+    splitClusterObjects(args.objects, slots=args.slots)
+
+
+if __name__ == '__main__':
+    main()
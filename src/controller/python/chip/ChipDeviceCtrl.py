@@ -30,7 +30,9 @@ from __future__ import absolute_import, annotations, print_function
 
 import asyncio
 import builtins
+import collections
 import concurrent.futures
+import contextlib
 import copy
 import ctypes
 import enum
@@ -38,6 +40,7 @@ import json
 import logging
 import secrets
 import threading
+import time
 import typing
 from ctypes import (CDLL, CFUNCTYPE, POINTER, Structure, byref, c_bool, c_char, c_char_p, c_int, c_int32, c_size_t, c_uint8,
                     c_uint16, c_uint32, c_uint64, c_void_p, cast, create_string_buffer, pointer, py_object, resize, string_at)
@@ -52,9 +55,15 @@ from .bdx import Bdx
 from .clusters import Attribute as ClusterAttribute
 from .clusters import ClusterObjects as ClusterObjects
 from .clusters import Command as ClusterCommand
+from .clusters.AttributeCacheManager import AttributeCacheManager
 from .clusters.CHIPClusters import ChipClusters
+from .clusters.EventStore import EventStore
+from .clusters.PersistentAttributeCache import PersistentAttributeCache
+from .clusters.SubscriptionMultiplexer import SharedSubscription, SubscriptionMultiplexer
 from .crypto import p256keypair
-from .interaction_model import SessionParameters, SessionParametersStruct
+from .DeviceProxyCache import DeviceProxyCache
+from .interaction_model import InteractionModelError, SessionParameters, SessionParametersStruct
+from .metrics import ReadMetricsHook, ReadPhase
 from .native import PyChipError
 
 __all__ = ["ChipDeviceController", "CommissioningParameters"]
@@ -434,6 +443,71 @@ DiscoveryFilterType = discovery.FilterType
 DiscoveryType = discovery.DiscoveryType
 
 
+@dataclass
+class NodeReadResult:
+    ''' The outcome of the read or subscription of a node in ReadMany() and SubscribeMany(). '''
+    nodeId: int
+    # What Read() returned: a ReadResponse, or a SubscriptionTransaction. None on failure.
+    result: typing.Any = None
+    error: typing.Optional[Exception] = None
+
+
+class MultiNodeRead:
+    ''' The reads or subscriptions of a set of nodes started by ReadMany() or SubscribeMany(), at most
+        `concurrency` at a time.
+
+        Iterate over it with `async for` to get a NodeReadResult for each node as it completes. Once they all
+        completed, succeeded and failures hold the summary of the nodes read successfully and of the errors.
+    '''
+
+    def __init__(self, readNode: typing.Callable[[int], typing.Awaitable[typing.Any]], nodeids: typing.List[int],
+                 concurrency: int):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._readNode = readNode
+        self._pending = collections.deque(dict.fromkeys(nodeids))
+        self._remaining = len(self._pending)
+        self._results: asyncio.Queue = asyncio.Queue()
+        self.succeeded: typing.List[int] = []
+        self.failures: typing.Dict[int, Exception] = {}
+        self._workers = [asyncio.get_running_loop().create_task(self._Worker())
+                         for _ in range(min(concurrency, self._remaining))]
+
+    async def _Worker(self):
+        while self._pending:
+            nodeid = self._pending.popleft()
+            try:
+                result = NodeReadResult(nodeId=nodeid, result=await self._readNode(nodeid))
+                self.succeeded.append(nodeid)
+            except Exception as ex:
+                LOGGER.error(f"Read of node 0x{nodeid:016X} failed: {ex!r}")
+                result = NodeReadResult(nodeId=nodeid, error=ex)
+                self.failures[nodeid] = ex
+            self._results.put_nowait(result)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> NodeReadResult:
+        if self._remaining == 0:
+            raise StopAsyncIteration
+        self._remaining -= 1
+        return await self._results.get()
+
+    async def Wait(self) -> typing.Dict[int, Exception]:
+        ''' Waits for the nodes not iterated over yet, and returns the failures by node id. '''
+        async for _ in self:
+            pass
+        return self.failures
+
+    def Cancel(self):
+        ''' Stops reading the nodes, the reads in progress are cancelled. '''
+        self._pending.clear()
+        for worker in self._workers:
+            worker.cancel()
+        self._remaining = self._results.qsize()
+
+
 class ChipDeviceControllerBase():
     activeList: typing.Set = set()
 
@@ -460,6 +534,16 @@ class ChipDeviceControllerBase():
         self._open_window_context: CallbackContext = CallbackContext(asyncio.Lock())
         self._unpair_device_context: CallbackContext = CallbackContext(asyncio.Lock())
         self._pase_establishment_context: CallbackContext = CallbackContext(self._commissioning_lock)
+        self._persistentAttributeCache: typing.Optional[PersistentAttributeCache] = None
+        self._persistentAttributeCacheFabricId = 0
+        self._attributeCacheManager: typing.Optional[AttributeCacheManager] = None
+        self._readCoalescer: typing.Optional[ClusterAttribute.ReadCoalescer] = None
+        self._subscriptionMultiplexer: typing.Optional[SubscriptionMultiplexer] = None
+        self._eventStore: typing.Optional[EventStore] = None
+        self._readMetrics: typing.Optional[ReadMetricsHook] = None
+        self._deviceProxyCache: typing.Optional[DeviceProxyCache] = None
+        # The nodes this controller established a PASE session to, which GetConnectedDevice looks up before the cache.
+        self._paseNodeIds: typing.Set[int] = set()
 
     def _set_dev_ctrl(self, devCtrl, pairingDelegate):
         def HandleCommissioningComplete(nodeId: int, err: PyChipError):
@@ -604,6 +688,16 @@ class ChipDeviceControllerBase():
         if not self._isActive:
             return
 
+        if self._subscriptionMultiplexer is not None:
+            self._subscriptionMultiplexer.Shutdown()
+            self._subscriptionMultiplexer = None
+
+        if self._deviceProxyCache is not None:
+            self._deviceProxyCache.Clear()
+
+        if self._persistentAttributeCache is not None:
+            self._persistentAttributeCache.Flush()
+
         if self.devCtrl is not None:
             self._ChipStack.Call(
                 lambda: self._dmLib.pychip_DeviceController_DeleteDeviceController(
@@ -658,6 +752,7 @@ class ChipDeviceControllerBase():
         """
         self.CheckIsActive()
 
+        self._notePASESession(nodeid)
         async with self._commissioning_context as ctx:
             self._enablePairingCompleteCallback(True)
             await self._ChipStack.CallAsync(
@@ -676,7 +771,16 @@ class ChipDeviceControllerBase():
                     self.devCtrl, nodeid, self.cbHandleDeviceUnpairCompleteFunct)
             )
 
-            return await asyncio.futures.wrap_future(ctx.future)
+            res = await asyncio.futures.wrap_future(ctx.future)
+            if self._persistentAttributeCache is not None:
+                self._persistentAttributeCache.RemoveNode(self._persistentAttributeCacheFabricId, nodeid)
+            if self._attributeCacheManager is not None:
+                self._attributeCacheManager.RemoveNode(nodeid)
+            if self._deviceProxyCache is not None:
+                self._deviceProxyCache.Invalidate(nodeid)
+            if self._eventStore is not None:
+                self._eventStore.RemoveNode(nodeid)
+            return res
 
     def CloseBLEConnection(self):
         self.CheckIsActive()
@@ -696,20 +800,32 @@ class ChipDeviceControllerBase():
         """
         self.CheckIsActive()
 
+        if self._deviceProxyCache is not None:
+            self._deviceProxyCache.Invalidate(nodeid)
         self._ChipStack.Call(lambda: self._dmLib.pychip_ExpireSessions(self.devCtrl, nodeid)).raise_on_error()
 
     # TODO: This needs to be called MarkSessionDefunct
     def CloseSession(self, nodeid):
         self.CheckIsActive()
 
+        if self._deviceProxyCache is not None:
+            self._deviceProxyCache.Invalidate(nodeid)
+
         self._ChipStack.Call(
             lambda: self._dmLib.pychip_DeviceController_CloseSession(
                 self.devCtrl, nodeid)
         ).raise_on_error()
 
-    async def _establishPASESession(self, callFunct):
+    def _notePASESession(self, nodeid: int):
+        ''' Records that the node may have a PASE session, which GetConnectedDevice then uses over a cached proxy. '''
+        self._paseNodeIds.add(nodeid)
+        if self._deviceProxyCache is not None:
+            self._deviceProxyCache.Invalidate(nodeid)
+
+    async def _establishPASESession(self, nodeid: int, callFunct):
         self.CheckIsActive()
 
+        self._notePASESession(nodeid)
         async with self._pase_establishment_context as ctx:
             self._enablePairingCompleteCallback(True)
             await self._ChipStack.CallAsync(callFunct)
@@ -717,19 +833,19 @@ class ChipDeviceControllerBase():
 
     async def EstablishPASESessionBLE(self, setupPinCode: int, discriminator: int, nodeid: int) -> None:
         await self._establishPASESession(
-            lambda: self._dmLib.pychip_DeviceController_EstablishPASESessionBLE(
+            nodeid, lambda: self._dmLib.pychip_DeviceController_EstablishPASESessionBLE(
                 self.devCtrl, setupPinCode, discriminator, nodeid)
         )
 
     async def EstablishPASESessionIP(self, ipaddr: str, setupPinCode: int, nodeid: int, port: int = 0) -> None:
         await self._establishPASESession(
-            lambda: self._dmLib.pychip_DeviceController_EstablishPASESessionIP(
+            nodeid, lambda: self._dmLib.pychip_DeviceController_EstablishPASESessionIP(
                 self.devCtrl, ipaddr.encode("utf-8"), setupPinCode, nodeid, port)
         )
 
     async def EstablishPASESession(self, setUpCode: str, nodeid: int) -> None:
         await self._establishPASESession(
-            lambda: self._dmLib.pychip_DeviceController_EstablishPASESession(
+            nodeid, lambda: self._dmLib.pychip_DeviceController_EstablishPASESession(
                 self.devCtrl, setUpCode.encode("utf-8"), nodeid)
         )
 
@@ -939,6 +1055,92 @@ class ChipDeviceControllerBase():
 
         return nodeid.value
 
+    def SetPersistentAttributeCache(self, cache: typing.Optional[PersistentAttributeCache]):
+        ''' Sets the on-disk attribute cache used by Read and ReadAttribute, or stops using one with None.
+
+            The nodes are keyed in the cache by the compressed fabric id of this controller and their node id.
+            Fabric filtered reads and subscriptions of attributes which are not given dataVersionFilters then
+            filter out the clusters of the node whose cached data is current, and merge the cached attributes
+            into their results. The cache is flushed when replaced or when this controller is shut down. See
+            chip.clusters.PersistentAttributeCache.
+        '''
+        self.CheckIsActive()
+
+        if self._persistentAttributeCache is not None and self._persistentAttributeCache is not cache:
+            self._persistentAttributeCache.Flush()
+        self._persistentAttributeCache = cache
+        if cache is not None:
+            self._persistentAttributeCacheFabricId = self.GetCompressedFabricId()
+
+    def SetAttributeCacheManager(self, manager: typing.Optional[AttributeCacheManager]):
+        ''' Sets the in-memory cache of the attributes of the nodes used by Read and ReadAttribute, or stops using one
+            with None.
+
+            Fabric filtered reads and subscriptions of attributes which are not given dataVersionFilters then filter
+            out the clusters of the node whose cached data is current, and merge the cached attributes into their
+            results, unless a persistent attribute cache is set, which is used instead.
+            See chip.clusters.AttributeCacheManager.
+        '''
+        self._attributeCacheManager = manager
+
+    def SetEventStore(self, store: typing.Optional[EventStore]):
+        ''' Sets the store of the last events of each node used by Read and ReadEvent, or stops using one with None.
+
+            The events received by reads and subscriptions are then added to the store, and the reads and
+            subscriptions of events not given an eventNumberFilter only get the events the node did not report yet.
+            See chip.clusters.EventStore.
+        '''
+        self._eventStore = store
+
+    def SetReadMetrics(self, metrics: typing.Optional[ReadMetricsHook]):
+        ''' Sets the hook receiving the measurements of the reads and subscriptions, or stops measuring with None.
+
+            It is told the time spent getting a session with the node, in the round trip of the interaction, decoding
+            the data, building the attribute values and running the change callbacks, the amount of data decoded and
+            the outcome of the interaction, with the node id. See chip.metrics.ReadMetrics to collect and export them.
+        '''
+        self._readMetrics = metrics
+
+    def SetDeviceProxyCache(self, cache: typing.Optional[DeviceProxyCache]):
+        ''' Sets the cache of the operational device proxies used by GetConnectedDevice, or stops using one with None.
+
+            The interactions with a node then reuse its proxy while its session is active, instead of looking the
+            session up again. A PASE session to the node id established by this controller, when allowed, is still
+            used first, until it is gone. See chip.DeviceProxyCache.
+        '''
+        if self._deviceProxyCache is not None:
+            self._deviceProxyCache.Clear()
+        self._deviceProxyCache = cache
+
+    @contextlib.contextmanager
+    def _invalidateDeviceProxyOnError(self, nodeid: int):
+        ''' Drops the cached device proxy of the node when the interaction in the context fails with another error than
+            an error status of the node, which may be caused by its session.
+        '''
+        try:
+            yield
+        except InteractionModelError:
+            raise
+        except Exception:
+            if self._deviceProxyCache is not None:
+                self._deviceProxyCache.Invalidate(nodeid)
+            raise
+
+    def SetReadCoalescing(self, enabled: bool):
+        ''' Enables or disables the coalescing of reads (not subscriptions) by Read and ReadAttribute.
+
+            With coalescing, a read of a node issued while an identical read, or a read of a superset of its
+            attribute paths with the same options, is in flight is not sent to the node: it returns the response
+            of that read. The response of identical reads is shared, callers must not modify it.
+            See readCoalescingMetrics for the number of merged reads.
+        '''
+        self._readCoalescer = ClusterAttribute.ReadCoalescer() if enabled else None
+
+    @property
+    def readCoalescingMetrics(self) -> typing.Optional[ClusterAttribute.ReadCoalescingMetrics]:
+        ''' The counters of read coalescing since it was enabled, None when it is disabled. '''
+        return copy.copy(self._readCoalescer.metrics) if self._readCoalescer is not None else None
+
     def GetClusterHandler(self):
         self.CheckIsActive()
 
@@ -951,6 +1153,7 @@ class ChipDeviceControllerBase():
         res = await self._ChipStack.CallAsyncWithResult(lambda: self._dmLib.pychip_GetDeviceBeingCommissioned(
             self.devCtrl, nodeid, byref(returnDevice)), timeoutMs)
         if res.is_success:
+            self._notePASESession(nodeid)
             return DeviceProxyWrapper(returnDevice, DeviceProxyWrapper.DeviceProxyType.COMMISSIONEE, self._dmLib)
 
         await self.EstablishPASESession(setupCode, nodeid)
@@ -1044,6 +1247,13 @@ class ChipDeviceControllerBase():
         '''
         self.CheckIsActive()
 
+        # A PASE session to the node takes precedence over its CASE sessions, so the cache is only used for the nodes
+        # this controller did not establish one to.
+        if self._deviceProxyCache is not None and not (allowPASE and nodeid in self._paseNodeIds):
+            device = self._deviceProxyCache.Get(nodeid, payloadCapability)
+            if device is not None:
+                return device
+
         if allowPASE:
             returnDevice = c_void_p(None)
             res = await self._ChipStack.CallAsyncWithResult(lambda: self._dmLib.pychip_GetDeviceBeingCommissioned(
@@ -1051,6 +1261,7 @@ class ChipDeviceControllerBase():
             if res.is_success:
                 LOGGER.info('Using PASE connection')
                 return DeviceProxyWrapper(returnDevice, DeviceProxyWrapper.DeviceProxyType.COMMISSIONEE, self._dmLib)
+            self._paseNodeIds.discard(nodeid)
 
         eventLoop = asyncio.get_running_loop()
         future = eventLoop.create_future()
@@ -1090,7 +1301,10 @@ class ChipDeviceControllerBase():
         else:
             await future
 
-        return DeviceProxyWrapper(future.result(), DeviceProxyWrapper.DeviceProxyType.OPERATIONAL, self._dmLib)
+        device = DeviceProxyWrapper(future.result(), DeviceProxyWrapper.DeviceProxyType.OPERATIONAL, self._dmLib)
+        if self._deviceProxyCache is not None:
+            self._deviceProxyCache.Put(nodeid, payloadCapability, device)
+        return device
 
     def ComputeRoundTripTimeout(self, nodeid, upperLayerProcessingTimeoutMs: int = 0):
         ''' Returns a computed timeout value based on the round-trip time it takes for the peer at the other end of the session to
@@ -1205,15 +1419,16 @@ class ChipDeviceControllerBase():
         future = eventLoop.create_future()
 
         device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
-        res = await ClusterCommand.SendCommand(
-            future, eventLoop, responseType, device.deviceProxy, ClusterCommand.CommandPath(
-                EndpointId=endpoint,
-                ClusterId=payload.cluster_id,
-                CommandId=payload.command_id,
-            ), payload, timedRequestTimeoutMs=timedRequestTimeoutMs,
-            interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse)
-        res.raise_on_error()
-        return await future
+        with self._invalidateDeviceProxyOnError(nodeid):
+            res = await ClusterCommand.SendCommand(
+                future, eventLoop, responseType, device.deviceProxy, ClusterCommand.CommandPath(
+                    EndpointId=endpoint,
+                    ClusterId=payload.cluster_id,
+                    CommandId=payload.command_id,
+                ), payload, timedRequestTimeoutMs=timedRequestTimeoutMs,
+                interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse)
+            res.raise_on_error()
+            return await future
 
     async def SendBatchCommands(self, nodeid: int, commands: typing.List[ClusterCommand.InvokeRequestInfo],
                                 timedRequestTimeoutMs: typing.Optional[int] = None,
@@ -1249,12 +1464,13 @@ class ChipDeviceControllerBase():
 
         device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
 
-        res = await ClusterCommand.SendBatchCommands(
-            future, eventLoop, device.deviceProxy, commands,
-            timedRequestTimeoutMs=timedRequestTimeoutMs,
-            interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse)
-        res.raise_on_error()
-        return await future
+        with self._invalidateDeviceProxyOnError(nodeid):
+            res = await ClusterCommand.SendBatchCommands(
+                future, eventLoop, device.deviceProxy, commands,
+                timedRequestTimeoutMs=timedRequestTimeoutMs,
+                interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse)
+            res.raise_on_error()
+            return await future
 
     def SendGroupCommand(self, groupid: int, payload: ClusterObjects.ClusterCommand, busyWaitMs: typing.Optional[int] = None):
         '''
@@ -1310,10 +1526,11 @@ class ChipDeviceControllerBase():
                 attrs.append(ClusterAttribute.AttributeWriteRequest(
                     v[0], v[1], v[2], 1, v[1].value))
 
-        ClusterAttribute.WriteAttributes(
-            future, eventLoop, device.deviceProxy, attrs, timedRequestTimeoutMs=timedRequestTimeoutMs,
-            interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs).raise_on_error()
-        return await future
+        with self._invalidateDeviceProxyOnError(nodeid):
+            ClusterAttribute.WriteAttributes(
+                future, eventLoop, device.deviceProxy, attrs, timedRequestTimeoutMs=timedRequestTimeoutMs,
+                interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs).raise_on_error()
+            return await future
 
     def WriteGroupAttribute(
             self, groupid: int, attributes: typing.List[typing.Tuple[ClusterObjects.ClusterAttributeDescriptor, int]], busyWaitMs: typing.Optional[int] = None):
@@ -1437,8 +1654,12 @@ class ChipDeviceControllerBase():
         typing.Tuple[int, typing.Type[ClusterObjects.Cluster], int],
         # Concrete path
         typing.Tuple[int,
-                     typing.Type[ClusterObjects.ClusterEvent], int]
+                     typing.Type[ClusterObjects.ClusterEvent], int],
+        # Directly specified event path
+        ClusterAttribute.EventPath
     ]):
+        if isinstance(pathTuple, ClusterAttribute.EventPath):
+            return pathTuple
         if pathTuple in [('*'), ()]:
             # Wildcard
             return ClusterAttribute.EventPath()
@@ -1498,7 +1719,9 @@ class ChipDeviceControllerBase():
         eventNumberFilter: typing.Optional[int] = None,
         returnClusterObject: bool = False, reportInterval: typing.Optional[typing.Tuple[int, int]] = None,
         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
-        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, lazyDecode: bool = False,
+        compactAttributeCache: bool = False, maxSubscriptionEvents: typing.Optional[int] = 1000,
+        device: typing.Optional[DeviceProxyWrapper] = None
     ):
         '''
         Read a list of attributes and/or events from a target node
@@ -1522,6 +1745,8 @@ class ChipDeviceControllerBase():
             An AttributePath can also be specified directly by [chip.cluster.Attribute.AttributePath(...)]
 
         dataVersionFilters: A list of tuples of (endpoint, cluster, data version).
+            When not provided and a persistent attribute cache is set (see SetPersistentAttributeCache), the filters are
+            those of the clusters of the node in the cache.
 
         events: A list of tuples of varying types depending on the type of read being requested:
             (endpoint, Clusters.ClusterA.EventA, urgent):       Endpoint = specific,
@@ -1535,6 +1760,8 @@ class ChipDeviceControllerBase():
             '*' or ():                                  Endpoint = *,          Cluster = *,          Event = *, Urgent = True/False
 
         eventNumberFilter: Optional minimum event number filter.
+            When not provided and an event store is set (see SetEventStore), the filter skips the events of the node in
+            the store.
 
         returnClusterObject: This returns the data as consolidated cluster objects, with all attributes for a cluster inside
                              a single cluster-wide cluster object.
@@ -1548,6 +1775,18 @@ class ChipDeviceControllerBase():
         autoResubscribe: Automatically resubscribe to the subscription if subscription is lost. The automatic re-subscription only
             applies if the subscription establishes on first try. If the first subscription establishment attempt fails the function
             returns right away.
+        lazyDecode: If True, the received attribute data is kept as TLV and only decoded when accessed, which is useful for
+            wide reads where most of the data is never looked at. The attributes of the ReadResponse are then read-only
+            mappings decoding each value on access, as with compactAttributeCache, and its tlvAttributes hold
+            chip.tlv.LazyTLVView objects over the received TLV. A value accessed again is decoded again.
+        compactAttributeCache: If True, the received attributes are kept in a single flat store of their TLV encoding and only
+            decoded when accessed, instead of nested dicts of decoded values. This reduces the memory used by long lived
+            subscriptions to large devices (e.g. bridges). The attributes of the ReadResponse and of the subscription are then
+            read-only mappings with the same layout.
+        maxSubscriptionEvents: The number of events a subscription keeps for SubscriptionTransaction.GetEvents(), the
+            older ones are dropped. None keeps them all, for the lifetime of the subscription.
+        device: The session with the node returned by GetConnectedDevice, when the caller already has it. Otherwise a
+            session is got (or established) with payloadCapability.
 
         Returns:
             - AsyncReadTransaction.ReadResponse. Please see ReadAttribute and ReadEvent for examples of how to access data.
@@ -1558,10 +1797,6 @@ class ChipDeviceControllerBase():
         '''
         self.CheckIsActive()
 
-        eventLoop = asyncio.get_running_loop()
-        future = eventLoop.create_future()
-
-        device = await self.GetConnectedDevice(nodeid, payloadCapability=payloadCapability)
         attributePaths = [self._parseAttributePathTuple(
             v) for v in attributes] if attributes else None
         clusterDataVersionFilters = [self._parseDataVersionFilterTuple(
@@ -1569,19 +1804,84 @@ class ChipDeviceControllerBase():
         eventPaths = [self._parseEventPathTuple(
             v) for v in events] if events else None
 
-        transaction = ClusterAttribute.AsyncReadTransaction(future, eventLoop, self, returnClusterObject)
-        ClusterAttribute.Read(transaction, device=device.deviceProxy,
-                              attributes=attributePaths, dataVersionFilters=clusterDataVersionFilters, events=eventPaths,
-                              eventNumberFilter=eventNumberFilter,
-                              subscriptionParameters=ClusterAttribute.SubscriptionParameters(
-                                  reportInterval[0], reportInterval[1]) if reportInterval else None,
-                              fabricFiltered=fabricFiltered,
-                              keepSubscriptions=keepSubscriptions, autoResubscribe=autoResubscribe).raise_on_error()
-        await future
+        def read():
+            return self._read(nodeid, attributePaths, clusterDataVersionFilters, eventPaths, eventNumberFilter,
+                              returnClusterObject, reportInterval, fabricFiltered, keepSubscriptions, autoResubscribe,
+                              payloadCapability, lazyDecode, compactAttributeCache, maxSubscriptionEvents, device)
+
+        if self._readCoalescer is not None and reportInterval is None:
+            return await self._readCoalescer.Read(
+                nodeid, attributePaths, eventPaths, clusterDataVersionFilters,
+                (eventNumberFilter, returnClusterObject, fabricFiltered, payloadCapability, lazyDecode, compactAttributeCache),
+                read)
+        return await read()
+
+    async def _read(self, nodeid: int, attributePaths, clusterDataVersionFilters, eventPaths, eventNumberFilter,
+                    returnClusterObject, reportInterval, fabricFiltered, keepSubscriptions, autoResubscribe,
+                    payloadCapability, lazyDecode, compactAttributeCache, maxSubscriptionEvents, device=None):
+        eventLoop = asyncio.get_running_loop()
+        future = eventLoop.create_future()
 
-        if result := transaction.GetSubscriptionHandler():
-            return result
-        return transaction.GetReadResponse()
+        metrics = self._readMetrics
+        transaction = None
+        try:
+            if device is None:
+                start = time.perf_counter()
+                device = await self.GetConnectedDevice(nodeid, payloadCapability=payloadCapability)
+                if metrics is not None:
+                    metrics.OnPhase(nodeid, ReadPhase.SESSION, time.perf_counter() - start)
+
+            nodeCache = None
+            if self._persistentAttributeCache is not None and attributePaths and fabricFiltered and not clusterDataVersionFilters:
+                nodeCache = self._persistentAttributeCache.GetNodeCache(self._persistentAttributeCacheFabricId, nodeid)
+            elif self._attributeCacheManager is not None and attributePaths and fabricFiltered and not clusterDataVersionFilters:
+                nodeCache = self._attributeCacheManager.GetNodeCache(nodeid)
+            if nodeCache is not None:
+                clusterDataVersionFilters = nodeCache.DataVersionFilters(attributePaths) or None
+
+            nodeEventStore = None
+            if self._eventStore is not None and eventPaths:
+                nodeEventStore = self._eventStore.GetNodeStore(nodeid)
+                if eventNumberFilter is None:
+                    eventNumberFilter = nodeEventStore.EventNumberFilter(eventPaths)
+
+            transaction = ClusterAttribute.AsyncReadTransaction(
+                future, eventLoop, self, returnClusterObject, lazyDecode, compactAttributeCache,
+                maxEvents=maxSubscriptionEvents if reportInterval else None)
+            if nodeCache is not None:
+                transaction.UsePersistentCache(nodeCache, attributePaths, clusterDataVersionFilters or [])
+            if nodeEventStore is not None:
+                transaction.UseEventStore(nodeEventStore, eventPaths)
+            if metrics is not None:
+                transaction.UseMetrics(metrics, nodeid)
+            start = time.perf_counter()
+            ClusterAttribute.Read(transaction, device=device.deviceProxy,
+                                  attributes=attributePaths, dataVersionFilters=clusterDataVersionFilters, events=eventPaths,
+                                  eventNumberFilter=eventNumberFilter,
+                                  subscriptionParameters=ClusterAttribute.SubscriptionParameters(
+                                      reportInterval[0], reportInterval[1]) if reportInterval else None,
+                                  fabricFiltered=fabricFiltered,
+                                  keepSubscriptions=keepSubscriptions, autoResubscribe=autoResubscribe).raise_on_error()
+            await future
+            if metrics is not None:
+                metrics.OnPhase(nodeid, ReadPhase.ROUND_TRIP, time.perf_counter() - start)
+
+            result = transaction.GetSubscriptionHandler() or transaction.GetReadResponse()
+        except asyncio.CancelledError:
+            # Otherwise a subscription would be left on the node, which nobody could shut down.
+            if transaction is not None:
+                transaction.Cancel()
+            raise
+        except Exception as ex:
+            if self._deviceProxyCache is not None and not isinstance(ex, InteractionModelError):
+                self._deviceProxyCache.Invalidate(nodeid)
+            if metrics is not None:
+                metrics.OnTransaction(nodeid, 'subscribe' if reportInterval else 'read', False)
+            raise
+
+        if metrics is not None:
+            metrics.OnTransaction(nodeid, 'subscribe' if reportInterval else 'read', True)
+        return result
 
     async def ReadAttribute(
         self,
@@ -1603,7 +1903,8 @@ class ChipDeviceControllerBase():
         returnClusterObject: bool = False,
         reportInterval: typing.Optional[typing.Tuple[int, int]] = None,
         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
-        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, lazyDecode: bool = False,
+        compactAttributeCache: bool = False
     ):
         '''
         Read a list of attributes from a target node, this is a wrapper of DeviceController.Read()
@@ -1638,6 +1939,8 @@ class ChipDeviceControllerBase():
         autoResubscribe: Automatically resubscribe to the subscription if subscription is lost. The automatic re-subscription only
             applies if the subscription establishes on first try. If the first subscription establishment attempt fails the function
             returns right away.
+        lazyDecode: If True, the received attributes are decoded on access. See Read().
+        compactAttributeCache: If True, the received attributes are stored as TLV and decoded on access. See Read().
 
         Returns:
             - subscription request: ClusterAttribute.SubscriptionTransaction
@@ -1667,12 +1970,116 @@ class ChipDeviceControllerBase():
                               fabricFiltered=fabricFiltered,
                               keepSubscriptions=keepSubscriptions,
                               autoResubscribe=autoResubscribe,
-                              payloadCapability=payloadCapability)
+                              payloadCapability=payloadCapability,
+                              lazyDecode=lazyDecode,
+                              compactAttributeCache=compactAttributeCache)
         if isinstance(res, ClusterAttribute.SubscriptionTransaction):
             return res
         else:
             return res.attributes
 
+    def ReadMany(self, nodeids: typing.List[int], attributes=None, events=None, concurrency: int = 16,
+                 connectTimeoutMs: typing.Optional[int] = None, upperLayerProcessingTimeoutMs: int = 5000,
+                 readTimeoutMs: typing.Optional[int] = None, **kwargs) -> MultiNodeRead:
+        '''
+        Reads the same attributes and/or events from a list of nodes, at most `concurrency` at a time.
+        Must be called from a coroutine.
+
+        nodeids: Target Node IDs
+        attributes, events: The paths to read from each node, see Read().
+        concurrency: The maximum number of nodes being read at the same time.
+        connectTimeoutMs: Timeout for getting a session with each node. None waits until the session establishment
+            fails.
+        upperLayerProcessingTimeoutMs: The time the nodes are given to process the request. Unless readTimeoutMs is
+            given, the read of a node times out after the round trip time of its session with this processing time (see
+            ComputeRoundTripTimeout).
+        readTimeoutMs: Timeout for the read of each node once its session is established. The default one only covers
+            a single round trip, so give a larger one for the reads answered in several chunks, e.g. wildcard reads of
+            large nodes.
+        Other keyword arguments are passed to Read().
+
+        Returns:
+            - MultiNodeRead, an asynchronous iterator over the NodeReadResult of each node as it completes:
+
+                reads = devCtrl.ReadMany(nodeids, [(0, Clusters.BasicInformation.Attributes.SoftwareVersion)])
+                async for nodeResult in reads:
+                    ...
+                print(reads.failures)
+
+            The result of a NodeReadResult is the ReadResponse returned by Read(), its error the exception the read
+            failed with (asyncio.TimeoutError for the timeouts). A subscription whose establishment timed out is shut
+            down.
+        '''
+        self.CheckIsActive()
+        payloadCapability = kwargs.get('payloadCapability', TransportPayloadCapability.MRP_PAYLOAD)
+
+        async def readNode(nodeid: int):
+            device = await self.GetConnectedDevice(nodeid, timeoutMs=connectTimeoutMs, payloadCapability=payloadCapability)
+            timeoutMs = readTimeoutMs
+            if timeoutMs is None:
+                timeoutMs = await self._ChipStack.CallAsyncWithResult(
+                    lambda: self._dmLib.pychip_DeviceProxy_ComputeRoundTripTimeout(
+                        device.deviceProxy, upperLayerProcessingTimeoutMs))
+            return await asyncio.wait_for(self.Read(nodeid, attributes=attributes, events=events, device=device, **kwargs),
+                                          timeout=timeoutMs / 1000)
+
+        return MultiNodeRead(readNode, nodeids, concurrency)
+
+    def SubscribeMany(self, nodeids: typing.List[int], attributes=None, events=None,
+                      reportInterval: typing.Tuple[int, int] = (0, 60), concurrency: int = 16,
+                      connectTimeoutMs: typing.Optional[int] = None, upperLayerProcessingTimeoutMs: int = 5000,
+                      **kwargs) -> MultiNodeRead:
+        '''
+        Subscribes to the same attributes and/or events on a list of nodes, at most `concurrency` subscriptions being
+        established at the same time. Must be called from a coroutine.
+
+        reportInterval: A tuple of two int-s for (MinIntervalFloor, MaxIntervalCeiling).
+        The other arguments are those of ReadMany(). Unless readTimeoutMs is given, the establishment of the subscription
+        to a node times out after the round trip time of its session with upperLayerProcessingTimeoutMs, and the
+        subscription is then shut down.
+
+        Returns:
+            - MultiNodeRead, an asynchronous iterator over the NodeReadResult of each node as its subscription is
+              established or fails. The result of a NodeReadResult is then the SubscriptionTransaction of the node.
+        '''
+        return self.ReadMany(nodeids, attributes=attributes, events=events, concurrency=concurrency,
+                             connectTimeoutMs=connectTimeoutMs, upperLayerProcessingTimeoutMs=upperLayerProcessingTimeoutMs,
+                             reportInterval=reportInterval, **kwargs)
+
+    async def SubscribeShared(self, nodeid: int, attributes=None, events=None,
+                              reportInterval: typing.Tuple[int, int] = (0, 60)) -> SharedSubscription:
+        '''
+        Subscribes to attributes and/or events of a node through the single subscription to the node shared by all the
+        callers of SubscribeShared, instead of a subscription of its own. Devices only support a few subscriptions.
+
+        The shared subscription covers the union of the paths of its consumers, with the shortest report intervals they
+        asked for, and is re-subscribed when a consumer needing more, or less, comes or goes. See
+        chip.clusters.SubscriptionMultiplexer.
+
+        attributes, events: The paths to subscribe to, see Read().
+        reportInterval: A tuple of two int-s for (MinIntervalFloor, MaxIntervalCeiling).
+
+        Returns:
+            - SharedSubscription, which offers the callbacks and accessors of a SubscriptionTransaction for the
+              changes of the paths of the caller. Shut it down when done with it.
+
+        Raises:
+            - InteractionModelError (chip.interaction_model) on error
+        '''
+        self.CheckIsActive()
+
+        if self._subscriptionMultiplexer is None:
+            async def subscribe(nodeid: int, attributePaths, eventPaths, reportInterval: typing.Tuple[int, int]):
+                # The previous subscription to the node is shut down by the multiplexer once this one is established.
+                return await self.Read(nodeid, attributes=attributePaths or None, events=eventPaths or None,
+                                       reportInterval=reportInterval, keepSubscriptions=True)
+
+            self._subscriptionMultiplexer = SubscriptionMultiplexer(subscribe)
+
+        attributePaths = [self._parseAttributePathTuple(v) for v in attributes] if attributes else None
+        eventPaths = [self._parseEventPathTuple(v) for v in events] if events else None
+        return await self._subscriptionMultiplexer.Subscribe(nodeid, attributePaths, eventPaths, reportInterval)
+
     async def ReadEvent(
         self,
         nodeid: int,
@@ -1693,7 +2100,8 @@ class ChipDeviceControllerBase():
         reportInterval: typing.Optional[typing.Tuple[int, int]] = None,
         keepSubscriptions: bool = False,
         autoResubscribe: bool = True,
-        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD,
+        maxSubscriptionEvents: typing.Optional[int] = 1000
     ):
         '''
         Read a list of events from a target node, this is a wrapper of DeviceController.Read()
@@ -1717,7 +2125,7 @@ class ChipDeviceControllerBase():
             ReadEvent(1, [ Clusters.BasicInformation ] ) -- case 5 above.
             ReadEvent(1, [ (1, Clusters.BasicInformation.Events.Location ] ) -- case 1 above.
 
-        eventNumberFilter: Optional minimum event number filter.
+        eventNumberFilter: Optional minimum event number filter. See Read() for its default with an event store.
         reportInterval: A tuple of two int-s for (MinIntervalFloor, MaxIntervalCeiling). Used by establishing subscriptions.
             When not provided, a read request will be sent.
         keepSubscriptions: Keep existing subscriptions. If set to False, existing subscriptions with this node will get cancelled
@@ -1725,6 +2133,8 @@ class ChipDeviceControllerBase():
         autoResubscribe: Automatically resubscribe to the subscription if subscription is lost. The automatic re-subscription only
             applies if the subscription establishes on first try. If the first subscription establishment attempt fails the function
             returns right away.
+        maxSubscriptionEvents: The number of events a subscription keeps for SubscriptionTransaction.GetEvents(), the
+            older ones are dropped. None keeps them all, for the lifetime of the subscription.
 
         Returns:
             - subscription request: ClusterAttribute.SubscriptionTransaction
@@ -1741,7 +2151,8 @@ class ChipDeviceControllerBase():
         '''
         res = await self.Read(nodeid=nodeid, events=events, eventNumberFilter=eventNumberFilter,
                               fabricFiltered=fabricFiltered, reportInterval=reportInterval, keepSubscriptions=keepSubscriptions,
-                              autoResubscribe=autoResubscribe, payloadCapability=payloadCapability)
+                              autoResubscribe=autoResubscribe, payloadCapability=payloadCapability,
+                              maxSubscriptionEvents=maxSubscriptionEvents)
         if isinstance(res, ClusterAttribute.SubscriptionTransaction):
             return res
         else:
@@ -2240,6 +2651,7 @@ class ChipDeviceController(ChipDeviceControllerBase):
         if isinstance(filter, int):
             filter = str(filter)
 
+        self._notePASESession(nodeId)
         async with self._commissioning_context as ctx:
             self._enablePairingCompleteCallback(True)
             await self._ChipStack.CallAsync(
@@ -2260,6 +2672,7 @@ class ChipDeviceController(ChipDeviceControllerBase):
         '''
         self.CheckIsActive()
 
+        self._notePASESession(nodeid)
         async with self._commissioning_context as ctx:
             self._enablePairingCompleteCallback(True)
             await self._ChipStack.CallAsync(
@@ -2279,6 +2692,7 @@ class ChipDeviceController(ChipDeviceControllerBase):
         """
         self.CheckIsActive()
 
+        self._notePASESession(nodeid)
         async with self._commissioning_context as ctx:
             self._enablePairingCompleteCallback(True)
             await self._ChipStack.CallAsync(
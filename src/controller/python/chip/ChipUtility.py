@@ -73,3 +73,22 @@ class ChipUtility(object):
 class classproperty(property):
     def __get__(self, cls, owner):
         return classmethod(self.fget).__get__(None, owner)()
+
+
+class cachedclassproperty(classproperty):
+    ''' A classproperty evaluated once per class, the value is then cached in the class itself.
+
+        Subclasses inheriting the property evaluate and cache it for themselves on first access.
+    '''
+
+    def __init__(self, fget):
+        super().__init__(fget)
+        self._cacheName = f'_cached_{fget.__name__}'
+
+    def __get__(self, cls, owner):
+        try:
+            return owner.__dict__[self._cacheName]
+        except KeyError:
+            value = super().__get__(cls, owner)
+            setattr(owner, self._cacheName, value)
+            return value
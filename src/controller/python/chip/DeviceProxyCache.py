@@ -0,0 +1,132 @@
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import copy
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class DeviceProxyCacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Proxies dropped because they were older than the TTL.
+    expirations: int = 0
+    # Proxies dropped because their session was no longer active.
+    livenessFailures: int = 0
+    # Proxies dropped because an interaction with the node failed, or its sessions were closed.
+    invalidations: int = 0
+    # Proxies cached for a node whose previous proxy was dropped, i.e. a session lookup or establishment after a loss.
+    reestablishments: int = 0
+
+
+@dataclass
+class _CachedProxy:
+    device: Any
+    created: float
+    lastChecked: float
+
+
+class DeviceProxyCache:
+    ''' A cache of the operational device proxies of the nodes, so that the interactions with a node which has an active
+        CASE session do not look it up again.
+
+        Once set on a controller (ChipDeviceControllerBase.SetDeviceProxyCache), GetConnectedDevice returns the cached
+        proxy of the node for the same payload capability, if any and if it does not use a PASE session to the node,
+        and caches the operational ones it gets. A proxy is dropped:
+
+            - when it is older than `ttl` seconds,
+            - when its session is no longer active, which is checked with DeviceProxyWrapper.isActiveSession at most
+              every `livenessCheckInterval` seconds, 0 to check it on every use,
+            - when an interaction with the node fails with another error than an InteractionModelError, or when the
+              sessions of the node are closed or expired, see Invalidate().
+
+        Must only be used from the event loop of the controller.
+    '''
+
+    def __init__(self, ttl: float = 60.0, livenessCheckInterval: float = 5.0, clock: Callable[[], float] = time.monotonic):
+        self._ttl = ttl
+        self._livenessCheckInterval = livenessCheckInterval
+        self._clock = clock
+        self._proxies: Dict[Tuple[int, int], _CachedProxy] = {}
+        # The nodes whose proxies were dropped since they were last cached.
+        self._lostNodes: Set[int] = set()
+        self._stats = DeviceProxyCacheStats()
+
+    @property
+    def stats(self) -> DeviceProxyCacheStats:
+        return copy.copy(self._stats)
+
+    def Get(self, nodeId: int, payloadCapability: int) -> Optional[Any]:
+        ''' Returns the cached proxy of the node for the payload capability, or None if there is no usable one. '''
+        key = (nodeId, payloadCapability)
+        cached = self._proxies.get(key)
+        if cached is None:
+            self._stats.misses += 1
+            return None
+
+        now = self._clock()
+        if now - cached.created >= self._ttl:
+            self._Drop(key)
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+
+        if now - cached.lastChecked >= self._livenessCheckInterval:
+            try:
+                alive = cached.device.isActiveSession
+            except Exception as ex:
+                LOGGER.warning(f"Could not check the session of node 0x{nodeId:016X}: {ex}")
+                alive = False
+            if not alive:
+                self._Drop(key)
+                self._stats.livenessFailures += 1
+                self._stats.misses += 1
+                return None
+            cached.lastChecked = now
+
+        self._stats.hits += 1
+        return cached.device
+
+    def Put(self, nodeId: int, payloadCapability: int, device: Any):
+        ''' Caches the proxy of the node for the payload capability, whose session was just looked up. '''
+        if nodeId in self._lostNodes:
+            self._lostNodes.discard(nodeId)
+            self._stats.reestablishments += 1
+        now = self._clock()
+        self._proxies[(nodeId, payloadCapability)] = _CachedProxy(device=device, created=now, lastChecked=now)
+
+    def Invalidate(self, nodeId: int):
+        ''' Drops the proxies of the node, e.g. after a session error. '''
+        keys = [key for key in self._proxies if key[0] == nodeId]
+        for key in keys:
+            self._Drop(key)
+        if keys:
+            self._stats.invalidations += 1
+
+    def Clear(self):
+        ''' Drops all the proxies. '''
+        self._proxies = {}
+        self._lostNodes = set()
+
+    def _Drop(self, key: Tuple[int, int]):
+        del self._proxies[key]
+        self._lostNodes.add(key[0])
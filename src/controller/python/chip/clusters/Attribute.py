@@ -18,16 +18,20 @@
 # Needed to use types in type hints before they are fully defined.
 from __future__ import annotations
 
+import asyncio
+import bisect
 import builtins
+import collections
+import collections.abc
 import ctypes
-import inspect
 import logging
-import sys
+import threading
+import time
 from asyncio.futures import Future
 from ctypes import CFUNCTYPE, POINTER, c_size_t, c_uint8, c_uint16, c_uint32, c_uint64, c_void_p, cast, py_object
 from dataclasses import dataclass, field
 from enum import Enum, unique
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Deque, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 import chip
 import chip.exceptions
@@ -35,10 +39,15 @@ import chip.interaction_model
 import chip.tlv
 import construct  # type: ignore
 from chip.interaction_model import PyWriteAttributeData
+from chip.metrics import ReadMetricsHook, ReadPhase
 from chip.native import ErrorSDKPart, PyChipError
 from rich.pretty import pprint  # type: ignore
 
-from .ClusterObjects import Cluster, ClusterAttributeDescriptor, ClusterEvent
+from .ClusterObjects import ALL_ATTRIBUTES, ALL_CLUSTERS, ALL_EVENTS, Cluster, ClusterAttributeDescriptor, ClusterEvent
+
+if TYPE_CHECKING:
+    from .EventStore import NodeEventStore
+    from .PersistentAttributeCache import NodeAttributeCache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -56,6 +65,17 @@ class EventPriority(Enum):
     CRITICAL = 2
 
 
+@unique
+class ReportOverflowPolicy(Enum):
+    ''' What SubscriptionTransaction.Reports() does with a report when its queue is full. '''
+    # The oldest queued report is dropped.
+    DROP_OLDEST = 0
+    # The report is merged into the newest queued report.
+    COALESCE = 1
+    # The Matter thread waits for the consumer to take a report out of the queue.
+    BLOCK = 2
+
+
 @dataclass(frozen=True)
 class AttributePath:
     EndpointId: Optional[int] = None
@@ -78,6 +98,20 @@ class AttributePath:
         return f"{self.EndpointId}/{self.ClusterId}/{self.AttributeId}"
 
 
+def _PathMatches(path: AttributePath, endpointId: int, clusterId: int, attributeId: Optional[int] = None) -> bool:
+    ''' Returns whether the (possibly wildcard) request path covers the given cluster instance, or attribute. '''
+    return ((path.EndpointId is None or path.EndpointId == endpointId)
+            and (path.ClusterId is None or path.ClusterId == clusterId)
+            and (attributeId is None or path.AttributeId is None or path.AttributeId == attributeId))
+
+
+def _PathCovers(path: AttributePath, other: AttributePath) -> bool:
+    ''' Returns whether the (possibly wildcard) request path reads everything the other one does. '''
+    return ((path.EndpointId is None or path.EndpointId == other.EndpointId)
+            and (path.ClusterId is None or path.ClusterId == other.ClusterId)
+            and (path.AttributeId is None or path.AttributeId == other.AttributeId))
+
+
 @dataclass(frozen=True)
 class DataVersionFilter:
     EndpointId: Optional[int] = None
@@ -94,6 +128,11 @@ class DataVersionFilter:
         return f"{self.EndpointId}/{self.ClusterId}/{self.DataVersion}"
 
 
+# (cluster type, attribute type, attribute name) by (cluster id, attribute id), filled on first use of each attribute
+# so that resolving the TypedAttributePath of a reported attribute costs a single dictionary lookup.
+_TypedAttributeIndex: Dict[Tuple[int, int], Tuple[Cluster, ClusterAttributeDescriptor, str]] = {}
+
+
 @dataclass
 class TypedAttributePath:
     ''' Encapsulates an attribute path that has strongly typed references to cluster and attribute
@@ -117,18 +156,21 @@ class TypedAttributePath:
                 "Either ClusterType and AttributeType OR Path must be provided.")
 
         # if ClusterType and AttributeType were provided we can continue onwards to deriving the label.
-        # Otherwise, we'll need to walk the attribute index to find the right type information.
+        # Otherwise, we'll need to look up the right type information in the cluster object registries.
 
         # If Path is provided, derive ClusterType and AttributeType from it
         if self.Path is not None:
-            for cluster, attribute in _AttributeIndex:
-                attributeType = _AttributeIndex[(cluster, attribute)][0]
-                clusterType = _AttributeIndex[(cluster, attribute)][1]
-
-                if clusterType.id == self.Path.ClusterId and attributeType.attribute_id == self.Path.AttributeId:
-                    self.ClusterType = clusterType
-                    self.AttributeType = attributeType
-                    break
+            resolved = _TypedAttributeIndex.get((self.Path.ClusterId, self.Path.AttributeId))
+            if resolved is not None:
+                self.ClusterType, self.AttributeType, self.AttributeName = resolved
+                self.ClusterId = self.Path.ClusterId
+                self.AttributeId = self.Path.AttributeId
+                return
+
+            attributeType = ALL_ATTRIBUTES.get(self.Path.ClusterId, {}).get(self.Path.AttributeId)
+            if attributeType is not None:
+                self.ClusterType = ALL_CLUSTERS.get(self.Path.ClusterId)
+                self.AttributeType = attributeType
 
             if self.ClusterType is None or self.AttributeType is None:
                 raise KeyError(f"No Schema found for Attribute {self.Path}")
@@ -145,6 +187,8 @@ class TypedAttributePath:
 
         self.ClusterId = self.ClusterType.id
         self.AttributeId = self.AttributeType.attribute_id
+        if self.Path is not None:
+            _TypedAttributeIndex[(self.ClusterId, self.AttributeId)] = (self.ClusterType, self.AttributeType, self.AttributeName)
 
 
 @dataclass(frozen=True)
@@ -170,6 +214,21 @@ class EventPath:
         return f"{self.EndpointId}/{self.ClusterId}/{self.EventId}/{self.Urgent}"
 
 
+def _EventPathMatches(path: EventPath, header: EventHeader) -> bool:
+    ''' Returns whether the (possibly wildcard) request path covers the event with the given header. '''
+    return ((path.EndpointId is None or path.EndpointId == header.EndpointId)
+            and (path.ClusterId is None or path.ClusterId == header.ClusterId)
+            and (path.EventId is None or path.EventId == header.EventId))
+
+
+def _EventPathCovers(path: EventPath, other: EventPath) -> bool:
+    ''' Returns whether the (possibly wildcard) request path reads everything the other one does, as urgently. '''
+    return ((path.EndpointId is None or path.EndpointId == other.EndpointId)
+            and (path.ClusterId is None or path.ClusterId == other.ClusterId)
+            and (path.EventId is None or path.EventId == other.EventId)
+            and (not other.Urgent or bool(path.Urgent)))
+
+
 @dataclass
 class EventHeader:
     EndpointId: Optional[int] = None
@@ -244,41 +303,37 @@ class EventReadResult(EventStatus):
     Data: Any = None
 
 
-_AttributeIndex = {}
-_EventIndex = {}
-_ClusterIndex = {}
-
-
-def _BuildAttributeIndex():
-    ''' Build internal attribute index for locating the corresponding cluster object by path in the future.
-        We do this because this operation will take a long time when there are lots of attributes,
-        it takes about 300ms for a single query.
-        This is acceptable during init, but unacceptable when the server returns lots of attributes at the same time.
-    '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Attributes') in str(subclass)):
-                    for attributeName, attribute in inspect.getmembers(subclass):
-                        if inspect.isclass(attribute):
-                            base_classes = inspect.getmro(attribute)
-
-                            # Only match on classes that extend the ClusterAttributeDescriptor class
-                            matched = [
-                                value for value in base_classes if 'ClusterAttributeDescriptor' in str(value)]
-                            if (matched == []):
-                                continue
-
-                            _AttributeIndex[(attribute.cluster_id, attribute.attribute_id)] = (eval(
-                                'chip.clusters.Objects.' + clusterName + '.Attributes.' + attributeName), obj)
-
-
-def _BuildClusterIndex():
-    ''' Build internal cluster index for locating the corresponding cluster object by path in the future.
-    '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj) and issubclass(obj, Cluster):
-            _ClusterIndex[obj.id] = obj
+@dataclass
+class SubscriptionReport:
+    ''' The changes of a subscription report, see SubscriptionTransaction.Reports(). '''
+    # The attribute paths whose value changed.
+    Paths: List[AttributePath] = field(default_factory=list)
+    Events: List[EventReadResult] = field(default_factory=list)
+    # Data version of each reported cluster, by (endpoint id, cluster id).
+    DataVersions: Dict[Tuple[int, int], int] = field(default_factory=dict)
+    # Value of each path of Paths in this report, as SubscriptionTransaction.GetAttribute returns it (the attribute
+    # value or a ValueDecodeFailure). Unlike the SubscriptionTransaction, it is not changed by the later reports.
+    Values: Dict[AttributePath, Any] = field(default_factory=dict)
+
+    def Merge(self, other: SubscriptionReport) -> SubscriptionReport:
+        ''' Returns the changes of this report followed by the ones of other, with each path once. '''
+        return SubscriptionReport(Paths=list(dict.fromkeys(self.Paths + other.Paths)), Events=self.Events + other.Events,
+                                  DataVersions={**self.DataVersions, **other.DataVersions},
+                                  Values={**self.Values, **other.Values})
+
+
+# Event classes by (cluster id, event id), filled from ALL_EVENTS on first use of each event so that
+# decoding an event costs a single dictionary lookup.
+_EventIndex: Dict[Tuple[int, int], ClusterEvent] = {}
+
+
+def _GetEventType(clusterId: int, eventId: int) -> Optional[ClusterEvent]:
+    eventType = _EventIndex.get((clusterId, eventId))
+    if eventType is None:
+        eventType = ALL_EVENTS.get(clusterId, {}).get(eventId)
+        if eventType is not None:
+            _EventIndex[(clusterId, eventId)] = eventType
+    return eventType
 
 
 @dataclass
@@ -323,34 +378,36 @@ class AttributeCache:
         default_factory=lambda: set())
     _attributeCache: Dict[int, List[Cluster]] = field(
         default_factory=lambda: {})
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def UpdateTLV(self, path: AttributePath, dataVersion: int,  data: Union[bytes, ValueDecodeFailure]):
         ''' Store data in TLV since that makes it easiest to eventually convert to either the
             cluster or attribute view representations (see below in GetUpdatedAttributeCache()).
         '''
-        if (path.EndpointId not in self.attributeTLVCache):
-            self.attributeTLVCache[path.EndpointId] = {}
+        with self._lock:
+            if (path.EndpointId not in self.attributeTLVCache):
+                self.attributeTLVCache[path.EndpointId] = {}
 
-        if (path.EndpointId not in self.versionList):
-            self.versionList[path.EndpointId] = {}
+            if (path.EndpointId not in self.versionList):
+                self.versionList[path.EndpointId] = {}
 
-        endpointCache = self.attributeTLVCache[path.EndpointId]
-        endpointVersion = self.versionList[path.EndpointId]
-        if (path.ClusterId not in endpointCache):
-            endpointCache[path.ClusterId] = {}
+            endpointCache = self.attributeTLVCache[path.EndpointId]
+            endpointVersion = self.versionList[path.EndpointId]
+            if (path.ClusterId not in endpointCache):
+                endpointCache[path.ClusterId] = {}
 
-        # All attributes from the same cluster instance should have the same dataVersion,
-        # so we can set the dataVersion of the cluster to the dataVersion with a random attribute.
-        endpointVersion[path.ClusterId] = dataVersion
+            # All attributes from the same cluster instance should have the same dataVersion,
+            # so we can set the dataVersion of the cluster to the dataVersion with a random attribute.
+            endpointVersion[path.ClusterId] = dataVersion
 
-        clusterCache = endpointCache[path.ClusterId]
-        if (path.AttributeId not in clusterCache):
-            clusterCache[path.AttributeId] = None
+            clusterCache = endpointCache[path.ClusterId]
+            if (path.AttributeId not in clusterCache):
+                clusterCache[path.AttributeId] = None
 
-        clusterCache[path.AttributeId] = data
+            clusterCache[path.AttributeId] = data
 
-        # For this path the attribute cache still requires an update.
-        self._attributeCacheUpdateNeeded.add(path)
+            # For this path the attribute cache still requires an update.
+            self._attributeCacheUpdateNeeded.add(path)
 
     def GetUpdatedAttributeCache(self) -> Dict[int, List[Cluster]]:
         ''' This converts the raw TLV data into a cluster object format.
@@ -373,8 +430,7 @@ class AttributeCache:
 
         def handle_cluster_view(endpointId, clusterId, clusterType):
             try:
-                decodedData = clusterType.FromDict(
-                    data=clusterType.descriptor.TagDictToLabelDict([], self.attributeTLVCache[endpointId][clusterId]))
+                decodedData = clusterType.FromTagDict(self.attributeTLVCache[endpointId][clusterId])
                 decodedData.SetDataVersion(
                     self.versionList.get(endpointId, {}).get(clusterId))
                 return decodedData
@@ -390,44 +446,351 @@ class AttributeCache:
             except Exception as ex:
                 return ValueDecodeFailure(value, ex)
 
-        for attributePath in self._attributeCacheUpdateNeeded:
-            endpointId, clusterId, attributeId = attributePath.EndpointId, attributePath.ClusterId, attributePath.AttributeId
+        # UpdateTLV runs on the Matter thread while a subscription is read from the event loop.
+        with self._lock:
+            # Group the pending updates per cluster instance, so that a report touching several attributes of a
+            # cluster rebuilds its cluster view once.
+            pendingClusters: Dict[Tuple[int, int], List[int]] = {}
+            for attributePath in self._attributeCacheUpdateNeeded:
+                clusterKey = (attributePath.EndpointId, attributePath.ClusterId)
+                pendingClusters.setdefault(clusterKey, []).append(attributePath.AttributeId)
+
+            for (endpointId, clusterId), attributeIds in pendingClusters.items():
+                if endpointId not in self._attributeCache:
+                    self._attributeCache[endpointId] = {}
+                endpointCache = self._attributeCache[endpointId]
+
+                clusterType = ALL_CLUSTERS.get(clusterId)
+                if clusterType is None:
+                    #
+                    # #22599 tracks dealing with unknown clusters more
+                    # gracefully so that clients can still access this data.
+                    #
+                    continue
+
+                if self.returnClusterObject:
+                    endpointCache[clusterType] = handle_cluster_view(
+                        endpointId, clusterId, clusterType)
+                else:
+                    if clusterType not in endpointCache:
+                        endpointCache[clusterType] = {}
+                    clusterCache = endpointCache[clusterType]
+                    clusterCache[DataVersion] = self.versionList.get(
+                        endpointId, {}).get(clusterId)
+
+                    clusterAttributes = ALL_ATTRIBUTES.get(clusterId, {})
+                    for attributeId in attributeIds:
+                        attributeType = clusterAttributes.get(attributeId)
+                        if attributeType is None:
+                            #
+                            # #22599 tracks dealing with unknown clusters more
+                            # gracefully so that clients can still access this data.
+                            #
+                            continue
+
+                        clusterCache[attributeType] = handle_attribute_view(
+                            endpointId, clusterId, attributeId, attributeType)
+            self._attributeCacheUpdateNeeded.clear()
+        return self._attributeCache
+
 
-            if endpointId not in self._attributeCache:
-                self._attributeCache[endpointId] = {}
-            endpointCache = self._attributeCache[endpointId]
+def _PackClusterKey(endpointId: int, clusterId: int) -> int:
+    return (endpointId << 32) | clusterId
+
+
+def _PackAttributeKey(endpointId: int, clusterId: int, attributeId: int) -> int:
+    return (endpointId << 64) | (clusterId << 32) | attributeId
+
+
+class CompactAttributeCache:
+    ''' An alternative to AttributeCache for long-lived caches, storing each attribute once in a flat dictionary
+        keyed by its packed (endpoint, cluster, attribute) integer, instead of nested dictionaries and
+        decoded cluster objects.
+
+        With storeRawTLV, UpdateTLV is given the TLV of the attribute as received and stores the bytes as is.
+        Otherwise it is given the value decoded by TLVReader, as for AttributeCache. With lazyTLV as well,
+        attributeTLVCache returns chip.tlv.LazyTLVView objects over the stored TLV instead of decoded values.
+
+        GetUpdatedAttributeCache returns read-only mappings with the same layout as AttributeCache, whose
+        attribute values or cluster objects are decoded each time they are accessed and not kept.
+    '''
+
+    def __init__(self, returnClusterObject: bool = False, storeRawTLV: bool = False, lazyTLV: bool = False):
+        self.returnClusterObject = returnClusterObject
+        self.storeRawTLV = storeRawTLV
+        self.lazyTLV = lazyTLV
+        # Value of each attribute, keyed by _PackAttributeKey.
+        self._values: Dict[int, Any] = {}
+        # Data version of each cluster instance, keyed by _PackClusterKey.
+        self._versions: Dict[int, int] = {}
+        self._endpointIds: Set[int] = set()
+        # The keys of _values in order, built when needed and dropped when an attribute is added.
+        self._sortedKeys: Optional[List[int]] = None
+        # UpdateTLV runs on the Matter thread while the views of a subscription are read from the event loop.
+        self._lock = threading.Lock()
+
+    def UpdateTLV(self, path: AttributePath, dataVersion: int, data: Union[bytes, Any, ValueDecodeFailure]):
+        key = _PackAttributeKey(path.EndpointId, path.ClusterId, path.AttributeId)
+        with self._lock:
+            self._endpointIds.add(path.EndpointId)
+            self._versions[_PackClusterKey(path.EndpointId, path.ClusterId)] = dataVersion
+            if key not in self._values:
+                self._sortedKeys = None
+            self._values[key] = data
+
+    def GetUpdatedAttributeCache(self) -> Mapping[int, Mapping[type, Any]]:
+        ''' Returns the attribute-view or the cluster-view of the cache (see AttributeCache.GetUpdatedAttributeCache),
+            decoding the values on access.
+        '''
+        return _CompactAttributeView(self)
 
-            if clusterId not in _ClusterIndex:
+    @property
+    def attributeTLVCache(self) -> Mapping[int, Mapping[int, Mapping[int, Any]]]:
+        ''' The values decoded by TLVReader, as attributeTLVCache[endpoint][cluster][attribute] of AttributeCache,
+            decoded on access.
+        '''
+        return _CompactTLVView(self)
+
+    @property
+    def versionList(self) -> Dict[int, Dict[int, int]]:
+        versionList: Dict[int, Dict[int, int]] = {}
+        with self._lock:
+            versions = list(self._versions.items())
+        for key, version in versions:
+            versionList.setdefault(key >> 32, {})[key & 0xFFFFFFFF] = version
+        return versionList
+
+    def _GetTLVValue(self, key: int, lazy: bool = False) -> Any:
+        value = self._values[key]
+        if self.storeRawTLV and not isinstance(value, ValueDecodeFailure):
+            return chip.tlv.TLVReader(value).get(lazy=lazy).get("Any", {})
+        return value
+
+    def _ClusterIds(self, endpointId: int) -> List[int]:
+        with self._lock:
+            keys = list(self._versions)
+        return sorted(key & 0xFFFFFFFF for key in keys if key >> 32 == endpointId)
+
+    def _AttributeIds(self, endpointId: int, clusterId: int) -> List[int]:
+        with self._lock:
+            if self._sortedKeys is None:
+                self._sortedKeys = sorted(self._values)
+            sortedKeys = self._sortedKeys
+        base = _PackAttributeKey(endpointId, clusterId, 0)
+        start = bisect.bisect_left(sortedKeys, base)
+        end = bisect.bisect_left(sortedKeys, base + (1 << 32), start)
+        return [key & 0xFFFFFFFF for key in sortedKeys[start:end]]
+
+    def _ClusterTypes(self, endpointId: int) -> List[Cluster]:
+        clusterTypes = []
+        with self._lock:
+            keys = list(self._versions)
+        for key in keys:
+            if key >> 32 == endpointId:
+                clusterType = ALL_CLUSTERS.get(key & 0xFFFFFFFF)
                 #
                 # #22599 tracks dealing with unknown clusters more
                 # gracefully so that clients can still access this data.
                 #
-                continue
+                if clusterType is not None:
+                    clusterTypes.append(clusterType)
+        return clusterTypes
+
+    def _AttributeTypes(self, endpointId: int, clusterId: int) -> List[ClusterAttributeDescriptor]:
+        base = _PackAttributeKey(endpointId, clusterId, 0)
+        return [attributeType for attributeId, attributeType in ALL_ATTRIBUTES.get(clusterId, {}).items()
+                if base | attributeId in self._values]
+
+    def _HasAttribute(self, endpointId: int, clusterId: int, attributeType) -> bool:
+        attributeId = getattr(attributeType, 'attribute_id', None)
+        return (ALL_ATTRIBUTES.get(clusterId, {}).get(attributeId) is attributeType
+                and _PackAttributeKey(endpointId, clusterId, attributeId) in self._values)
+
+    def _DecodeCluster(self, endpointId: int, clusterType: Cluster) -> Union[Cluster, ValueDecodeFailure]:
+        base = _PackAttributeKey(endpointId, clusterType.id, 0)
+        tagDict = {tag: self._GetTLVValue(base | tag) for tag in clusterType.descriptor.FieldsByTag
+                   if base | tag in self._values}
+        try:
+            decodedData = clusterType.FromTagDict(tagDict)
+            decodedData.SetDataVersion(self._versions.get(_PackClusterKey(endpointId, clusterType.id)))
+            return decodedData
+        except Exception as ex:
+            return ValueDecodeFailure(tagDict, ex)
 
-            clusterType = _ClusterIndex[clusterId]
+    def _DecodeAttribute(self, endpointId: int, attributeType: ClusterAttributeDescriptor) -> Any:
+        value = self._GetTLVValue(_PackAttributeKey(endpointId, attributeType.cluster_id, attributeType.attribute_id))
+        if isinstance(value, ValueDecodeFailure):
+            return value
+        try:
+            return attributeType.FromTagDictOrRawValue(value)
+        except Exception as ex:
+            return ValueDecodeFailure(value, ex)
 
-            if self.returnClusterObject:
-                endpointCache[clusterType] = handle_cluster_view(
-                    endpointId, clusterId, clusterType)
-            else:
-                if clusterType not in endpointCache:
-                    endpointCache[clusterType] = {}
-                clusterCache = endpointCache[clusterType]
-                clusterCache[DataVersion] = self.versionList.get(
-                    endpointId, {}).get(clusterId)
 
-                if (clusterId, attributeId) not in _AttributeIndex:
-                    #
-                    # #22599 tracks dealing with unknown clusters more
-                    # gracefully so that clients can still access this data.
-                    #
-                    continue
+class _CompactAttributeView(collections.abc.Mapping):
+    ''' Endpoint id -> _CompactEndpointView of a CompactAttributeCache. '''
 
-                attributeType = _AttributeIndex[(clusterId, attributeId)][0]
-                clusterCache[attributeType] = handle_attribute_view(
-                    endpointId, clusterId, attributeId, attributeType)
-        self._attributeCacheUpdateNeeded.clear()
-        return self._attributeCache
+    def __init__(self, cache: CompactAttributeCache):
+        self._cache = cache
+
+    def __getitem__(self, endpointId: int) -> _CompactEndpointView:
+        if endpointId not in self._cache._endpointIds:
+            raise KeyError(endpointId)
+        return _CompactEndpointView(self._cache, endpointId)
+
+    def __iter__(self):
+        return iter(sorted(self._cache._endpointIds))
+
+    def __len__(self) -> int:
+        return len(self._cache._endpointIds)
+
+
+class _CompactEndpointView(collections.abc.Mapping):
+    ''' Cluster type -> cluster object, or _CompactClusterView in the attribute-view, of an endpoint. '''
+
+    def __init__(self, cache: CompactAttributeCache, endpointId: int):
+        self._cache = cache
+        self._endpointId = endpointId
+
+    def __getitem__(self, clusterType: Cluster):
+        clusterId = getattr(clusterType, 'id', None)
+        if (ALL_CLUSTERS.get(clusterId) is not clusterType
+                or _PackClusterKey(self._endpointId, clusterId) not in self._cache._versions):
+            raise KeyError(clusterType)
+        if self._cache.returnClusterObject:
+            return self._cache._DecodeCluster(self._endpointId, clusterType)
+        return _CompactClusterView(self._cache, self._endpointId, clusterType.id)
+
+    def __iter__(self):
+        return iter(self._cache._ClusterTypes(self._endpointId))
+
+    def __len__(self) -> int:
+        return len(self._cache._ClusterTypes(self._endpointId))
+
+
+class _CompactClusterView(collections.abc.Mapping):
+    ''' DataVersion and attribute type -> attribute value of a cluster instance, in the attribute-view. '''
+
+    def __init__(self, cache: CompactAttributeCache, endpointId: int, clusterId: int):
+        self._cache = cache
+        self._endpointId = endpointId
+        self._clusterId = clusterId
+
+    def __getitem__(self, key):
+        if key is DataVersion:
+            return self._cache._versions.get(_PackClusterKey(self._endpointId, self._clusterId))
+        if not self._cache._HasAttribute(self._endpointId, self._clusterId, key):
+            raise KeyError(key)
+        return self._cache._DecodeAttribute(self._endpointId, key)
+
+    def __iter__(self):
+        yield DataVersion
+        yield from self._cache._AttributeTypes(self._endpointId, self._clusterId)
+
+    def __len__(self) -> int:
+        return 1 + len(self._cache._AttributeTypes(self._endpointId, self._clusterId))
+
+
+class _CompactTLVView(collections.abc.Mapping):
+    ''' Endpoint id -> cluster id -> attribute id -> TLV value of a CompactAttributeCache, at the given depth. '''
+
+    def __init__(self, cache: CompactAttributeCache, endpointId: Optional[int] = None, clusterId: Optional[int] = None):
+        self._cache = cache
+        self._endpointId = endpointId
+        self._clusterId = clusterId
+
+    def __getitem__(self, key: int):
+        if self._endpointId is None:
+            if key not in self._cache._endpointIds:
+                raise KeyError(key)
+            return _CompactTLVView(self._cache, key)
+        if self._clusterId is None:
+            if _PackClusterKey(self._endpointId, key) not in self._cache._versions:
+                raise KeyError(key)
+            return _CompactTLVView(self._cache, self._endpointId, key)
+        attributeKey = _PackAttributeKey(self._endpointId, self._clusterId, key)
+        if attributeKey not in self._cache._values:
+            raise KeyError(key)
+        return self._cache._GetTLVValue(attributeKey, lazy=self._cache.lazyTLV)
+
+    def _keys(self) -> List[int]:
+        if self._endpointId is None:
+            return sorted(self._cache._endpointIds)
+        if self._clusterId is None:
+            return self._cache._ClusterIds(self._endpointId)
+        return self._cache._AttributeIds(self._endpointId, self._clusterId)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+
+class _ReportQueue:
+    ''' The bounded queue of reports behind an iterator returned by SubscriptionTransaction.Reports().
+
+        Reports are put on the Matter thread and taken on the event loop of the consumer.
+    '''
+
+    def __init__(self, eventLoop, maxsize: int, overflowPolicy: ReportOverflowPolicy):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._eventLoop = eventLoop
+        self._maxsize = maxsize
+        self._overflowPolicy = overflowPolicy
+        self._condition = threading.Condition()
+        self._reports: Deque[SubscriptionReport] = collections.deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._onClose: Optional[Callable[[_ReportQueue], None]] = None
+        self.droppedReports = 0
+
+    def Put(self, report: SubscriptionReport):
+        with self._condition:
+            if self._overflowPolicy == ReportOverflowPolicy.BLOCK:
+                while len(self._reports) >= self._maxsize and not self._closed:
+                    self._condition.wait()
+            if self._closed:
+                return
+            if len(self._reports) < self._maxsize:
+                self._reports.append(report)
+            elif self._overflowPolicy == ReportOverflowPolicy.COALESCE:
+                self._reports[-1] = self._reports[-1].Merge(report)
+            else:
+                self._reports.popleft()
+                self._reports.append(report)
+                self.droppedReports += 1
+        self._eventLoop.call_soon_threadsafe(self._ready.set)
+
+    def Close(self):
+        ''' Ends the iteration once the queued reports are taken. '''
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._eventLoop.call_soon_threadsafe(self._ready.set)
+        if self._onClose is not None:
+            self._onClose(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> SubscriptionReport:
+        while True:
+            with self._condition:
+                if self._reports:
+                    report = self._reports.popleft()
+                    self._condition.notify_all()
+                    return report
+                if self._closed:
+                    raise StopAsyncIteration
+                self._ready.clear()
+            await self._ready.wait()
+
+    async def aclose(self):
+        self.Close()
 
 
 class SubscriptionTransaction:
@@ -448,17 +811,22 @@ class SubscriptionTransaction:
             SubscriptionTransaction], None]] = None
         self._onResubscriptionSucceededCb_isAsync = False
         self._onResubscriptionAttemptedCb_isAsync = False
+        self._onAttributeBatchChangeCb: Optional[Callable[[List[TypedAttributePath], SubscriptionTransaction], None]] = None
+        self._onAttributeBatchChangeCb_isAsync = False
+        # Replaced rather than modified, since the Matter thread iterates over it.
+        self._reportQueues: Tuple[_ReportQueue, ...] = ()
+        self._reportsEnded = False
         builtins.chipStack.RegisterSubscription(self)
 
     def GetAttributes(self):
         ''' Returns the attribute value cache tracking the latest state on the publisher.
         '''
-        return self._readTransaction._cache.GetUpdatedAttributeCache()
+        return self._readTransaction._GetUpdatedAttributeCache()
 
     def GetAttribute(self, path: TypedAttributePath) -> Any:
         ''' Returns a specific attribute given a TypedAttributePath.
         '''
-        data = self._readTransaction._cache.GetUpdatedAttributeCache()
+        data = self._readTransaction._GetUpdatedAttributeCache()
 
         if (self._readTransaction._cache.returnClusterObject):
             return eval(f'data[path.Path.EndpointId][path.ClusterType].{path.AttributeName}')
@@ -468,6 +836,47 @@ class SubscriptionTransaction:
     def GetEvents(self):
         return self._readTransaction.GetAllEventValues()
 
+    def Reports(self, maxsize: int = 16,
+                overflowPolicy: ReportOverflowPolicy = ReportOverflowPolicy.DROP_OLDEST) -> AsyncIterator[SubscriptionReport]:
+        '''
+        Returns an asynchronous iterator over the reports received from now on, as SubscriptionReport objects:
+
+            async for report in subscription.Reports():
+                for path in report.Paths:
+                    value = report.Values[path]
+                    ...
+
+        Up to maxsize reports are queued while the consumer is busy, overflowPolicy tells what happens to the
+        following ones. With ReportOverflowPolicy.BLOCK the Matter thread waits for the consumer, which must then
+        not wait on an interaction with the stack (e.g. a Read) between two reports. The reports dropped with
+        ReportOverflowPolicy.DROP_OLDEST are counted in the droppedReports attribute of the iterator.
+
+        The iteration ends when the subscription is shut down or ends on an error, or when the aclose() method of
+        the iterator is called. Must be called from the event loop the reports are consumed on.
+        '''
+        queue = _ReportQueue(asyncio.get_running_loop(), maxsize, overflowPolicy)
+        self._AddReportQueue(queue)
+        if self._reportsEnded:
+            queue.Close()
+        return queue
+
+    def _AddReportQueue(self, queue: _ReportQueue):
+        queue._onClose = self._RemoveReportQueue
+        self._reportQueues = self._reportQueues + (queue,)
+
+    def _RemoveReportQueue(self, queue: _ReportQueue):
+        self._reportQueues = tuple(q for q in self._reportQueues if q is not queue)
+
+    def _PutReport(self, report: SubscriptionReport):
+        for queue in self._reportQueues:
+            queue.Put(report)
+
+    def _EndReports(self):
+        ''' Ends the iteration over the reports, once no more will be received. '''
+        self._reportsEnded = True
+        for queue in self._reportQueues:
+            queue.Close()
+
     def OverrideLivenessTimeoutMs(self, timeoutMs: int):
         handle = chip.native.GetLibraryHandle()
         builtins.chipStack.Call(
@@ -550,6 +959,30 @@ class SubscriptionTransaction:
         if callback is not None:
             self._onAttributeChangeCb = callback
 
+    def SetAttributeBatchUpdateCallback(self, callback: Callable[[List[TypedAttributePath], SubscriptionTransaction], None],
+                                        isAsync=False):
+        '''
+        Sets a callback function receiving the attribute changes of a whole report in a single call, on the event loop
+        of the subscription, instead of the attribute value change callback once per changed path on the Matter thread.
+        The callback is expected to have the following signature:
+            def Callback(paths: List[TypedAttributePath], transaction: SubscriptionTransaction)
+
+        If the callback is an awaitable co-routine, isAsync should be set to True.
+        '''
+        if callback is not None:
+            self._onAttributeBatchChangeCb = callback
+            self._onAttributeBatchChangeCb_isAsync = isAsync
+
+    def _handleAttributeBatchChange(self, paths: List[TypedAttributePath]):
+        if self._onAttributeBatchChangeCb_isAsync:
+            self._readTransaction._event_loop.create_task(self._onAttributeBatchChangeCb(paths, self))
+        elif self._readTransaction._metrics is None:
+            self._onAttributeBatchChangeCb(paths, self)
+        else:
+            start = time.perf_counter()
+            self._onAttributeBatchChangeCb(paths, self)
+            self._readTransaction._ObservePhase(ReadPhase.CALLBACK, start)
+
     def SetEventUpdateCallback(self, callback: Callable[[EventReadResult, SubscriptionTransaction], None]):
         if callback is not None:
             self._onEventChangeCb = callback
@@ -590,6 +1023,7 @@ class SubscriptionTransaction:
             lambda: handle.pychip_ReadClient_ShutdownSubscription(
                 self._readTransaction._pReadClient))
         self._isDone = True
+        self._EndReports()
 
     def __repr__(self):
         return f'<Subscription (Id={self._subscriptionId})>'
@@ -622,29 +1056,6 @@ def DefaultErrorCallback(chipError: int, transaction: SubscriptionTransaction):
     print(f"Error during Subscription: Chip Stack Error {chipError}")
 
 
-def _BuildEventIndex():
-    ''' Build internal event index for locating the corresponding cluster object by path in the future.
-    We do this because this operation will take a long time when there are lots of events, it takes about 300ms for a single query.
-    This is acceptable during init, but unacceptable when the server returns lots of events at the same time.
-    '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Events' == objName)):
-                    for eventName, event in inspect.getmembers(subclass):
-                        if inspect.isclass(event):
-                            base_classes = inspect.getmro(event)
-
-                            # Only match on classes that extend the ClusterEvent class
-                            matched = [
-                                value for value in base_classes if 'ClusterEvent' in str(value)]
-                            if (matched == []):
-                                continue
-
-                            _EventIndex[str(EventPath(ClusterId=event.cluster_id, EventId=event.event_id))] = eval(
-                                'chip.clusters.Objects.' + clusterName + '.Events.' + eventName)
-
-
 class AsyncReadTransaction:
     @dataclass
     class ReadResponse:
@@ -652,28 +1063,115 @@ class AsyncReadTransaction:
         events: list[ClusterEvent]
         tlvAttributes: dict[int, Any]
 
-    def __init__(self, future: Future, eventLoop, devCtrl, returnClusterObject: bool):
+        def Subset(self, attributePaths: List[AttributePath]) -> AsyncReadTransaction.ReadResponse:
+            ''' Returns the attribute data of the response read by attributePaths, without the events.
+
+                The cluster objects (returnClusterObject) and attribute values are those of this response.
+            '''
+            attributes: Dict[int, Dict[Any, Any]] = {}
+            for endpointId, clusters in self.attributes.items():
+                for clusterType, value in clusters.items():
+                    paths = [path for path in attributePaths if _PathMatches(path, endpointId, clusterType.id)]
+                    if not paths:
+                        continue
+                    if isinstance(value, collections.abc.Mapping):
+                        value = {key: attributeValue for key, attributeValue in value.items()
+                                 if key is DataVersion or any(_PathMatches(path, endpointId, clusterType.id, key.attribute_id)
+                                                              for path in paths)}
+                    attributes.setdefault(endpointId, {})[clusterType] = value
+
+            tlvAttributes: Dict[int, Dict[int, Dict[int, Any]]] = {}
+            for endpointId, clusters in self.tlvAttributes.items():
+                for clusterId, values in clusters.items():
+                    values = {attributeId: value for attributeId, value in values.items()
+                              if any(_PathMatches(path, endpointId, clusterId, attributeId) for path in attributePaths)}
+                    if values:
+                        tlvAttributes.setdefault(endpointId, {})[clusterId] = values
+
+            return AsyncReadTransaction.ReadResponse(attributes=attributes, events=[], tlvAttributes=tlvAttributes)
+
+    def __init__(self, future: Future, eventLoop, devCtrl, returnClusterObject: bool, lazyDecode: bool = False,
+                 compactAttributeCache: bool = False, maxEvents: Optional[int] = None):
         self._event_loop = eventLoop
         self._future = future
         self._subscription_handler = None
-        self._events: List[EventReadResult] = []
+        # Only the last maxEvents events are kept, if given.
+        self._events: Union[List[EventReadResult], Deque[EventReadResult]] = \
+            collections.deque(maxlen=maxEvents) if maxEvents is not None else []
         self._devCtrl = devCtrl
-        self._cache = AttributeCache(returnClusterObject=returnClusterObject)
+        self._cache: Union[AttributeCache, CompactAttributeCache]
+        if compactAttributeCache or lazyDecode:
+            # The received TLV is kept as is and decoded on access.
+            self._cache = CompactAttributeCache(returnClusterObject=returnClusterObject, storeRawTLV=True,
+                                                lazyTLV=lazyDecode)
+        else:
+            self._cache = AttributeCache(returnClusterObject=returnClusterObject)
         self._changedPathSet: Set[AttributePath] = set()
         self._pReadClient = None
         self._resultError: Optional[PyChipError] = None
+        self._persistentCache: Optional[NodeAttributeCache] = None
+        self._persistentCachePaths: List[AttributePath] = []
+        # (data version, TLV) of the attributes received in the current report, saved to _persistentCache at its end.
+        self._persistentCacheReport: Dict[AttributePath, Tuple[int, Optional[bytes]]] = {}
+        self._persistentCachePriming = True
+        self._eventStore: Optional[NodeEventStore] = None
+        self._eventStorePaths: List[EventPath] = []
+        # The events received in the current report, added to _eventStore at its end.
+        self._eventStoreReport: List[EventReadResult] = []
+        self._metrics: Optional[ReadMetricsHook] = None
+        self._metricsNodeId = 0
+        # The events and data versions of the current report, for SubscriptionTransaction.Reports().
+        self._reportEvents: List[EventReadResult] = []
+        self._reportDataVersions: Dict[Tuple[int, int], int] = {}
+        self._reportValues: Dict[AttributePath, Any] = {}
 
     def SetClientObjPointers(self, pReadClient):
         self._pReadClient = pReadClient
 
-    def GetAllEventValues(self):
-        return self._events
+    def GetAllEventValues(self) -> List[EventReadResult]:
+        return list(self._events)
+
+    def UsePersistentCache(self, nodeCache: NodeAttributeCache, attributePaths: List[AttributePath],
+                           dataVersionFilters: List[DataVersionFilter]):
+        ''' Fills the cache with the attributes of nodeCache read by attributePaths in the clusters of dataVersionFilters,
+            which the publisher does not report unless they changed, and merges the received attributes into nodeCache
+            at the end of every report.
+        '''
+        self._persistentCache = nodeCache
+        self._persistentCachePaths = attributePaths
+        for path, dataVersion, data in nodeCache.CachedAttributes(attributePaths, dataVersionFilters):
+            self._cache.UpdateTLV(path, dataVersion, self._DecodeAttributeData(data))
+            self._changedPathSet.add(path)
+
+    def UseEventStore(self, nodeStore: NodeEventStore, eventPaths: List[EventPath]):
+        ''' Adds the events received by the read or subscription of eventPaths to nodeStore, at the end of every report.
+        '''
+        self._eventStore = nodeStore
+        self._eventStorePaths = eventPaths
+
+    def UseMetrics(self, metrics: ReadMetricsHook, nodeId: int):
+        ''' Reports the time spent decoding the data, building the attribute values and running the callbacks of the
+            read or subscription of the node to metrics.
+        '''
+        self._metrics = metrics
+        self._metricsNodeId = nodeId
+
+    def _ObservePhase(self, phase: ReadPhase, start: float):
+        self._metrics.OnPhase(self._metricsNodeId, phase, time.perf_counter() - start)
+
+    def _GetUpdatedAttributeCache(self):
+        if self._metrics is None:
+            return self._cache.GetUpdatedAttributeCache()
+        start = time.perf_counter()
+        attributes = self._cache.GetUpdatedAttributeCache()
+        self._ObservePhase(ReadPhase.CACHE, start)
+        return attributes
 
     def GetReadResponse(self) -> AsyncReadTransaction.ReadResponse:
         """Prepares and returns the ReadResponse object."""
         return self.ReadResponse(
-            attributes=self._cache.GetUpdatedAttributeCache(),
-            events=self._events,
+            attributes=self._GetUpdatedAttributeCache(),
+            events=self.GetAllEventValues(),
             tlvAttributes=self._cache.attributeTLVCache
         )
 
@@ -688,20 +1186,56 @@ class AsyncReadTransaction:
             if (imStatus != chip.interaction_model.Status.Success):
                 attributeValue = ValueDecodeFailure(
                     None, chip.interaction_model.InteractionModelError(imStatus))
+            elif self._metrics is None:
+                attributeValue = self._DecodeAttributeData(data)
             else:
-                tlvData = chip.tlv.TLVReader(data).get().get("Any", {})
-                attributeValue = tlvData
+                start = time.perf_counter()
+                attributeValue = self._DecodeAttributeData(data)
+                self._ObservePhase(ReadPhase.DECODE, start)
+                self._metrics.OnDecoded(self._metricsNodeId, 'attribute', 1, len(data))
 
             self._cache.UpdateTLV(path, dataVersion, attributeValue)
             self._changedPathSet.add(path)
 
+            if self._subscription_handler is not None and self._subscription_handler._reportQueues:
+                self._reportDataVersions[(path.EndpointId, path.ClusterId)] = dataVersion
+                self._reportValues[path] = attributeValue
+
+            if self._persistentCache is not None:
+                self._persistentCacheReport[path] = (
+                    dataVersion, data if imStatus == chip.interaction_model.Status.Success else None)
+
         except Exception as ex:
             LOGGER.exception(ex)
 
+    def _DecodeReportValues(self) -> Dict[AttributePath, Any]:
+        # Decoded on the Matter thread, before the next report can change the cache.
+        rawTLV = isinstance(self._cache, CompactAttributeCache) and self._cache.storeRawTLV
+        values: Dict[AttributePath, Any] = {}
+        for path, value in self._reportValues.items():
+            if isinstance(value, ValueDecodeFailure):
+                values[path] = value
+                continue
+            try:
+                if rawTLV:
+                    value = chip.tlv.TLVReader(value).get().get("Any", {})
+                attributeType = ALL_ATTRIBUTES.get(path.ClusterId, {}).get(path.AttributeId)
+                values[path] = value if attributeType is None else attributeType.FromTagDictOrRawValue(value)
+            except Exception as ex:
+                values[path] = ValueDecodeFailure(value, ex)
+        return values
+
+    def _DecodeAttributeData(self, data: bytes) -> Any:
+        if isinstance(self._cache, CompactAttributeCache) and self._cache.storeRawTLV:
+            # Decoded when accessed.
+            return data
+        return chip.tlv.TLVReader(data).get().get("Any", {})
+
     def handleEventData(self, header: EventHeader, path: EventPath, data: bytes, status: int):
         try:
-            eventType = _EventIndex.get(str(path), None)
+            eventType = _GetEventType(path.ClusterId, path.EventId)
             eventValue = None
+            start = time.perf_counter() if self._metrics is not None else 0.0
 
             if data:
                 # data will be an empty buffer when we received an EventStatusIB instead of an EventDataIB.
@@ -712,7 +1246,8 @@ class AsyncReadTransaction:
                         tlvData, LookupError("event schema not found"))
                 else:
                     try:
-                        eventValue = eventType.FromTLV(data)
+                        # The TLV is decoded once, the event is built from its tag dict.
+                        eventValue = eventType.FromTagDict(tlvData)
                     except Exception as ex:
                         LOGGER.error(
                             f"Error convering TLV to Cluster Object for path: Endpoint = {path.EndpointId}/"
@@ -727,13 +1262,24 @@ class AsyncReadTransaction:
                         if (builtins.enableDebugMode):
                             raise
 
+            if self._metrics is not None and data:
+                self._ObservePhase(ReadPhase.DECODE, start)
+                self._metrics.OnDecoded(self._metricsNodeId, 'event', 1, len(data))
+
             eventResult = EventReadResult(
                 Header=header, Data=eventValue, Status=chip.interaction_model.Status(status))
             self._events.append(eventResult)
+            if self._eventStore is not None and eventResult.Status == chip.interaction_model.Status.Success:
+                self._eventStoreReport.append(eventResult)
 
             if (self._subscription_handler is not None):
+                start = time.perf_counter() if self._metrics is not None else 0.0
                 self._subscription_handler.OnEventChangeCb(
                     eventResult, self._subscription_handler)
+                if self._metrics is not None:
+                    self._ObservePhase(ReadPhase.CALLBACK, start)
+                if self._subscription_handler._reportQueues:
+                    self._reportEvents.append(eventResult)
 
         except Exception as ex:
             LOGGER.exception(ex)
@@ -742,12 +1288,20 @@ class AsyncReadTransaction:
         if self._subscription_handler:
             self._subscription_handler.OnErrorCb(
                 chipError.code, self._subscription_handler)
+            # The errors which are retried are reported through handleResubscriptionAttempted instead.
+            self._subscription_handler._EndReports()
         self._resultError = chipError
 
     def _handleSubscriptionEstablished(self, subscriptionId):
-        if not self._future.done():
+        if self._subscription_handler is None:
             self._subscription_handler = SubscriptionTransaction(
                 self, subscriptionId, self._devCtrl)
+            if self._future.cancelled():
+                # The caller gave up (e.g. timed out) while the subscription was being established, nobody else
+                # would shut it down.
+                LOGGER.info("Shutting down subscription 0x%08x established after its read was cancelled", subscriptionId)
+                self._subscription_handler.Shutdown()
+                return
             self._future.set_result(self)
         else:
             self._subscription_handler._subscriptionId = subscriptionId
@@ -759,11 +1313,22 @@ class AsyncReadTransaction:
                     self._subscription_handler._onResubscriptionSucceededCb(
                         self._subscription_handler)
 
+    def Cancel(self):
+        ''' Gives up on the interaction, e.g. when its caller timed out. The subscription is shut down if it is
+            already established, and as soon as it is otherwise. Must be called from the event loop.
+        '''
+        if not self._future.done():
+            self._future.cancel()
+        if self._subscription_handler is not None and not self._subscription_handler._isDone:
+            self._subscription_handler.Shutdown()
+
     def handleSubscriptionEstablished(self, subscriptionId):
         self._event_loop.call_soon_threadsafe(
             self._handleSubscriptionEstablished, subscriptionId)
 
     def handleResubscriptionAttempted(self, terminationCause: PyChipError, nextResubscribeIntervalMsec: int):
+        # The first report of the new subscription primes it again.
+        self._persistentCachePriming = True
         if not self._subscription_handler:
             return
         if self._subscription_handler._onResubscriptionAttemptedCb_isAsync:
@@ -778,20 +1343,50 @@ class AsyncReadTransaction:
         pass
 
     def _handleReportEnd(self):
+        if self._subscription_handler is not None and self._subscription_handler._reportQueues:
+            self._subscription_handler._PutReport(SubscriptionReport(
+                Paths=list(self._changedPathSet), Events=self._reportEvents, DataVersions=self._reportDataVersions,
+                Values=self._DecodeReportValues()))
+        self._reportEvents = []
+        self._reportDataVersions = {}
+        self._reportValues = {}
+
         if self._subscription_handler is not None:
+            attribute_paths = []
             for change in self._changedPathSet:
                 try:
-                    attribute_path = TypedAttributePath(Path=change)
+                    attribute_paths.append(TypedAttributePath(Path=change))
                 except (KeyError, ValueError) as err:
                     # path could not be resolved into a TypedAttributePath
                     LOGGER.exception(err)
-                    continue
-                self._subscription_handler.OnAttributeChangeCb(
-                    attribute_path, self._subscription_handler)
+
+            if self._subscription_handler._onAttributeBatchChangeCb is not None:
+                # The whole report is handed over to the event loop at once.
+                if attribute_paths:
+                    self._event_loop.call_soon_threadsafe(
+                        self._subscription_handler._handleAttributeBatchChange, attribute_paths)
+            else:
+                start = time.perf_counter() if self._metrics is not None else 0.0
+                for attribute_path in attribute_paths:
+                    self._subscription_handler.OnAttributeChangeCb(
+                        attribute_path, self._subscription_handler)
+                if self._metrics is not None and attribute_paths:
+                    self._ObservePhase(ReadPhase.CALLBACK, start)
 
             # Clear it out once we've notified of all changes in this transaction.
         self._changedPathSet = set()
 
+        if self._persistentCache is not None and self._persistentCacheReport:
+            self._event_loop.call_soon_threadsafe(
+                self._persistentCache.Update, self._persistentCachePaths, self._persistentCacheReport,
+                self._persistentCachePriming)
+            self._persistentCacheReport = {}
+        self._persistentCachePriming = False
+
+        if self._eventStore is not None and self._eventStoreReport:
+            self._event_loop.call_soon_threadsafe(self._eventStore.Add, self._eventStorePaths, self._eventStoreReport)
+            self._eventStoreReport = []
+
     def _handleDone(self):
         #
         # We only set the exception/result on the future in this _handleDone call (if it hasn't
@@ -805,6 +1400,9 @@ class AsyncReadTransaction:
             else:
                 self._future.set_result(self)
 
+        if self._subscription_handler is not None:
+            self._subscription_handler._EndReports()
+
         #
         # Decrement the ref on ourselves to match the increment that happened at allocation.
         # This happens synchronously as part of handling done to ensure the object remains valid
@@ -823,6 +1421,96 @@ class AsyncReadTransaction:
         self._handleReportEnd()
 
 
+@dataclass
+class ReadCoalescingMetrics:
+    ''' Counters of a ReadCoalescer. '''
+    # The reads sent to the nodes.
+    reads: int = 0
+    # The reads answered by an identical read in flight.
+    identicalMerged: int = 0
+    # The reads answered by an in-flight read of a superset of their attribute paths.
+    subsetMerged: int = 0
+
+
+@dataclass
+class _InflightRead:
+    attributePaths: Optional[List[AttributePath]]
+    eventPaths: Optional[List[EventPath]]
+    dataVersionFilters: Optional[List[DataVersionFilter]]
+    options: Tuple
+    task: asyncio.Task
+    # The callers awaiting the read. It is cancelled when none is left.
+    waiters: int = 0
+
+
+class ReadCoalescer:
+    ''' Merges the reads of a node issued while an identical read, or a read of a superset of their attribute paths,
+        is in flight into that read, and fans its response out.
+
+        The response of an identical read is shared between the callers, the one of a subset read is built with
+        ReadResponse.Subset. The read runs in a task of its own: cancelling a caller, even the one which started it,
+        does not affect the others, and the read is only cancelled once all its callers are.
+    '''
+
+    def __init__(self):
+        self._inflight: Dict[int, List[_InflightRead]] = {}
+        self.metrics = ReadCoalescingMetrics()
+
+    async def Read(self, nodeid: int, attributePaths: Optional[List[AttributePath]], eventPaths: Optional[List[EventPath]],
+                   dataVersionFilters: Optional[List[DataVersionFilter]], options: Tuple,
+                   read: Callable[[], Any]) -> AsyncReadTransaction.ReadResponse:
+        ''' Returns the response of the read, running it with read() unless it can be merged into a read in flight.
+
+            options: The other parameters of the read, which must be equal for reads to be merged.
+        '''
+        inflightReads = self._inflight.setdefault(nodeid, [])
+        for inflight in inflightReads:
+            if inflight.options != options:
+                continue
+            if (inflight.attributePaths, inflight.eventPaths, inflight.dataVersionFilters) == \
+                    (attributePaths, eventPaths, dataVersionFilters):
+                self.metrics.identicalMerged += 1
+                return await self._Await(nodeid, inflight)
+            # The data version filters of either read may leave out data the other one needs.
+            if (attributePaths and not eventPaths and not dataVersionFilters and inflight.attributePaths
+                    and not inflight.dataVersionFilters
+                    and all(any(_PathCovers(path, other) for path in inflight.attributePaths) for other in attributePaths)):
+                self.metrics.subsetMerged += 1
+                return (await self._Await(nodeid, inflight)).Subset(attributePaths)
+
+        inflight = _InflightRead(attributePaths=attributePaths, eventPaths=eventPaths, dataVersionFilters=dataVersionFilters,
+                                 options=options, task=asyncio.ensure_future(read()))
+        inflightReads.append(inflight)
+        inflight.task.add_done_callback(lambda task: self._Done(nodeid, inflight))
+        self.metrics.reads += 1
+        return await self._Await(nodeid, inflight)
+
+    async def _Await(self, nodeid: int, inflight: _InflightRead) -> AsyncReadTransaction.ReadResponse:
+        inflight.waiters += 1
+        try:
+            return await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+            if not inflight.waiters and not inflight.task.done():
+                # All the callers were cancelled, later reads must not be merged into this one.
+                self._Remove(nodeid, inflight)
+                inflight.task.cancel()
+
+    def _Done(self, nodeid: int, inflight: _InflightRead):
+        self._Remove(nodeid, inflight)
+        if not inflight.task.cancelled():
+            # Retrieved by the callers, if any are left.
+            inflight.task.exception()
+
+    def _Remove(self, nodeid: int, inflight: _InflightRead):
+        inflightReads = self._inflight.get(nodeid)
+        if inflightReads is None or inflight not in inflightReads:
+            return
+        inflightReads.remove(inflight)
+        if not inflightReads:
+            del self._inflight[nodeid]
+
+
 class AsyncWriteTransaction:
     def __init__(self, future: Future, eventLoop):
         self._event_loop = eventLoop
@@ -1206,7 +1894,3 @@ def Init():
         _OnReadAttributeDataCallback, _OnReadEventDataCallback,
         _OnSubscriptionEstablishedCallback, _OnResubscriptionAttemptedCallback, _OnReadErrorCallback, _OnReadDoneCallback,
         _OnReportBeginCallback, _OnReportEndCallback)
-
-    _BuildAttributeIndex()
-    _BuildClusterIndex()
-    _BuildEventIndex()
@@ -0,0 +1,167 @@
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+# Needed to use types in type hints before they are fully defined.
+from __future__ import annotations
+
+import collections
+import copy
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .Attribute import AttributePath, CompactAttributeCache
+from .PersistentAttributeCache import NodeAttributeCache
+
+
+@dataclass
+class AttributeCacheStats:
+    # Lookups of a node whose attributes were cached.
+    hits: int = 0
+    # Lookups of a node with no cached attributes, never read or evicted.
+    misses: int = 0
+    # Nodes evicted to stay within the budget.
+    evictions: int = 0
+    # Current number of cached nodes, attributes and bytes of TLV.
+    nodes: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class _ManagedNodeCache(NodeAttributeCache):
+    ''' The in-memory cache of a node held by an AttributeCacheManager, which accounts for its updates. '''
+
+    def __init__(self, manager: AttributeCacheManager, nodeId: int):
+        super().__init__(None, 0, nodeId)
+        self._manager = manager
+        self.entries = 0
+        self.size = 0
+        # The decoded view of the attributes, built when needed and dropped when they change.
+        self.attributeCache: Optional[CompactAttributeCache] = None
+
+    def Update(self, attributePaths: List[AttributePath], report: Dict[AttributePath, Tuple[int, Optional[bytes]]],
+               priming: bool):
+        super().Update(attributePaths, report, priming)
+        self.attributeCache = None
+        self._manager._Updated(self)
+
+
+class AttributeCacheManager:
+    ''' An in-memory cache of the attributes read from many nodes, under a global budget of attributes and of bytes of
+        their TLV.
+
+        Once set on a controller (ChipDeviceControllerBase.SetAttributeCacheManager), reads and subscriptions of
+        attributes are cached per node like with a PersistentAttributeCache: they send a DataVersionFilter for every
+        cached cluster they read, so the publisher only reports the clusters that changed, and the cached attributes of
+        the others are merged into the result.
+
+        When the budget is exceeded, the attributes of the least recently used nodes are evicted. The data versions of
+        their clusters are kept, see GetDataVersions(), e.g. to learn which clusters of an evicted node changed with a
+        read filtered by them, since the publisher only reports those. A node is used when it is read or looked up.
+
+        Must only be used from the event loop of the controller.
+    '''
+
+    def __init__(self, maxEntries: Optional[int] = None, maxBytes: Optional[int] = None, returnClusterObject: bool = False):
+        ''' Initializes the cache with its budget, None for no limit. returnClusterObject is used by GetAttributes(). '''
+        self._maxEntries = maxEntries
+        self._maxBytes = maxBytes
+        self._returnClusterObject = returnClusterObject
+        # In order of use, the least recently used first.
+        self._nodes: collections.OrderedDict[int, _ManagedNodeCache] = collections.OrderedDict()
+        self._evictedVersions: Dict[int, Dict[Tuple[int, int], int]] = {}
+        self._stats = AttributeCacheStats()
+
+    @property
+    def stats(self) -> AttributeCacheStats:
+        return copy.copy(self._stats)
+
+    def GetNodeCache(self, nodeId: int) -> NodeAttributeCache:
+        ''' Returns the cache of a node to read it with, creating it if needed, and marks the node as used. '''
+        nodeCache = self._Lookup(nodeId)
+        if nodeCache is None:
+            nodeCache = _ManagedNodeCache(self, nodeId)
+            self._nodes[nodeId] = nodeCache
+            self._stats.nodes += 1
+        return nodeCache
+
+    def GetAttributes(self, nodeId: int) -> Optional[dict]:
+        ''' Returns the cached attributes of a node, in the layout of AsyncReadTransaction.ReadResponse.attributes, or
+            None if it has none. Marks the node as used.
+        '''
+        nodeCache = self._Lookup(nodeId)
+        if nodeCache is None:
+            return None
+        if nodeCache.attributeCache is None:
+            nodeCache.attributeCache = CompactAttributeCache(self._returnClusterObject, storeRawTLV=True)
+            for path, dataVersion, data in nodeCache.AllAttributes():
+                nodeCache.attributeCache.UpdateTLV(path, dataVersion, data)
+        return nodeCache.attributeCache.GetUpdatedAttributeCache()
+
+    def GetDataVersions(self, nodeId: int) -> Dict[Tuple[int, int], int]:
+        ''' Returns the data version of each (endpoint id, cluster id) of a node, cached or evicted. '''
+        nodeCache = self._nodes.get(nodeId)
+        if nodeCache is not None:
+            return nodeCache.DataVersions()
+        return dict(self._evictedVersions.get(nodeId, {}))
+
+    def RemoveNode(self, nodeId: int):
+        ''' Drops the cached data of a node, e.g. when it is removed from the fabric. '''
+        self._evictedVersions.pop(nodeId, None)
+        nodeCache = self._nodes.pop(nodeId, None)
+        if nodeCache is not None:
+            self._Forget(nodeCache)
+
+    def _Lookup(self, nodeId: int) -> Optional[_ManagedNodeCache]:
+        nodeCache = self._nodes.get(nodeId)
+        if nodeCache is None or not nodeCache.entries:
+            self._stats.misses += 1
+        else:
+            self._stats.hits += 1
+        if nodeCache is not None:
+            self._nodes.move_to_end(nodeId)
+        return nodeCache
+
+    def _Forget(self, nodeCache: _ManagedNodeCache):
+        self._stats.nodes -= 1
+        self._stats.entries -= nodeCache.entries
+        self._stats.bytes -= nodeCache.size
+
+    def _OverBudget(self) -> bool:
+        return ((self._maxEntries is not None and self._stats.entries > self._maxEntries)
+                or (self._maxBytes is not None and self._stats.bytes > self._maxBytes))
+
+    def _Updated(self, nodeCache: _ManagedNodeCache):
+        if self._nodes.get(nodeCache.nodeId) is not nodeCache:
+            # Removed while a read was in progress.
+            return
+        self._stats.entries -= nodeCache.entries
+        self._stats.bytes -= nodeCache.size
+        nodeCache.entries, nodeCache.size = nodeCache.Usage()
+        self._stats.entries += nodeCache.entries
+        self._stats.bytes += nodeCache.size
+        self._evictedVersions.pop(nodeCache.nodeId, None)
+
+        # The node which was just updated is kept, even if it exceeds the budget on its own.
+        while self._OverBudget() and len(self._nodes) > 1:
+            nodeId, evicted = next(iter(self._nodes.items()))
+            if evicted is nodeCache:
+                self._nodes.move_to_end(nodeId)
+                continue
+            del self._nodes[nodeId]
+            self._Forget(evicted)
+            self._evictedVersions[nodeId] = evicted.DataVersions()
+            self._stats.evictions += 1
@@ -16,8 +16,12 @@
 #
 
 import enum
+import importlib
+import threading
 import typing
-from dataclasses import asdict, dataclass, field, make_dataclass
+from dataclasses import dataclass, field
+from dataclasses import fields as dataclassFields
+from dataclasses import is_dataclass, make_dataclass
 from typing import Any, ClassVar, Dict, List, Mapping, Union
 
 from chip import ChipUtility, tlv
@@ -49,12 +53,63 @@ def GetUnionUnderlyingType(typeToCheck, matchingType=None):
     return None
 
 
+def _CacheClassProperty(cls, name: str):
+    ''' Makes the classproperty name defined by cls, if any, evaluated only once for cls.
+
+        The generated cluster objects build a new descriptor each time `descriptor` or `attribute_type`
+        is read, this keeps the one built on first access instead.
+    '''
+    prop = cls.__dict__.get(name)
+    if type(prop) is ChipUtility.classproperty:
+        setattr(cls, name, ChipUtility.cachedclassproperty(prop.fget))
+
+
+# TLV writers are reused across encodings instead of allocating one per ToTLV call. They are pooled
+# per thread, an encoding started while another one is in progress on the same thread gets its own.
+_tlvWriterPool = threading.local()
+
+
+def _AcquireTLVWriter() -> tlv.TLVWriter:
+    pool = _tlvWriterPool.__dict__.setdefault('writers', [])
+    return pool.pop() if pool else tlv.TLVWriter()
+
+
+def _ReleaseTLVWriter(writer: tlv.TLVWriter):
+    writer.reset()
+    _tlvWriterPool.writers.append(writer)
+
+
 @dataclass
 class ClusterObjectFieldDescriptor:
     Label: str = ''
     Tag: typing.Optional[int] = None
     Type: type = type(None)
 
+    # Resolved from Type once when the descriptor is created, see __post_init__.
+    IsNullable: bool = field(default=False, init=False, repr=False, compare=False)
+    IsOptional: bool = field(default=False, init=False, repr=False, compare=False)
+    # The 'real' type behind Type once Nullable / None are removed from a union, None if there is no such type.
+    UnderlyingType: typing.Any = field(default=None, init=False, repr=False, compare=False)
+    # The element type when UnderlyingType is a list, None otherwise.
+    ListElementType: typing.Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if typing.get_origin(self.Type) == typing.Union:
+            self.IsNullable = GetUnionUnderlyingType(self.Type, Nullable) is not None
+            self.IsOptional = GetUnionUnderlyingType(self.Type, type(None)) is not None
+            self.UnderlyingType = GetUnionUnderlyingType(self.Type)
+        else:
+            self.UnderlyingType = self.Type
+        if typing.get_origin(self.UnderlyingType) == list:
+            (self.ListElementType, ) = typing.get_args(self.UnderlyingType)
+
+    def _ConvertSingleElement(self, val, elementType, debugPath: str):
+        try:
+            return elementType(val)
+        except Exception:
+            raise ValueError(
+                f"Field {debugPath}.{self.Label} expected {elementType}, but got {type(val)}")
+
     def _PutSingleElementToTLV(self, tag, val, elementType, writer: tlv.TLVWriter, debugPath: str = '?'):
         if issubclass(elementType, ClusterObject):
             if not isinstance(val, dict):
@@ -64,22 +119,17 @@ class ClusterObjectFieldDescriptor:
                 f'{debugPath}.{self.Label}', tag, val, writer)
             return
 
-        try:
-            val = elementType(val)
-        except Exception:
-            raise ValueError(
-                f"Field {debugPath}.{self.Label} expected {elementType}, but got {type(val)}")
-        writer.put(tag, val)
+        writer.put(tag, self._ConvertSingleElement(val, elementType, debugPath))
 
     def PutFieldToTLV(self, tag, val, writer: tlv.TLVWriter, debugPath: str = '?'):
         if (val == NullValue):
-            if (GetUnionUnderlyingType(self.Type, Nullable) is None):
+            if not self.IsNullable:
                 raise ValueError(
                     f"Field {debugPath}.{self.Label} was not nullable, but got a null")
 
             writer.put(tag, None)
         elif (val is None):
-            if (GetUnionUnderlyingType(self.Type, type(None)) is None):
+            if not self.IsOptional:
                 raise ValueError(
                     f"Field {debugPath}.{self.Label} was not optional, but encountered None")
         else:
@@ -88,7 +138,7 @@ class ClusterObjectFieldDescriptor:
             # So, let's get at the 'real' type within that union before proceeding,
             # since at this point, we're guarenteed to not get None or Null as values.
             #
-            elementType = GetUnionUnderlyingType(self.Type)
+            elementType = self.UnderlyingType
             if (elementType is None):
                 elementType = self.Type
 
@@ -97,12 +147,18 @@ class ClusterObjectFieldDescriptor:
                     tag, val, elementType, writer, debugPath)
                 return
 
-            writer.startArray(tag)
+            if (self.ListElementType is None):
+                raise ValueError(
+                    f"Field {debugPath}.{self.Label} expected {elementType}, but got {type(val)}")
+            elementType = self.ListElementType
 
-            # Get the type of the list. This is a generic, which has its sub-type information of the list element
-            # inside its type argument.
-            (elementType, ) = typing.get_args(elementType)
+            if not issubclass(elementType, ClusterObject):
+                # Lists of plain values are converted up front and written with a single put().
+                writer.put(tag, [self._ConvertSingleElement(v, elementType, debugPath + f'[{i}]')
+                                 for i, v in enumerate(val)])
+                return
 
+            writer.startArray(tag)
             for i, v in enumerate(val):
                 self._PutSingleElementToTLV(
                     None, v, elementType, writer, debugPath + f'[{i}]')
@@ -113,17 +169,20 @@ class ClusterObjectFieldDescriptor:
 class ClusterObjectDescriptor:
     Fields: List[ClusterObjectFieldDescriptor]
 
-    def GetFieldByTag(self, tag: int) -> typing.Optional[ClusterObjectFieldDescriptor]:
+    # Indexes of Fields built when the descriptor is created, the first field wins on duplicates.
+    FieldsByTag: Dict[Any, ClusterObjectFieldDescriptor] = field(default_factory=dict, init=False, repr=False, compare=False)
+    FieldsByLabel: Dict[str, ClusterObjectFieldDescriptor] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
         for _field in self.Fields:
-            if _field.Tag == tag:
-                return _field
-        return None
+            self.FieldsByTag.setdefault(_field.Tag, _field)
+            self.FieldsByLabel.setdefault(_field.Label, _field)
+
+    def GetFieldByTag(self, tag: int) -> typing.Optional[ClusterObjectFieldDescriptor]:
+        return self.FieldsByTag.get(tag)
 
     def GetFieldByLabel(self, label: str) -> typing.Optional[ClusterObjectFieldDescriptor]:
-        for _field in self.Fields:
-            if _field.Label == label:
-                return _field
-        return None
+        return self.FieldsByLabel.get(label)
 
     def _ConvertNonArray(self, debugPath: str, elementType, value: Any) -> Any:
         if not issubclass(elementType, ClusterObject):
@@ -152,21 +211,15 @@ class ClusterObjectDescriptor:
                 ret[descriptor.Label] = NullValue
                 continue
 
-            if (typing.get_origin(descriptor.Type) == typing.Union):
-                realType = GetUnionUnderlyingType(descriptor.Type)
-                if (realType is None):
-                    raise ValueError(
-                        f"Field {debugPath}.{descriptor.Label} has no valid underlying data model type")
-
-                valueType = realType
-            else:
-                valueType = descriptor.Type
+            valueType = descriptor.UnderlyingType
+            if (valueType is None):
+                raise ValueError(
+                    f"Field {debugPath}.{descriptor.Label} has no valid underlying data model type")
 
-            if (typing.get_origin(valueType) == list):
-                listElementType = typing.get_args(valueType)[0]
+            if (descriptor.ListElementType is not None):
                 ret[descriptor.Label] = [
                     self._ConvertNonArray(
-                        f'{debugPath}[{i}]', listElementType, v)
+                        f'{debugPath}[{i}]', descriptor.ListElementType, v)
                     for i, v in enumerate(value)]
                 continue
             ret[descriptor.Label] = self._ConvertNonArray(
@@ -185,51 +238,419 @@ class ClusterObjectDescriptor:
         writer.endContainer()
 
     def DictToTLV(self, data: dict) -> bytes:
-        tlvwriter = tlv.TLVWriter(bytearray())
-        self.DictToTLVWithWriter('', None, data, tlvwriter)
-        return bytes(tlvwriter.encoding)
+        tlvwriter = _AcquireTLVWriter()
+        try:
+            self.DictToTLVWithWriter('', None, data, tlvwriter)
+            return bytes(tlvwriter.encoding)
+        finally:
+            _ReleaseTLVWriter(tlvwriter)
+
+
+# Decoders compiled from the descriptors of cluster objects (see _DecodeTagDict) and from the types of
+# attributes (see ClusterAttributeDescriptor.FromTagDictOrRawValue), keyed by class.
+_compiledDecoders: typing.Dict[type, typing.Callable[[str, Any], Any]] = {}
+
+
+def _CompileElementDecoder(elementType) -> typing.Callable[[str, Any], Any]:
+    ''' Returns a function converting a single decoded TLV value into elementType, with the same
+        conversions and checks as ClusterObjectDescriptor._ConvertNonArray.
+    '''
+    if issubclass(elementType, ClusterObject):
+        def decodeStruct(debugPath: str, value: Any):
+            if not isinstance(value, Mapping):
+                raise ValueError(
+                    f"Failed to decode field {debugPath}, struct expected.")
+            return _DecodeTagDict(elementType, debugPath, value)
+        return decodeStruct
+
+    isEnum = issubclass(elementType, enum.Enum)
+
+    def decodeValue(debugPath: str, value: Any):
+        if isEnum:
+            value = elementType(value)
+        if not isinstance(value, elementType):
+            raise ValueError(
+                f"Failed to decode field {debugPath}, expected type {elementType}, got {type(value)}")
+        return value
+    return decodeValue
+
+
+def _CompileFieldDecoder(fieldDescriptor: ClusterObjectFieldDescriptor) -> typing.Callable[[str, Any], Any]:
+    ''' Returns a function converting the decoded TLV value of a field into the value held by the
+        dataclass, with the same conversions and checks as ClusterObjectDescriptor.TagDictToLabelDict.
+    '''
+    nullable = fieldDescriptor.IsNullable
+    valueType = fieldDescriptor.UnderlyingType
+    if valueType is None:
+        def decodeInvalid(debugPath: str, value: Any):
+            raise ValueError(
+                f"Field {debugPath} has no valid underlying data model type")
+        return decodeInvalid
+
+    if fieldDescriptor.ListElementType is not None:
+        decodeElement = _CompileElementDecoder(fieldDescriptor.ListElementType)
+
+        def decodeNonNull(debugPath: str, value: Any):
+            try:
+                return [decodeElement(debugPath, v) for v in value]
+            except ValueError:
+                # Decode again one element at a time to report the path of the faulty element.
+                for i, v in enumerate(value):
+                    decodeElement(f'{debugPath}[{i}]', v)
+                raise
+    else:
+        decodeNonNull = _CompileElementDecoder(valueType)
+
+    def decodeField(debugPath: str, value: Any):
+        if value is None:
+            if not nullable:
+                raise ValueError(
+                    f"Field {debugPath} was not nullable, but got a null")
+            return NullValue
+        return decodeNonNull(debugPath, value)
+    return decodeField
+
+
+def _CompileTagDictDecoder(cls) -> typing.Callable[[str, Mapping], Any]:
+    fields = {_field.Tag: (_field.Label, _CompileFieldDecoder(_field)) for _field in cls.descriptor.Fields}
+
+    def decode(debugPath: str, data: Mapping):
+        kwargs = {}
+        for tag, value in data.items():
+            fieldDecoder = fields.get(tag)
+            if fieldDecoder is None:
+                # We do not have enough information for this field, FromDict ignores it as well.
+                continue
+            label, decodeField = fieldDecoder
+            kwargs[label] = decodeField(f'{debugPath}.{label}', value)
+        return cls(**kwargs)
+    return decode
+
+
+def _DecodeTagDict(cls, debugPath: str, data: Mapping):
+    ''' Builds an instance of the cluster object cls from a tag dict as produced by TLVReader.
+
+        This is equivalent to cls.FromDict(cls.descriptor.TagDictToLabelDict(debugPath, data), strict=True),
+        through a decoder compiled from the descriptor of cls on first use and cached per class.
+    '''
+    decoder = _compiledDecoders.get(cls)
+    if decoder is None:
+        decoder = _compiledDecoders[cls] = _CompileTagDictDecoder(cls)
+    return decoder(debugPath, data)
+
+
+# Constructors compiled from the descriptors of cluster objects, see _BuildFromLabelDict.
+_labelDictConstructors: typing.Dict[type, typing.Callable[[Mapping], Any]] = {}
+
+
+def _CompileLabelDictConstructor(cls) -> typing.Callable[[Mapping], Any]:
+    def structConverter(elementType):
+        def convert(value):
+            if isinstance(value, Mapping):
+                return _BuildFromLabelDict(elementType, value)
+            return value
+        return convert
+
+    def listConverter(convertElement):
+        def convert(value):
+            if isinstance(value, list):
+                return [convertElement(v) for v in value]
+            return value
+        return convert
+
+    def isStruct(elementType) -> bool:
+        return isinstance(elementType, type) and issubclass(elementType, ClusterObject)
+
+    # Values of the fields holding neither structs nor lists of structs are given to the constructor as is.
+    converters: typing.Dict[str, typing.Optional[typing.Callable[[Any], Any]]] = {
+        _field.name: None for _field in dataclassFields(cls) if _field.init}
+    for _field in cls.descriptor.Fields:
+        if _field.Label not in converters:
+            continue
+        if isStruct(_field.ListElementType):
+            converters[_field.Label] = listConverter(structConverter(_field.ListElementType))
+        elif isStruct(_field.UnderlyingType):
+            converters[_field.Label] = structConverter(_field.UnderlyingType)
+
+    def construct(data: Mapping):
+        kwargs = {}
+        for label, value in data.items():
+            if label not in converters:
+                # Not a field of the dataclass, ignored like dacite does.
+                continue
+            convert = converters[label]
+            kwargs[label] = value if convert is None else convert(value)
+        return cls(**kwargs)
+    return construct
+
+
+def _BuildFromLabelDict(cls, data: Mapping):
+    ''' Builds an instance of the cluster object cls from a label dict, see ClusterObject.FromDict.
+
+        Nested structs given as label dicts are built as well, the other values are not checked
+        against the field types. The constructor is compiled from the descriptor of cls on first use
+        and cached per class.
+    '''
+    constructor = _labelDictConstructors.get(cls)
+    if constructor is None:
+        constructor = _labelDictConstructors[cls] = _CompileLabelDictConstructor(cls)
+    return constructor(data)
+
+
+# Encoders compiled from the descriptors of cluster objects (see _EncodeStruct) and from the types of
+# attributes (see ClusterAttributeDescriptor.ToTLV), keyed by class.
+_compiledEncoders: typing.Dict[type, typing.Callable[[tlv.TLVWriter, Any, Any, str], None]] = {}
+
+
+def _CompileElementEncoder(elementType, label: str):
+    ''' Returns a function writing a single value of type elementType, with the same conversions
+        and checks as ClusterObjectFieldDescriptor._PutSingleElementToTLV.
+    '''
+    if issubclass(elementType, ClusterObject):
+        def encodeStruct(writer: tlv.TLVWriter, tag, val, debugPath: str):
+            if not isinstance(val, Mapping) and (not is_dataclass(val) or isinstance(val, type)):
+                raise ValueError(
+                    f"Field {debugPath}.{label} expected a struct, but got {type(val)}")
+            _EncodeStruct(elementType, writer, tag, val, f'{debugPath}.{label}')
+        return encodeStruct
+
+    def convert(val, debugPath: str):
+        if val.__class__ is elementType:
+            return val
+        try:
+            return elementType(val)
+        except Exception:
+            raise ValueError(
+                f"Field {debugPath}.{label} expected {elementType}, but got {type(val)}")
+
+    def encodeValue(writer: tlv.TLVWriter, tag, val, debugPath: str):
+        writer.put(tag, convert(val, debugPath))
+    encodeValue.convert = convert
+    return encodeValue
+
+
+def _CompileFieldEncoder(fieldDescriptor: ClusterObjectFieldDescriptor):
+    ''' Returns a function writing the value of a field, with the same checks and errors as
+        ClusterObjectFieldDescriptor.PutFieldToTLV.
+    '''
+    label = fieldDescriptor.Label
+    nullable = fieldDescriptor.IsNullable
+    optional = fieldDescriptor.IsOptional
+    elementType = fieldDescriptor.UnderlyingType
+    if elementType is None:
+        elementType = fieldDescriptor.Type
+
+    if fieldDescriptor.ListElementType is not None:
+        encodeElement = _CompileElementEncoder(fieldDescriptor.ListElementType, label)
+        convertElement = getattr(encodeElement, 'convert', None)
+        encodeSingle = None
+    else:
+        encodeElement = None
+        encodeSingle = _CompileElementEncoder(elementType, label)
+
+    def encodeList(writer: tlv.TLVWriter, tag, val, debugPath: str):
+        if encodeElement is None:
+            raise ValueError(
+                f"Field {debugPath}.{label} expected {elementType}, but got {type(val)}")
+        if convertElement is not None:
+            # Lists of plain values are converted up front and written with a single put().
+            try:
+                converted = [convertElement(v, debugPath) for v in val]
+            except ValueError:
+                # Convert again one element at a time to report the path of the faulty element.
+                for i, v in enumerate(val):
+                    convertElement(v, f'{debugPath}[{i}]')
+                raise
+            writer.put(tag, converted)
+            return
+        writer.startArray(tag)
+        for i, v in enumerate(val):
+            encodeElement(writer, None, v, f'{debugPath}[{i}]')
+        writer.endContainer()
+
+    def encodeField(writer: tlv.TLVWriter, tag, val, debugPath: str):
+        if isinstance(val, Nullable):
+            if not nullable:
+                raise ValueError(
+                    f"Field {debugPath}.{label} was not nullable, but got a null")
+            writer.put(tag, None)
+        elif val is None:
+            if not optional:
+                raise ValueError(
+                    f"Field {debugPath}.{label} was not optional, but encountered None")
+        elif isinstance(val, list):
+            encodeList(writer, tag, val, debugPath)
+        elif encodeSingle is None:
+            raise ValueError(
+                f"Field {debugPath}.{label} expected a list, but got {type(val)}")
+        else:
+            encodeSingle(writer, tag, val, debugPath)
+    return encodeField
+
+
+def _CompileStructEncoder(cls):
+    fields = [(_field.Tag, _field.Label, _CompileFieldEncoder(_field)) for _field in cls.descriptor.Fields]
+
+    def encode(writer: tlv.TLVWriter, tag, data, debugPath: str):
+        writer.startStructure(tag)
+        if isinstance(data, Mapping):
+            for fieldTag, label, encodeField in fields:
+                encodeField(writer, fieldTag, data.get(label, None), f'{debugPath}.{label}')
+        else:
+            for fieldTag, label, encodeField in fields:
+                encodeField(writer, fieldTag, getattr(data, label, None), f'{debugPath}.{label}')
+        writer.endContainer()
+    return encode
+
+
+def _EncodeStruct(cls, writer: tlv.TLVWriter, tag, data, debugPath: str):
+    ''' Writes data, an instance of the cluster object cls or a label dict, as a TLV structure.
+
+        This is equivalent to cls.descriptor.DictToTLVWithWriter(debugPath, tag, asdict(data), writer),
+        through an encoder compiled from the descriptor of cls on first use and cached per class, which
+        reads the dataclass fields directly instead of converting the whole object with asdict().
+    '''
+    encoder = _compiledEncoders.get(cls)
+    if encoder is None:
+        encoder = _compiledEncoders[cls] = _CompileStructEncoder(cls)
+    encoder(writer, tag, data, debugPath)
 
 
 class ClusterObject:
+    # Empty slots on the base classes let cluster objects generated as slots dataclasses (see
+    # split_python_cluster_objects.py --slots) drop the per-instance __dict__.
+    __slots__ = ()
+
+    def __init_subclass__(cls, *args, **kwargs) -> None:
+        super().__init_subclass__(*args, **kwargs)
+        _CacheClassProperty(cls, 'descriptor')
+
     def ToTLV(self):
-        return self.descriptor.DictToTLV(asdict(self))
+        writer = _AcquireTLVWriter()
+        try:
+            _EncodeStruct(type(self), writer, None, self, '')
+            return bytes(writer.encoding)
+        finally:
+            _ReleaseTLVWriter(writer)
 
     @classmethod
-    def FromDict(cls, data: dict):
-        return from_dict(data_class=cls, data=data)
+    def FromDict(cls, data: Mapping, strict: bool = False):
+        ''' Builds the object from a label dict, building nested structs given as label dicts as well.
+
+            Values are not checked against the field types unless strict is set, in which case the
+            object is built through dacite, raising dacite errors for values not matching their field type.
+        '''
+        if strict:
+            return from_dict(data_class=cls, data=data)
+        return _BuildFromLabelDict(cls, data)
+
+    @classmethod
+    def FromTagDict(cls, data: Mapping):
+        ''' Builds the object from a tag dict as produced by TLVReader, checking field types like FromDict(strict=True) does. '''
+        return _DecodeTagDict(cls, '', data)
 
     @classmethod
     def FromTLV(cls, data: bytes):
-        return cls.FromDict(data=cls.descriptor.TLVToDict(data))
+        return cls.FromTagDict(tlv.TLVReader(data).get().get('Any', {}))
 
     @ChipUtility.classproperty
     def descriptor(cls):
         raise NotImplementedError()
 
 
+# Modules defining the generated clusters which have not been imported yet, by cluster id.
+# See RegisterLazyClusterModules.
+_lazyClusterModules: Dict[int, str] = {}
+
+
+def RegisterLazyClusterModules(modules: Mapping[int, str]):
+    ''' Registers the modules defining the generated clusters, by cluster id.
+
+        chip.clusters.Objects imports the module of a cluster on first access to it. Until then the
+        cluster is not in the ALL_* dictionaries below, which import the module of a cluster on lookup of
+        its id, and every registered module before iterating.
+    '''
+    _lazyClusterModules.update(modules)
+
+
+def _ImportClusterModule(clusterId):
+    ''' Imports the module defining clusterId if it has not been imported yet. '''
+    module = _lazyClusterModules.get(clusterId)
+    if module is not None:
+        importlib.import_module(module)
+        _lazyClusterModules.pop(clusterId, None)
+
+
+def _ImportAllClusterModules():
+    for clusterId in list(_lazyClusterModules):
+        _ImportClusterModule(clusterId)
+
+
+class _ClusterRegistry(dict):
+    ''' A dictionary keyed by cluster id, which imports the module defining a cluster the first time
+        the cluster is looked up, and all of them before being iterated.
+    '''
+
+    # Registrations from outside the generated module of a cluster (e.g. tests defining their own
+    # commands) may add its id before the module is imported, so pending modules are imported on
+    # every lookup, not only when the id is missing.
+    def __getitem__(self, clusterId):
+        if clusterId in _lazyClusterModules:
+            _ImportClusterModule(clusterId)
+        return super().__getitem__(clusterId)
+
+    def __contains__(self, clusterId) -> bool:
+        if clusterId in _lazyClusterModules:
+            _ImportClusterModule(clusterId)
+        return super().__contains__(clusterId)
+
+    def get(self, clusterId, default=None):
+        if clusterId in _lazyClusterModules:
+            _ImportClusterModule(clusterId)
+        return super().get(clusterId, default)
+
+    def __iter__(self):
+        _ImportAllClusterModules()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        _ImportAllClusterModules()
+        return super().__len__()
+
+    def keys(self):
+        _ImportAllClusterModules()
+        return super().keys()
+
+    def values(self):
+        _ImportAllClusterModules()
+        return super().values()
+
+    def items(self):
+        _ImportAllClusterModules()
+        return super().items()
+
+
 # The below dictionaries will be filled dynamically
 # and are used for quick lookup/mapping from cluster/attribute id to the correct class
-ALL_CLUSTERS: typing.Dict = {}
-ALL_ATTRIBUTES: typing.Dict = {}
+ALL_CLUSTERS: typing.Dict = _ClusterRegistry()
+ALL_ATTRIBUTES: typing.Dict = _ClusterRegistry()
 # These need to be separate because there can be overlap in command ids for commands and responses.
-ALL_ACCEPTED_COMMANDS: typing.Dict = {}
-ALL_GENERATED_COMMANDS: typing.Dict = {}
-ALL_EVENTS: typing.Dict = {}
+ALL_ACCEPTED_COMMANDS: typing.Dict = _ClusterRegistry()
+ALL_GENERATED_COMMANDS: typing.Dict = _ClusterRegistry()
+ALL_EVENTS: typing.Dict = _ClusterRegistry()
 
 
 class ClusterCommand(ClusterObject):
+    __slots__ = ()
+
     def __init_subclass__(cls, *args, **kwargs) -> None:
         """Register a subclass."""
         super().__init_subclass__(*args, **kwargs)
         try:
             if cls.is_client:
-                if cls.cluster_id not in ALL_ACCEPTED_COMMANDS:
-                    ALL_ACCEPTED_COMMANDS[cls.cluster_id] = {}
-                ALL_ACCEPTED_COMMANDS[cls.cluster_id][cls.command_id] = cls
+                ALL_ACCEPTED_COMMANDS.setdefault(cls.cluster_id, {})[cls.command_id] = cls
             else:
-                if cls.cluster_id not in ALL_GENERATED_COMMANDS:
-                    ALL_GENERATED_COMMANDS[cls.cluster_id] = {}
-                ALL_GENERATED_COMMANDS[cls.cluster_id][cls.command_id] = cls
+                ALL_GENERATED_COMMANDS.setdefault(cls.cluster_id, {})[cls.command_id] = cls
         except NotImplementedError:
             # handle case where the ClusterAttribute class is not (fully) subclassed
             # and accessing the id property throws a NotImplementedError.
@@ -257,6 +678,7 @@ class Cluster(ClusterObject):
     especially the TLV decoding logic. Also ThreadNetworkDiagnostics has an attribute with the same name so we
     picked data_version as its name.
     '''
+    __slots__ = ('_data_version',)
     id: Any
 
     def __init_subclass__(cls, *args, **kwargs) -> None:
@@ -273,11 +695,10 @@ class Cluster(ClusterObject):
         '''
         Override the default behavior of rich.pretty.pprint for adding the cluster data version.
         '''
-        if self._data_version is not None:
+        if getattr(self, '_data_version', None) is not None:
             yield "(data version)", self.data_version
-        for k in self.__dataclass_fields__.keys():
-            if k in self.__dict__:
-                yield k, self.__dict__[k]
+        for _field in dataclassFields(self):
+            yield _field.name, getattr(self, _field.name)
 
     def SetDataVersion(self, version: int) -> None:
         self._data_version = version
@@ -290,37 +711,40 @@ class ClusterAttributeDescriptor:
     Users should not initialize an object based on this class. Instead, users should pass
     the subclass objects to tell some methods what they want.
 
-    The implementation of this functions is quite tricky, it will create a cluster object on-the-fly,
-    and use it for actual encode / decode routine to save lines of code.
+    Values are encoded and decoded through functions compiled from attribute_type on first use
+    and cached per attribute, see _CompileFieldEncoder and _CompileFieldDecoder.
     '''
 
     def __init_subclass__(cls, *args, **kwargs) -> None:
         """Register a subclass."""
         super().__init_subclass__(*args, **kwargs)
+        _CacheClassProperty(cls, 'attribute_type')
         if cls.standard_attribute:
-            if cls.cluster_id not in ALL_ATTRIBUTES:
-                ALL_ATTRIBUTES[cls.cluster_id] = {}
             # register this clusterattribute in the ALL_ATTRIBUTES dict for quick lookups
-            ALL_ATTRIBUTES[cls.cluster_id][cls.attribute_id] = cls
+            ALL_ATTRIBUTES.setdefault(cls.cluster_id, {})[cls.attribute_id] = cls
 
     @classmethod
     def ToTLV(cls, tag: Union[int, None], value):
-        writer = tlv.TLVWriter()
-        wrapped_value = cls._cluster_object(Value=value)
-        cls.attribute_type.PutFieldToTLV(tag,
-                                         asdict(wrapped_value)['Value'], writer, '')
-        return writer.encoding
+        encoder = _compiledEncoders.get(cls)
+        if encoder is None:
+            encoder = _compiledEncoders[cls] = _CompileFieldEncoder(cls.attribute_type)
+        writer = _AcquireTLVWriter()
+        try:
+            encoder(writer, tag, value, '')
+            return bytearray(writer.encoding)
+        finally:
+            _ReleaseTLVWriter(writer)
 
     @classmethod
     def FromTLV(cls, tlvBuffer: bytes):
-        obj_class = cls._cluster_object
-        return obj_class.FromDict(
-            obj_class.descriptor.TagDictToLabelDict('', {0: tlv.TLVReader(tlvBuffer).get().get('Any', {})})).Value
+        return cls.FromTagDictOrRawValue(tlv.TLVReader(tlvBuffer).get().get('Any', {}))
 
     @classmethod
     def FromTagDictOrRawValue(cls, val: Any):
-        obj_class = cls._cluster_object
-        return obj_class.FromDict(obj_class.descriptor.TagDictToLabelDict('', {0: val})).Value
+        decoder = _compiledDecoders.get(cls)
+        if decoder is None:
+            decoder = _compiledDecoders[cls] = _CompileFieldDecoder(cls.attribute_type)
+        return decoder('.Value', val)
 
     @ChipUtility.classproperty
     def cluster_id(self) -> int:
@@ -361,14 +785,14 @@ class ClusterAttributeDescriptor:
 
 
 class ClusterEvent(ClusterObject):
+    __slots__ = ()
+
     def __init_subclass__(cls, *args, **kwargs) -> None:
         """Register a subclass."""
         super().__init_subclass__(*args, **kwargs)
 
-        if cls.cluster_id not in ALL_EVENTS:
-            ALL_EVENTS[cls.cluster_id] = {}
         # register this clusterattribute in the ALL_ATTRIBUTES dict for quick lookups
-        ALL_EVENTS[cls.cluster_id][cls.event_id] = cls
+        ALL_EVENTS.setdefault(cls.cluster_id, {})[cls.event_id] = cls
 
     @ChipUtility.classproperty
     def cluster_id(self) -> int:
@@ -17,9 +17,7 @@
 
 import builtins
 import ctypes
-import inspect
 import logging
-import sys
 from asyncio.futures import Future
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_char_p, c_size_t, c_uint8, c_uint16, c_uint32, c_void_p, cast, py_object
 from dataclasses import dataclass
@@ -30,7 +28,7 @@ import chip.interaction_model
 from chip.interaction_model import PyInvokeRequestData, TestOnlyPyBatchCommandsOverrides, TestOnlyPyOnDoneInfo
 from chip.native import PyChipError
 
-from .ClusterObjects import ClusterCommand
+from .ClusterObjects import ALL_ACCEPTED_COMMANDS, ALL_GENERATED_COMMANDS, ClusterCommand
 
 logger = logging.getLogger('chip.cluster.Command')
 logger.setLevel(logging.ERROR)
@@ -70,18 +68,8 @@ def FindCommandClusterObject(isClientSideCommand: bool, path: CommandPath):
 
         Returns the type of the cluster object if one is found. Otherwise, returns None.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Commands') in str(subclass)):
-                    for commandName, command in inspect.getmembers(subclass):
-                        if inspect.isclass(command):
-                            for name, field in inspect.getmembers(command):
-                                if ('__dataclass_fields__' in name):
-                                    if (field['cluster_id'].default == path.ClusterId) and (field['command_id'].default ==
-                                                                                            path.CommandId) and (field['is_client'].default == isClientSideCommand):
-                                        return eval('chip.clusters.Objects.' + clusterName + '.Commands.' + commandName)
-    return None
+    commands = ALL_ACCEPTED_COMMANDS if isClientSideCommand else ALL_GENERATED_COMMANDS
+    return commands.get(path.ClusterId, {}).get(path.CommandId)
 
 
 class AsyncCommandTransaction:
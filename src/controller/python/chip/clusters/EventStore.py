@@ -0,0 +1,154 @@
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+# Needed to use types in type hints before they are fully defined.
+from __future__ import annotations
+
+import collections
+from typing import Deque, Dict, List, Optional, Tuple
+
+from .Attribute import EventPath, EventReadResult, _EventPathCovers, _EventPathMatches
+
+
+class NodeEventStore:
+    ''' The last events received from a single node, see EventStore.
+
+        A ring buffer of up to `capacity` events, indexed by event number and by (cluster id, event id). Must only be
+        used from the event loop of the controller.
+    '''
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._events: Deque[EventReadResult] = collections.deque()
+        self._byNumber: Dict[int, EventReadResult] = {}
+        # The events of each type, in the order of _events.
+        self._byType: Dict[Tuple[int, int], Deque[EventReadResult]] = {}
+        # The highest event number received by a read or subscription of each event path. All the events of the path
+        # up to that number were reported to it.
+        self._received: Dict[EventPath, int] = {}
+        self._highestEventNumber: Optional[int] = None
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def highestEventNumber(self) -> Optional[int]:
+        return self._highestEventNumber
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def Add(self, eventPaths: List[EventPath], events: List[EventReadResult]):
+        ''' Adds the events of a report, received by a read or subscription of eventPaths. The events the store
+            already has are skipped, the oldest ones are dropped once it is full.
+        '''
+        for event in events:
+            number = event.Header.EventNumber
+            for path in eventPaths:
+                if _EventPathMatches(path, event.Header):
+                    path = EventPath(EndpointId=path.EndpointId, ClusterId=path.ClusterId, EventId=path.EventId)
+                    self._received[path] = max(self._received.get(path, number), number)
+
+            if number in self._byNumber:
+                continue
+            if self._highestEventNumber is None or number > self._highestEventNumber:
+                self._highestEventNumber = number
+            if len(self._events) == self._capacity:
+                oldest = self._events.popleft()
+                del self._byNumber[oldest.Header.EventNumber]
+                key = (oldest.Header.ClusterId, oldest.Header.EventId)
+                self._byType[key].popleft()
+                if not self._byType[key]:
+                    del self._byType[key]
+            self._events.append(event)
+            self._byNumber[number] = event
+            self._byType.setdefault((event.Header.ClusterId, event.Header.EventId), collections.deque()).append(event)
+
+    def GetEvent(self, eventNumber: int) -> Optional[EventReadResult]:
+        ''' Returns the event with the given event number, if the store has it. '''
+        return self._byNumber.get(eventNumber)
+
+    def GetEvents(self, endpointId: Optional[int] = None, clusterId: Optional[int] = None, eventId: Optional[int] = None,
+                  minEventNumber: Optional[int] = None) -> List[EventReadResult]:
+        ''' Returns the stored events of the given endpoint, cluster and event id (None for any) with an event number of
+            at least minEventNumber, oldest first.
+        '''
+        if clusterId is not None and eventId is not None:
+            events = self._byType.get((clusterId, eventId), ())
+        elif clusterId is not None:
+            events = sorted((event for (c, _), typeEvents in self._byType.items() if c == clusterId for event in typeEvents),
+                            key=lambda event: event.Header.EventNumber)
+        else:
+            events = self._events
+        return [event for event in events
+                if (endpointId is None or event.Header.EndpointId == endpointId)
+                and (eventId is None or event.Header.EventId == eventId)
+                and (minEventNumber is None or event.Header.EventNumber >= minEventNumber)]
+
+    def EventNumberFilter(self, eventPaths: List[EventPath]) -> Optional[int]:
+        ''' Returns the event number filter of a read or subscription of eventPaths which only gets the events the node
+            did not report yet, or None if some of the paths were never read.
+        '''
+        highestNumbers = []
+        for path in eventPaths:
+            # Whether the events were urgent does not matter.
+            path = EventPath(EndpointId=path.EndpointId, ClusterId=path.ClusterId, EventId=path.EventId)
+            received = [number for receivedPath, number in self._received.items() if _EventPathCovers(receivedPath, path)]
+            if not received:
+                return None
+            highestNumbers.append(max(received))
+        return min(highestNumbers) + 1 if highestNumbers else None
+
+    def Clear(self):
+        ''' Drops all the events of the node. '''
+        self._events.clear()
+        self._byNumber = {}
+        self._byType = {}
+        self._received = {}
+        self._highestEventNumber = None
+
+
+class EventStore:
+    ''' An in-memory store of the last events received from each node, bounded per node.
+
+        Once set on a controller (ChipDeviceControllerBase.SetEventStore), the events received by reads and
+        subscriptions are added to the store of their node, and the reads and subscriptions of events which are not
+        given an eventNumberFilter only get the events the node did not report yet: query the store for the others.
+        This also applies when a subscription is established again after it was lost or shut down.
+    '''
+
+    def __init__(self, capacity: int = 1000):
+        ''' Initializes the store with the number of events kept for each node. '''
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._nodes: Dict[int, NodeEventStore] = {}
+
+    def GetNodeStore(self, nodeId: int) -> NodeEventStore:
+        ''' Returns the events of a node, creating its store on first use. '''
+        nodeStore = self._nodes.get(nodeId)
+        if nodeStore is None:
+            nodeStore = NodeEventStore(self._capacity)
+            self._nodes[nodeId] = nodeStore
+        return nodeStore
+
+    def RemoveNode(self, nodeId: int):
+        ''' Drops the events of a node, e.g. when it is removed from the fabric. '''
+        self._nodes.pop(nodeId, None)
@@ -0,0 +1,317 @@
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+# Needed to use types in type hints before they are fully defined.
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .Attribute import AttributePath, DataVersionFilter, _PathMatches
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _CachedCluster:
+    dataVersion: int
+    # Whether all the attributes of the cluster are cached, i.e. it was read with a wildcard attribute path.
+    complete: bool = False
+    # TLV of each attribute, as received.
+    attributes: Dict[int, bytes] = field(default_factory=dict)
+
+
+class NodeAttributeCache:
+    ''' The cached attribute data of a single node, see PersistentAttributeCache.
+
+        With a path of None, the data is only kept in memory. When onChanged is given, it is called on every update
+        instead of saving the data right away.
+    '''
+
+    def __init__(self, path: Optional[str], fabricId: int, nodeId: int,
+                 onChanged: Optional[Callable[[NodeAttributeCache], None]] = None):
+        self._path = path
+        self._fabricId = fabricId
+        self._nodeId = nodeId
+        self._onChanged = onChanged
+        self._clusters: Dict[Tuple[int, int], _CachedCluster] = {}
+        self._Load()
+
+    @property
+    def fabricId(self) -> int:
+        return self._fabricId
+
+    @property
+    def nodeId(self) -> int:
+        return self._nodeId
+
+    def DataVersionFilters(self, attributePaths: List[AttributePath]) -> List[DataVersionFilter]:
+        ''' Returns the data version filters for the cached clusters read by attributePaths.
+
+            A cluster is only filtered when the cache holds everything the paths read from it, since the
+            publisher will not report any of it if its data version did not change.
+        '''
+        filters = []
+        for (endpointId, clusterId), cluster in self._clusters.items():
+            paths = [path for path in attributePaths if _PathMatches(path, endpointId, clusterId)]
+            if paths and all(cluster.complete if path.AttributeId is None else path.AttributeId in cluster.attributes
+                             for path in paths):
+                filters.append(DataVersionFilter(EndpointId=endpointId, ClusterId=clusterId, DataVersion=cluster.dataVersion))
+        return filters
+
+    def DataVersions(self) -> Dict[Tuple[int, int], int]:
+        ''' Returns the data version of each cached (endpoint id, cluster id). '''
+        return {key: cluster.dataVersion for key, cluster in self._clusters.items()}
+
+    def Usage(self) -> Tuple[int, int]:
+        ''' Returns the number of cached attributes and the size of their TLV. '''
+        entries = 0
+        size = 0
+        for cluster in self._clusters.values():
+            entries += len(cluster.attributes)
+            size += sum(len(data) for data in cluster.attributes.values())
+        return entries, size
+
+    def AllAttributes(self) -> Iterator[Tuple[AttributePath, int, bytes]]:
+        ''' Yields (path, data version, TLV) of all the cached attributes. '''
+        for (endpointId, clusterId), cluster in self._clusters.items():
+            for attributeId, data in cluster.attributes.items():
+                yield AttributePath(EndpointId=endpointId, ClusterId=clusterId, AttributeId=attributeId), cluster.dataVersion, data
+
+    def CachedAttributes(self, attributePaths: List[AttributePath],
+                         dataVersionFilters: List[DataVersionFilter]) -> Iterator[Tuple[AttributePath, int, bytes]]:
+        ''' Yields (path, data version, TLV) of the cached attributes read by attributePaths in the filtered clusters.
+        '''
+        for dataVersionFilter in dataVersionFilters:
+            endpointId, clusterId = dataVersionFilter.EndpointId, dataVersionFilter.ClusterId
+            cluster = self._clusters.get((endpointId, clusterId))
+            if cluster is None:
+                continue
+            for attributeId, data in cluster.attributes.items():
+                if any(_PathMatches(path, endpointId, clusterId, attributeId) for path in attributePaths):
+                    path = AttributePath(EndpointId=endpointId, ClusterId=clusterId, AttributeId=attributeId)
+                    yield path, cluster.dataVersion, data
+
+    def Update(self, attributePaths: List[AttributePath], report: Dict[AttributePath, Tuple[int, Optional[bytes]]],
+               priming: bool):
+        ''' Merges the attribute data of a report into the cache and saves it, see onChanged.
+
+            attributePaths: The paths of the read or subscription the report belongs to.
+            report: (data version, TLV) of each attribute path in the report, with a TLV of None for an attribute
+                    reported with an error status.
+            priming: Whether the report is the first one of a read or of a subscription. Any attribute read by
+                     attributePaths in a reported cluster is then part of it, the ones it does not have are dropped.
+        '''
+        reportedClusters: Dict[Tuple[int, int], Tuple[int, Dict[int, bytes]]] = {}
+        failedPaths: List[AttributePath] = []
+        for path, (dataVersion, data) in report.items():
+            if data is None:
+                failedPaths.append(path)
+                continue
+            # The data version of a cluster is the latest one in the report.
+            _, attributes = reportedClusters.get((path.EndpointId, path.ClusterId), (dataVersion, {}))
+            attributes[path.AttributeId] = data
+            reportedClusters[(path.EndpointId, path.ClusterId)] = (dataVersion, attributes)
+
+        for (endpointId, clusterId), (dataVersion, attributes) in reportedClusters.items():
+            complete = any(path.AttributeId is None and _PathMatches(path, endpointId, clusterId) for path in attributePaths)
+            cluster = self._clusters.get((endpointId, clusterId))
+            if cluster is None or cluster.dataVersion != dataVersion:
+                # The attributes the read or subscription covers are either in the report or, if it is
+                # not the priming one, unchanged. The others may have changed with the data version.
+                kept = {} if cluster is None or priming else {
+                    attributeId: data for attributeId, data in cluster.attributes.items()
+                    if any(_PathMatches(path, endpointId, clusterId, attributeId) for path in attributePaths)}
+                cluster = _CachedCluster(dataVersion=dataVersion, complete=complete, attributes=kept)
+                self._clusters[(endpointId, clusterId)] = cluster
+            else:
+                cluster.complete = cluster.complete or complete
+
+            cluster.attributes.update(attributes)
+
+        for path in failedPaths:
+            cluster = self._clusters.get((path.EndpointId, path.ClusterId))
+            if cluster is not None:
+                cluster.attributes.pop(path.AttributeId, None)
+                cluster.complete = False
+
+        if self._onChanged is not None:
+            self._onChanged(self)
+        else:
+            self.Save()
+
+    def Clear(self):
+        ''' Drops all the cached data of the node, and its file. '''
+        self._clusters = {}
+        if self._path is None:
+            return
+        try:
+            os.remove(self._path)
+        except FileNotFoundError:
+            pass
+
+    def Save(self):
+        ''' Writes the cached data of the node to its file. '''
+        self._Write(self._Snapshot())
+
+    def _Snapshot(self) -> Dict[Tuple[int, int], _CachedCluster]:
+        ''' Returns a copy of the cached data, which the following updates do not modify. '''
+        return {key: _CachedCluster(dataVersion=cluster.dataVersion, complete=cluster.complete,
+                                    attributes=dict(cluster.attributes))
+                for key, cluster in self._clusters.items()}
+
+    def _Write(self, clusters: Dict[Tuple[int, int], _CachedCluster]):
+        if self._path is None:
+            return
+        jsonData = {
+            'fabricId': self._fabricId,
+            'nodeId': self._nodeId,
+            'clusters': [{
+                'endpoint': endpointId,
+                'cluster': clusterId,
+                'dataVersion': cluster.dataVersion,
+                'complete': cluster.complete,
+                'attributes': {str(attributeId): base64.b64encode(data).decode('utf-8')
+                               for attributeId, data in cluster.attributes.items()},
+            } for (endpointId, clusterId), cluster in clusters.items()],
+        }
+
+        # Written to a temporary file first, so that an interrupted write does not corrupt the cache.
+        directory = os.path.dirname(self._path)
+        fd, temporaryPath = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(jsonData, f, ensure_ascii=True)
+            os.replace(temporaryPath, self._path)
+        except Exception:
+            os.remove(temporaryPath)
+            raise
+
+    def _Load(self):
+        if self._path is None or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, 'r') as f:
+                jsonData = json.load(f)
+            for cluster in jsonData['clusters']:
+                self._clusters[(cluster['endpoint'], cluster['cluster'])] = _CachedCluster(
+                    dataVersion=cluster['dataVersion'],
+                    complete=cluster['complete'],
+                    attributes={int(attributeId): base64.b64decode(data) for attributeId, data in cluster['attributes'].items()})
+        except Exception as ex:
+            LOGGER.error(ex)
+            LOGGER.warning(f"Could not load the attribute cache from {self._path} - ignoring it")
+            self._clusters = {}
+
+
+class PersistentAttributeCache:
+    ''' An on-disk cache of the attribute data read from nodes, which survives restarts of the controller.
+
+        Each node has a file in the cache directory, keyed by fabric and node id. It holds the data version
+        of each cluster instance read from the node, with the TLV of its attributes as received.
+
+        Once set on a controller (ChipDeviceControllerBase.SetPersistentAttributeCache), reads and
+        subscriptions send a DataVersionFilter for every cached cluster they read, so the publisher only
+        reports the clusters that changed, and the cached attributes of the others are merged into the
+        result.
+
+        The nodes changed by the reports are saved back `saveDelay` seconds after the first change, so that
+        the reports received meanwhile are written at once, by a thread of the cache rather than on the event
+        loop. Call Flush() before exiting so that the last changes are not lost.
+    '''
+
+    def __init__(self, path: str, saveDelay: Optional[float] = 1.0):
+        ''' Initializes the cache with the directory holding its files, which is created if needed.
+
+            saveDelay: Seconds the changed nodes wait before being saved, None to only save them on Flush().
+        '''
+        os.makedirs(path, exist_ok=True)
+        self._path = path
+        self._saveDelay = saveDelay
+        self._nodes: Dict[Tuple[int, int], NodeAttributeCache] = {}
+        self._changedNodes: Dict[Tuple[int, int], NodeAttributeCache] = {}
+        self._saveHandle: Optional[asyncio.TimerHandle] = None
+        # A single thread, so that the files are written in order.
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def GetNodeCache(self, fabricId: int, nodeId: int) -> NodeAttributeCache:
+        ''' Returns the cache of a node, loading it from its file on first use. '''
+        key = (fabricId, nodeId)
+        nodeCache = self._nodes.get(key)
+        if nodeCache is None:
+            nodeCache = NodeAttributeCache(os.path.join(self._path, f'{fabricId:016X}-{nodeId:016X}.json'), fabricId, nodeId,
+                                           onChanged=self._NodeChanged)
+            self._nodes[key] = nodeCache
+        return nodeCache
+
+    def RemoveNode(self, fabricId: int, nodeId: int):
+        ''' Drops the cached data of a node, e.g. when it is removed from the fabric. '''
+        key = (fabricId, nodeId)
+        nodeCache = self.GetNodeCache(fabricId, nodeId)
+        self._changedNodes.pop(key, None)
+        # Its file may still be being written.
+        self._WaitForWrites()
+        nodeCache.Clear()
+        del self._nodes[key]
+
+    def Flush(self):
+        ''' Saves the changed nodes right away, and waits until their files are written. '''
+        if self._saveHandle is not None:
+            self._saveHandle.cancel()
+        self._SaveChangedNodes()
+        self._WaitForWrites()
+
+    def _NodeChanged(self, nodeCache: NodeAttributeCache):
+        self._changedNodes[(nodeCache.fabricId, nodeCache.nodeId)] = nodeCache
+        if self._saveDelay is None or self._saveHandle is not None:
+            return
+        try:
+            eventLoop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not updated by a read or a subscription, e.g. by a script: there is no event loop to save it later.
+            self.Flush()
+            return
+        self._saveHandle = eventLoop.call_later(self._saveDelay, self._SaveChangedNodes)
+
+    def _SaveChangedNodes(self):
+        self._saveHandle = None
+        if not self._changedNodes:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='PersistentAttributeCache')
+        for nodeCache in self._changedNodes.values():
+            self._executor.submit(self._WriteNode, nodeCache, nodeCache._Snapshot())
+        self._changedNodes = {}
+
+    @staticmethod
+    def _WriteNode(nodeCache: NodeAttributeCache, clusters: Dict[Tuple[int, int], _CachedCluster]):
+        try:
+            nodeCache._Write(clusters)
+        except Exception as ex:
+            LOGGER.error(ex)
+            LOGGER.warning(f"Could not save the attribute cache of node 0x{nodeCache.nodeId:016X}")
+
+    def _WaitForWrites(self):
+        if self._executor is not None:
+            self._executor.submit(lambda: None).result()
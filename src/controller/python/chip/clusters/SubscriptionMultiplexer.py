@@ -0,0 +1,345 @@
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+# Needed to use types in type hints before they are fully defined.
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from .Attribute import (AsyncReadTransaction, AttributePath, DefaultAttributeChangeCallback, DefaultErrorCallback,
+                        DefaultEventChangeCallback, EventPath, EventReadResult, ReportOverflowPolicy, SubscriptionReport,
+                        SubscriptionTransaction, TypedAttributePath, _EventPathCovers, _EventPathMatches, _PathCovers, _PathMatches,
+                        _ReportQueue)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _Union(paths: List[Any], covers: Callable[[Any, Any], bool]) -> List[Any]:
+    ''' Returns the paths without the duplicates and the ones another path covers, e.g. the union of the path of an
+        attribute and of the path of its cluster is the path of the cluster.
+    '''
+    union: List[Any] = []
+    for path in dict.fromkeys(paths):
+        if not any(covers(other, path) for other in union):
+            union = [other for other in union if not covers(path, other)] + [path]
+    return union
+
+
+class SharedSubscription:
+    ''' A consumer's handle on the subscription to a node shared by a SubscriptionMultiplexer.
+
+        It offers the callbacks and accessors of a SubscriptionTransaction, restricted to the paths the consumer
+        subscribed to. Attribute and event changes are delivered the same way and on the same thread.
+    '''
+
+    def __init__(self, multiplexer: SubscriptionMultiplexer, nodeid: int, attributePaths: List[AttributePath],
+                 eventPaths: List[EventPath], reportInterval: Tuple[int, int]):
+        self._multiplexer = multiplexer
+        self._nodeid = nodeid
+        self._attributePaths = attributePaths
+        self._eventPaths = eventPaths
+        self._reportInterval = reportInterval
+        self._onAttributeChangeCb: Callable[[TypedAttributePath, SharedSubscription], None] = DefaultAttributeChangeCallback
+        self._onEventChangeCb: Callable[[EventReadResult, SharedSubscription], None] = DefaultEventChangeCallback
+        self._onErrorCb: Callable[[int, SharedSubscription], None] = DefaultErrorCallback
+        # Replaced rather than modified, since the Matter thread iterates over it.
+        self._reportQueues: Tuple[_ReportQueue, ...] = ()
+        self._isDone = False
+
+    @property
+    def nodeid(self) -> int:
+        return self._nodeid
+
+    @property
+    def attributePaths(self) -> List[AttributePath]:
+        return self._attributePaths
+
+    @property
+    def eventPaths(self) -> List[EventPath]:
+        return self._eventPaths
+
+    @property
+    def subscription(self) -> Optional[SubscriptionTransaction]:
+        ''' The subscription to the node currently shared by the consumers, which changes when it is re-subscribed, or
+            None while there is none, e.g. after it ended on an error.
+        '''
+        return self._multiplexer._GetSubscription(self._nodeid)
+
+    def GetAttributes(self):
+        ''' Returns the attribute values tracking the latest state on the publisher, for the paths of the consumer. '''
+        subscription = self.subscription
+        if subscription is None or not self._attributePaths:
+            return {}
+        return AsyncReadTransaction.ReadResponse(
+            attributes=subscription.GetAttributes(), events=[], tlvAttributes={}).Subset(self._attributePaths).attributes
+
+    def GetAttribute(self, path: TypedAttributePath) -> Any:
+        ''' Returns a specific attribute given a TypedAttributePath, which must be one of the paths of the consumer. '''
+        if not self._MatchesAttribute(path.Path):
+            raise KeyError(f"{path.Path} is not subscribed to by this consumer")
+        subscription = self.subscription
+        if subscription is None:
+            raise KeyError(f"There is currently no subscription to node 0x{self._nodeid:016X}")
+        return subscription.GetAttribute(path)
+
+    def GetEvents(self) -> List[EventReadResult]:
+        subscription = self.subscription
+        if subscription is None:
+            return []
+        return [event for event in subscription.GetEvents() if self._MatchesEvent(event)]
+
+    def Reports(self, maxsize: int = 16,
+                overflowPolicy: ReportOverflowPolicy = ReportOverflowPolicy.DROP_OLDEST) -> AsyncIterator[SubscriptionReport]:
+        ''' Returns an asynchronous iterator over the reports received from now on, limited to the paths of the consumer.
+            See SubscriptionTransaction.Reports().
+        '''
+        queue = _ReportQueue(asyncio.get_running_loop(), maxsize, overflowPolicy)
+        queue._onClose = self._RemoveReportQueue
+        self._reportQueues = self._reportQueues + (queue,)
+        return queue
+
+    def _RemoveReportQueue(self, queue: _ReportQueue):
+        self._reportQueues = tuple(q for q in self._reportQueues if q is not queue)
+
+    def SetAttributeUpdateCallback(self, callback: Callable[[TypedAttributePath, SharedSubscription], None]):
+        if callback is not None:
+            self._onAttributeChangeCb = callback
+
+    def SetEventUpdateCallback(self, callback: Callable[[EventReadResult, SharedSubscription], None]):
+        if callback is not None:
+            self._onEventChangeCb = callback
+
+    def SetErrorCallback(self, callback: Callable[[int, SharedSubscription], None]):
+        if callback is not None:
+            self._onErrorCb = callback
+
+    def Shutdown(self):
+        ''' Stops the delivery of the changes to the consumer. The subscription to the node is shut down with its last
+            consumer, or re-subscribed without the paths no other consumer needs.
+        '''
+        if self._isDone:
+            LOGGER.warning(f"Shared subscription to node 0x{self._nodeid:016X} was already terminated previously!")
+            return
+        self._isDone = True
+        for queue in self._reportQueues:
+            queue.Close()
+        self._multiplexer._Remove(self)
+
+    def _MatchesAttribute(self, path: AttributePath) -> bool:
+        return any(_PathMatches(p, path.EndpointId, path.ClusterId, path.AttributeId) for p in self._attributePaths)
+
+    def _MatchesEvent(self, event: EventReadResult) -> bool:
+        return any(_EventPathMatches(p, event.Header) for p in self._eventPaths)
+
+    def _HandleAttributeChange(self, path: TypedAttributePath):
+        if self._MatchesAttribute(path.Path):
+            self._onAttributeChangeCb(path, self)
+
+    def _HandleEventChange(self, event: EventReadResult):
+        if self._MatchesEvent(event):
+            self._onEventChangeCb(event, self)
+
+    def _PutReport(self, report: SubscriptionReport):
+        if not self._reportQueues:
+            return
+        paths = [path for path in report.Paths if self._MatchesAttribute(path)]
+        events = [event for event in report.Events if self._MatchesEvent(event)]
+        if not paths and not events:
+            return
+        dataVersions = {cluster: dataVersion for cluster, dataVersion in report.DataVersions.items()
+                        if any(_PathMatches(p, *cluster) for p in self._attributePaths)}
+        values = {path: report.Values[path] for path in paths if path in report.Values}
+        for queue in self._reportQueues:
+            queue.Put(SubscriptionReport(Paths=paths, Events=events, DataVersions=dataVersions, Values=values))
+
+    def __repr__(self):
+        return f'<SharedSubscription (Node=0x{self._nodeid:016X})>'
+
+
+class _ReportRouter:
+    ''' Hands the reports of a shared subscription to the report queues of its consumers, on the Matter thread. '''
+
+    def __init__(self, node: _SharedNode):
+        self._node = node
+
+    def Put(self, report: SubscriptionReport):
+        for consumer in self._node.consumers:
+            consumer._PutReport(report)
+
+    def Close(self):
+        # The report queues of the consumers end with them, not with the subscription they are moved away from.
+        pass
+
+
+class _SharedNode:
+    def __init__(self, nodeid: int, eventLoop: asyncio.AbstractEventLoop,
+                 onSubscriptionFailed: Callable[[_SharedNode, SubscriptionTransaction], None]):
+        self.nodeid = nodeid
+        self.lock = asyncio.Lock()
+        # Replaced rather than modified, since the Matter thread iterates over it.
+        self.consumers: Tuple[SharedSubscription, ...] = ()
+        self.subscription: Optional[SubscriptionTransaction] = None
+        # The subscription which ended on an error, set on the Matter thread before the event loop drops it.
+        self.failedSubscription: Optional[SubscriptionTransaction] = None
+        self._eventLoop = eventLoop
+        self._onSubscriptionFailed = onSubscriptionFailed
+        # The paths and report interval of the subscription.
+        self.attributePaths: List[AttributePath] = []
+        self.eventPaths: List[EventPath] = []
+        self.reportInterval: Optional[Tuple[int, int]] = None
+
+    def HandleAttributeChange(self, path: TypedAttributePath, transaction: SubscriptionTransaction):
+        for consumer in self.consumers:
+            consumer._HandleAttributeChange(path)
+
+    def HandleEventChange(self, event: EventReadResult, transaction: SubscriptionTransaction):
+        for consumer in self.consumers:
+            consumer._HandleEventChange(event)
+
+    @property
+    def isSubscribed(self) -> bool:
+        return self.subscription is not None and self.subscription is not self.failedSubscription
+
+    def HandleError(self, chipError: int, transaction: SubscriptionTransaction):
+        # The errors which are retried are not reported, the subscription is over.
+        self.failedSubscription = transaction
+        for consumer in self.consumers:
+            consumer._onErrorCb(chipError, consumer)
+        self._eventLoop.call_soon_threadsafe(self._onSubscriptionFailed, self, transaction)
+
+
+class SubscriptionMultiplexer:
+    ''' Shares a single subscription to each node between the consumers subscribing to it.
+
+        The subscription to a node covers the union of the paths of its consumers, with the shortest report intervals
+        they asked for. It is re-subscribed when a consumer needing more, or less, comes or goes, and the changes it
+        reports are routed to the SharedSubscription handle of each consumer whose paths they match. When it ends on an
+        error, the consumers are told through their error callback and it is re-subscribed; if that fails too, it is
+        re-subscribed when the next consumer comes or goes.
+
+        subscribe: Establishes a subscription to a node with the given attribute and event paths and report interval.
+                   It must not cancel the other subscriptions to the node, the previous one being shut down once the new
+                   one is established.
+    '''
+
+    def __init__(self, subscribe: Callable[[int, List[AttributePath], List[EventPath], Tuple[int, int]],
+                                           Awaitable[SubscriptionTransaction]]):
+        self._subscribe = subscribe
+        self._nodes: Dict[int, _SharedNode] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def Subscribe(self, nodeid: int, attributePaths: Optional[List[AttributePath]] = None,
+                        eventPaths: Optional[List[EventPath]] = None,
+                        reportInterval: Tuple[int, int] = (0, 60)) -> SharedSubscription:
+        ''' Returns the handle of a new consumer of the subscription to the node, once the subscription covers its paths.
+        '''
+        if not attributePaths and not eventPaths:
+            raise ValueError("At least one attribute or event path is needed")
+        consumer = SharedSubscription(self, nodeid, list(attributePaths or []), list(eventPaths or []), reportInterval)
+        node = self._nodes.get(nodeid)
+        if node is None:
+            node = _SharedNode(nodeid, asyncio.get_running_loop(), self._SubscriptionFailed)
+            self._nodes[nodeid] = node
+        async with node.lock:
+            node.consumers = node.consumers + (consumer,)
+            try:
+                await self._Update(nodeid, node)
+            except BaseException:
+                node.consumers = tuple(c for c in node.consumers if c is not consumer)
+                if not node.consumers and node.subscription is None:
+                    self._nodes.pop(nodeid, None)
+                raise
+        return consumer
+
+    def Shutdown(self):
+        ''' Shuts the subscriptions to all the nodes down, ending the delivery to their consumers. '''
+        for task in self._tasks:
+            task.cancel()
+        for node in self._nodes.values():
+            for consumer in node.consumers:
+                consumer._isDone = True
+                for queue in consumer._reportQueues:
+                    queue.Close()
+            node.consumers = ()
+            if node.isSubscribed:
+                node.subscription.Shutdown()
+            node.subscription = None
+        self._nodes = {}
+
+    def _GetSubscription(self, nodeid: int) -> Optional[SubscriptionTransaction]:
+        node = self._nodes.get(nodeid)
+        return node.subscription if node is not None and node.isSubscribed else None
+
+    def _Remove(self, consumer: SharedSubscription):
+        node = self._nodes.get(consumer.nodeid)
+        if node is None or consumer not in node.consumers:
+            return
+        node.consumers = tuple(c for c in node.consumers if c is not consumer)
+        self._UpdateLater(consumer.nodeid, node)
+
+    def _SubscriptionFailed(self, node: _SharedNode, subscription: SubscriptionTransaction):
+        if node.subscription is not subscription:
+            return
+        LOGGER.warning(f"Shared subscription to node 0x{node.nodeid:016X} ended on an error, re-subscribing")
+        node.subscription = None
+        if self._nodes.get(node.nodeid) is node:
+            self._UpdateLater(node.nodeid, node)
+
+    def _UpdateLater(self, nodeid: int, node: _SharedNode):
+        task = asyncio.get_running_loop().create_task(self._UpdateLocked(nodeid, node))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _UpdateLocked(self, nodeid: int, node: _SharedNode):
+        async with node.lock:
+            try:
+                await self._Update(nodeid, node)
+            except Exception as ex:
+                # The previous subscription, if it is still live, still covers the paths of the remaining consumers.
+                LOGGER.error(f"Re-subscription to node 0x{nodeid:016X} failed: {ex!r}")
+
+    async def _Update(self, nodeid: int, node: _SharedNode):
+        ''' Re-subscribes to the node if its consumers need other paths or report intervals. Called with node.lock held.
+        '''
+        if not node.consumers:
+            if node.isSubscribed:
+                node.subscription.Shutdown()
+            node.subscription = None
+            if self._nodes.get(nodeid) is node:
+                del self._nodes[nodeid]
+            return
+
+        attributePaths = _Union([path for consumer in node.consumers for path in consumer.attributePaths], _PathCovers)
+        eventPaths = _Union([path for consumer in node.consumers for path in consumer.eventPaths], _EventPathCovers)
+        reportInterval = (min(consumer._reportInterval[0] for consumer in node.consumers),
+                          min(consumer._reportInterval[1] for consumer in node.consumers))
+        if node.isSubscribed and (attributePaths, eventPaths, reportInterval) == \
+                (node.attributePaths, node.eventPaths, node.reportInterval):
+            return
+
+        subscription = await self._subscribe(nodeid, attributePaths, eventPaths, reportInterval)
+        subscription.SetAttributeUpdateCallback(node.HandleAttributeChange)
+        subscription.SetEventUpdateCallback(node.HandleEventChange)
+        subscription.SetErrorCallback(node.HandleError)
+        subscription._AddReportQueue(_ReportRouter(node))
+
+        previous, node.subscription = node.subscription, subscription
+        node.attributePaths, node.eventPaths, node.reportInterval = attributePaths, eventPaths, reportInterval
+        if previous is not None and previous is not node.failedSubscription:
+            previous.Shutdown()
@@ -16,4 +16,19 @@
 #
 
 from . import Attribute, CHIPClusters, Command, Objects  # noqa: F401
-from .Objects import *  # noqa: F401, F403
+
+# The generated clusters (chip.clusters.OnOff, ...) are imported from Objects on first access, see
+# Objects.__getattr__.
+__all__ = list(Objects.__all__)
+
+
+def __getattr__(name: str):
+    if name not in Objects.__all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(Objects, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,226 @@
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Commissioning of many devices in parallel.
+
+A controller commissions a single device at a time: its commissioning methods share one lock, and the commissioner of
+the SDK has a single device being commissioned. A CommissioningFarm runs several controllers of the same fabric, each
+with its own commissioner and pairing delegate, and hands the queued commissioning jobs to whichever is free:
+
+    farm = CommissioningFarm.from_fabric_admin(fabricAdmin, parallelism=8)
+    results = [farm.submit_code(code, node_id) for node_id, code in enumerate(setup_codes, start=1)]
+    await farm.join()
+    print(farm.stats)
+    await farm.shutdown()
+
+The commissioning of devices found with DNS-SD (submit_on_network) is not run in parallel: the SDK binding discovers
+them through a single discovery delegate and commissioning parameters shared by all the controllers of the process, so
+the farm runs one such job at a time, alongside the other jobs.
+'''
+
+import asyncio
+import dataclasses
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from chip import ChipDeviceCtrl, discovery
+
+LOGGER = logging.getLogger(__name__)
+
+# The stages of a commissioning job timed by the farm.
+STAGE_QUEUED = 'queued'
+STAGE_PASE = 'pase'
+STAGE_COMMISSIONING = 'commissioning'
+# Waiting for the other submit_on_network jobs, which run one at a time.
+STAGE_WAIT_ON_NETWORK = 'wait_on_network'
+
+
+@dataclasses.dataclass
+class CommissioningResult:
+    node_id: int
+    # The node id of the commissioned device, as assigned by its NOC, or None if the commissioning failed.
+    effective_node_id: Optional[int] = None
+    error: Optional[Exception] = None
+    # The node id of the controller which commissioned the device.
+    commissioner_node_id: Optional[int] = None
+    # Seconds spent in each stage, see STAGE_*.
+    stage_seconds: Dict[str, float] = dataclasses.field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclasses.dataclass
+class CommissioningFarmStats:
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    in_progress: int = 0
+    # Seconds since the first job was submitted.
+    elapsed_seconds: float = 0.0
+    # Completed jobs, successful or not, per minute since the first job was submitted.
+    throughput_per_minute: float = 0.0
+    # Mean seconds spent in each stage by the completed jobs.
+    mean_stage_seconds: Dict[str, float] = dataclasses.field(default_factory=dict)
+
+
+# Runs the stages of a job with a controller, recording their durations with the given callable.
+_Job = Callable[[ChipDeviceCtrl.ChipDeviceControllerBase, Callable[[str, float], None]], Awaitable[int]]
+
+
+@dataclasses.dataclass
+class _QueuedJob:
+    node_id: int
+    run: _Job
+    future: asyncio.Future
+    submitted: float
+
+
+class CommissioningFarm:
+    def __init__(self, controllers: List[ChipDeviceCtrl.ChipDeviceControllerBase], owns_controllers: bool = False):
+        ''' Runs commissioning jobs in parallel, one per controller at a time. The controllers must be on the same fabric
+            to commission the devices on it. With owns_controllers, they are shut down with the farm.
+        '''
+        if not controllers:
+            raise ValueError("A commissioning farm needs at least one controller")
+        self._controllers = list(controllers)
+        self._owns_controllers = owns_controllers
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._first_submitted: Optional[float] = None
+        self._stats = CommissioningFarmStats()
+        self._stage_totals: Dict[str, float] = {}
+        # Held by the submit_on_network jobs, see the module documentation.
+        self._on_network_lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def from_fabric_admin(cls, fabric_admin, parallelism: int, **kwargs) -> 'CommissioningFarm':
+        ''' Creates a farm of `parallelism` new controllers of the fabric of fabric_admin, which are shut down with it.
+            The other arguments are passed to FabricAdmin.NewController.
+        '''
+        return cls([fabric_admin.NewController(**kwargs) for _ in range(parallelism)], owns_controllers=True)
+
+    @property
+    def parallelism(self) -> int:
+        return len(self._controllers)
+
+    @property
+    def stats(self) -> CommissioningFarmStats:
+        stats = dataclasses.replace(self._stats, mean_stage_seconds={})
+        completed = stats.succeeded + stats.failed
+        if self._first_submitted is not None:
+            stats.elapsed_seconds = time.monotonic() - self._first_submitted
+            if stats.elapsed_seconds > 0:
+                stats.throughput_per_minute = completed * 60 / stats.elapsed_seconds
+        if completed:
+            stats.mean_stage_seconds = {stage: total / completed for stage, total in self._stage_totals.items()}
+        return stats
+
+    def submit(self, node_id: int, job: _Job) -> 'asyncio.Future[CommissioningResult]':
+        ''' Queues a commissioning job, which is given a controller and a callable to record the duration of its stages,
+            and returns the effective node id of the device. Returns a future of its CommissioningResult, which does not
+            raise when the commissioning fails.
+        '''
+        now = time.monotonic()
+        if self._first_submitted is None:
+            self._first_submitted = now
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker(controller)) for controller in self._controllers]
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_QueuedJob(node_id=node_id, run=job, future=future, submitted=now))
+        self._stats.submitted += 1
+        return future
+
+    def submit_code(self, setup_code: str, node_id: int) -> 'asyncio.Future[CommissioningResult]':
+        ''' Queues the commissioning of a device with its QR or manual setup code. '''
+        async def job(controller, record_stage):
+            start = time.monotonic()
+            await controller.EstablishPASESession(setup_code, node_id)
+            record_stage(STAGE_PASE, time.monotonic() - start)
+            start = time.monotonic()
+            effective_node_id = await controller.Commission(node_id)
+            record_stage(STAGE_COMMISSIONING, time.monotonic() - start)
+            return effective_node_id
+
+        return self.submit(node_id, job)
+
+    def submit_on_network(self, node_id: int, setup_pin_code: int,
+                          filter_type: discovery.FilterType = discovery.FilterType.NONE,
+                          filter=None) -> 'asyncio.Future[CommissioningResult]':
+        ''' Queues the commissioning of a device found with DNS-SD, see ChipDeviceController.CommissionOnNetwork.
+            These jobs run one at a time, since the discovery state of the SDK binding is shared by all the controllers.
+        '''
+        if self._on_network_lock is None:
+            self._on_network_lock = asyncio.Lock()
+        lock = self._on_network_lock
+
+        async def job(controller, record_stage):
+            start = time.monotonic()
+            async with lock:
+                record_stage(STAGE_WAIT_ON_NETWORK, time.monotonic() - start)
+                start = time.monotonic()
+                effective_node_id = await controller.CommissionOnNetwork(node_id, setup_pin_code, filter_type, filter)
+            record_stage(STAGE_COMMISSIONING, time.monotonic() - start)
+            return effective_node_id
+
+        return self.submit(node_id, job)
+
+    async def join(self):
+        ''' Waits for all the queued jobs to complete. '''
+        await self._queue.join()
+
+    async def shutdown(self):
+        ''' Cancels the queued jobs and stops the workers, then shuts the controllers down if the farm owns them. '''
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        while not self._queue.empty():
+            self._queue.get_nowait().future.cancel()
+            self._queue.task_done()
+        if self._owns_controllers:
+            for controller in self._controllers:
+                controller.Shutdown()
+
+    async def _worker(self, controller: ChipDeviceCtrl.ChipDeviceControllerBase):
+        while True:
+            queued = await self._queue.get()
+            result = CommissioningResult(node_id=queued.node_id, commissioner_node_id=controller.nodeId)
+            result.stage_seconds[STAGE_QUEUED] = time.monotonic() - queued.submitted
+            self._stats.in_progress += 1
+            try:
+                result.effective_node_id = await queued.run(controller, result.stage_seconds.__setitem__)
+                self._stats.succeeded += 1
+            except asyncio.CancelledError:
+                queued.future.cancel()
+                raise
+            except Exception as ex:
+                LOGGER.warning(f"Failed to commission node 0x{queued.node_id:016X}: {ex}")
+                result.error = ex
+                self._stats.failed += 1
+            finally:
+                self._stats.in_progress -= 1
+                self._queue.task_done()
+
+            for stage, seconds in result.stage_seconds.items():
+                self._stage_totals[stage] = self._stage_totals.get(stage, 0.0) + seconds
+            if not queued.future.done():
+                queued.future.set_result(result)
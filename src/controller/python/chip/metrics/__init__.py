@@ -0,0 +1,240 @@
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Instrumentation of the reads and subscriptions of a controller.
+
+Set a ReadMetricsHook on a controller with ChipDeviceControllerBase.SetReadMetrics() to be told the time spent in each
+phase of its reads and subscriptions (see ReadPhase), the amount of data decoded and the outcome of each interaction.
+ReadMetrics collects them into counters and latency histograms, globally and per node, and exports them in the
+Prometheus text exposition format or as JSON, without any other dependency:
+
+    metrics = ReadMetrics()
+    devCtrl.SetReadMetrics(metrics)
+    ...
+    print(metrics.PrometheusText())
+'''
+
+import bisect
+import enum
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple
+
+
+class ReadPhase(enum.Enum):
+    # Getting a session with the node (GetConnectedDevice).
+    SESSION = 'session'
+    # From the request to the response of a read, or to the establishment of a subscription. Includes the decoding of
+    # the data, which happens on the Matter thread as the reports arrive.
+    ROUND_TRIP = 'round_trip'
+    # Decoding the TLV of an attribute or event.
+    DECODE = 'decode'
+    # Building the attribute values returned by a read, or by SubscriptionTransaction.GetAttributes().
+    CACHE = 'cache'
+    # Running the attribute and event change callbacks of a subscription.
+    CALLBACK = 'callback'
+
+
+class ReadMetricsHook:
+    ''' Receives the measurements of the reads and subscriptions of a controller. The methods do nothing, override the
+        ones of interest.
+
+        OnPhase and OnDecoded are called on the Matter thread as well as on the event loop.
+    '''
+
+    def OnPhase(self, nodeId: int, phase: ReadPhase, seconds: float):
+        ''' A phase of a read or subscription of the node took `seconds`. '''
+        pass
+
+    def OnDecoded(self, nodeId: int, kind: str, elements: int, size: int):
+        ''' `elements` attributes or events (kind 'attribute' or 'event') of `size` bytes of TLV were decoded. '''
+        pass
+
+    def OnTransaction(self, nodeId: int, interaction: str, succeeded: bool):
+        ''' A read or subscription (interaction 'read' or 'subscribe') of the node completed. '''
+        pass
+
+
+# In seconds, from the sub-millisecond decoding of an attribute to the session establishment with a sleepy device.
+DEFAULT_LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+                           5.0, 10.0, 30.0)
+
+
+class Histogram:
+    ''' A histogram of observations with fixed bucket upper bounds, as exported to Prometheus. '''
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # The number of observations in each bucket, not cumulative, the last one being above the highest bound.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def Observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def CumulativeCounts(self) -> List[Tuple[float, int]]:
+        ''' Returns (upper bound, number of observations up to it) of each bucket, ending with (inf, count). '''
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+@dataclass
+class _NodeMetrics:
+    # (count, total seconds) of each phase.
+    phases: Dict[ReadPhase, List[float]] = field(default_factory=dict)
+    # (elements, bytes) decoded of each kind.
+    decoded: Dict[str, List[int]] = field(default_factory=dict)
+    # Count of the transactions by (interaction, outcome).
+    transactions: Dict[Tuple[str, str], int] = field(default_factory=dict)
+
+
+def _Outcome(succeeded: bool) -> str:
+    return 'success' if succeeded else 'failure'
+
+
+def _Labels(**labels) -> str:
+    return ','.join(f'{name}="{value}"' for name, value in labels.items())
+
+
+def _FormatValue(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class ReadMetrics(ReadMetricsHook):
+    ''' Collects the measurements of the reads and subscriptions of a controller into counters and latency histograms
+        per phase, with a per node breakdown of the counters.
+    '''
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.Reset()
+
+    def Reset(self):
+        with self._lock:
+            self._phases: Dict[ReadPhase, Histogram] = {}
+            self._decoded: Dict[str, List[int]] = {}
+            self._transactions: Dict[Tuple[str, str], int] = {}
+            self._nodes: Dict[int, _NodeMetrics] = {}
+
+    def _Node(self, nodeId: int) -> _NodeMetrics:
+        node = self._nodes.get(nodeId)
+        if node is None:
+            node = self._nodes[nodeId] = _NodeMetrics()
+        return node
+
+    def OnPhase(self, nodeId: int, phase: ReadPhase, seconds: float):
+        with self._lock:
+            histogram = self._phases.get(phase)
+            if histogram is None:
+                histogram = self._phases[phase] = Histogram(self._buckets)
+            histogram.Observe(seconds)
+            total = self._Node(nodeId).phases.setdefault(phase, [0, 0.0])
+            total[0] += 1
+            total[1] += seconds
+
+    def OnDecoded(self, nodeId: int, kind: str, elements: int, size: int):
+        with self._lock:
+            for decoded in (self._decoded.setdefault(kind, [0, 0]), self._Node(nodeId).decoded.setdefault(kind, [0, 0])):
+                decoded[0] += elements
+                decoded[1] += size
+
+    def OnTransaction(self, nodeId: int, interaction: str, succeeded: bool):
+        key = (interaction, _Outcome(succeeded))
+        with self._lock:
+            self._transactions[key] = self._transactions.get(key, 0) + 1
+            transactions = self._Node(nodeId).transactions
+            transactions[key] = transactions.get(key, 0) + 1
+
+    def Snapshot(self) -> Dict[str, Any]:
+        ''' Returns the collected metrics as a JSON serializable dict. '''
+        with self._lock:
+            return {
+                'phases': {phase.value: {
+                    'count': histogram.count,
+                    'sum': histogram.sum,
+                    'buckets': [[None if bound == float('inf') else bound, count]
+                                for bound, count in histogram.CumulativeCounts()],
+                } for phase, histogram in self._phases.items()},
+                'decoded': {kind: {'elements': elements, 'bytes': size} for kind, (elements, size) in self._decoded.items()},
+                'transactions': [{'interaction': interaction, 'outcome': outcome, 'count': count}
+                                 for (interaction, outcome), count in self._transactions.items()],
+                'nodes': {f'0x{nodeId:016X}': {
+                    'phases': {phase.value: {'count': count, 'sum': total} for phase, (count, total) in node.phases.items()},
+                    'decoded': {kind: {'elements': elements, 'bytes': size} for kind, (elements, size) in node.decoded.items()},
+                    'transactions': [{'interaction': interaction, 'outcome': outcome, 'count': count}
+                                     for (interaction, outcome), count in node.transactions.items()],
+                } for nodeId, node in self._nodes.items()},
+            }
+
+    def Json(self, indent=None) -> str:
+        ''' Returns the collected metrics as a JSON document, see Snapshot(). '''
+        return json.dumps(self.Snapshot(), indent=indent)
+
+    def PrometheusText(self, prefix: str = 'chip_read') -> str:
+        ''' Returns the collected metrics in the Prometheus text exposition format, e.g. to be served by an HTTP
+            endpoint or written for the node exporter textfile collector.
+        '''
+        lines = []
+
+        def metric(name: str, metricType: str, helpText: str, samples: List[Tuple[str, str, float]]):
+            if not samples:
+                return
+            lines.append(f'# HELP {prefix}_{name} {helpText}')
+            lines.append(f'# TYPE {prefix}_{name} {metricType}')
+            lines.extend(f'{prefix}_{name}{suffix}{{{labels}}} {_FormatValue(value)}' for suffix, labels, value in samples)
+
+        with self._lock:
+            samples = []
+            for phase, histogram in self._phases.items():
+                for bound, count in histogram.CumulativeCounts():
+                    samples.append(('_bucket', _Labels(phase=phase.value, le=_FormatValue(bound)), count))
+                samples.append(('_sum', _Labels(phase=phase.value), histogram.sum))
+                samples.append(('_count', _Labels(phase=phase.value), histogram.count))
+            metric('phase_seconds', 'histogram', 'Time spent in each phase of reads and subscriptions.', samples)
+
+            metric('transactions_total', 'counter', 'Completed reads and subscriptions.',
+                   [('', _Labels(interaction=interaction, outcome=outcome), count)
+                    for (interaction, outcome), count in self._transactions.items()])
+            metric('decoded_elements_total', 'counter', 'Decoded attributes and events.',
+                   [('', _Labels(kind=kind), elements) for kind, (elements, _) in self._decoded.items()])
+            metric('decoded_bytes_total', 'counter', 'Bytes of TLV of the decoded attributes and events.',
+                   [('', _Labels(kind=kind), size) for kind, (_, size) in self._decoded.items()])
+
+            nodes = sorted(self._nodes.items())
+            metric('node_phase_seconds_total', 'counter', 'Time spent in each phase, per node.',
+                   [('', _Labels(node=f'0x{nodeId:016X}', phase=phase.value), total)
+                    for nodeId, node in nodes for phase, (_, total) in node.phases.items()])
+            metric('node_transactions_total', 'counter', 'Completed reads and subscriptions, per node.',
+                   [('', _Labels(node=f'0x{nodeId:016X}', interaction=interaction, outcome=outcome), count)
+                    for nodeId, node in nodes for (interaction, outcome), count in node.transactions.items()])
+            metric('node_decoded_bytes_total', 'counter', 'Bytes of TLV of the decoded attributes and events, per node.',
+                   [('', _Labels(node=f'0x{nodeId:016X}', kind=kind), size)
+                    for nodeId, node in nodes for kind, (_, size) in node.decoded.items()])
+
+        return '\n'.join(lines) + '\n' if lines else ''
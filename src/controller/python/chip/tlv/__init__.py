@@ -27,8 +27,8 @@
 
 from __future__ import absolute_import, print_function
 
+import functools
 import struct
-from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from enum import Enum
 
@@ -137,6 +137,70 @@ class float32(float):
     pass
 
 
+_SIGNED_INT_STRUCTS = (struct.Struct("<b"), struct.Struct("<h"), struct.Struct("<l"), struct.Struct("<q"))
+_UNSIGNED_INT_STRUCTS = (struct.Struct("<B"), struct.Struct("<H"), struct.Struct("<L"), struct.Struct("<Q"))
+_FLOAT_STRUCT = struct.Struct("<f")
+_DOUBLE_STRUCT = struct.Struct("<d")
+
+# Lower bits of the control byte selecting the width of a value or length, indexed by that width in bytes.
+_WIDTH_BITS = {0: 0, 1: 0, 2: 1, 4: 2, 8: 3}
+
+
+def _signedIntWidth(val):
+    ''' Returns the index in _SIGNED_INT_STRUCTS of the smallest encoding able to hold val. '''
+    if val >= INT8_MIN and val <= INT8_MAX:
+        return 0
+    if val >= INT16_MIN and val <= INT16_MAX:
+        return 1
+    if val >= INT32_MIN and val <= INT32_MAX:
+        return 2
+    if val >= INT64_MIN and val <= INT64_MAX:
+        return 3
+    raise ValueError("Integer value out of range")
+
+
+def _unsignedIntWidth(val):
+    ''' Returns the index in _UNSIGNED_INT_STRUCTS of the smallest encoding able to hold val. '''
+    if val < 0:
+        raise ValueError("Integer value out of range")
+    if val <= UINT8_MAX:
+        return 0
+    if val <= UINT16_MAX:
+        return 1
+    if val <= UINT32_MAX:
+        return 2
+    if val <= UINT64_MAX:
+        return 3
+    raise ValueError("Integer value out of range")
+
+
+@functools.lru_cache(maxsize=4096)
+def _encodeControlAndContextTag(controlByte, tag, containerType):
+    ''' Returns the control byte and tag bytes of an element with an anonymous (None) or context
+        specific (int) tag written inside a container of type containerType (None at the top level).
+
+        The result only depends on the arguments, so it is cached: encoders mostly write the same
+        few context tags over and over.
+    '''
+    if tag is None:
+        if controlByte != TLVEndOfContainer and containerType == TLV_TYPE_STRUCTURE:
+            raise ValueError(
+                "Attempt to encode anonymous tag within TLV structure")
+        return bytes((controlByte | TLV_TAG_CONTROL_ANONYMOUS,))
+    if tag < 0 or tag > UINT8_MAX:
+        raise ValueError(
+            "Context-specific TLV tag number out of range")
+    if containerType is None:
+        raise ValueError(
+            "Attempt to encode context-specific TLV tag at top level"
+        )
+    if containerType == TLV_TYPE_ARRAY:
+        raise ValueError(
+            "Attempt to encode context-specific tag within TLV array"
+        )
+    return bytes((controlByte | TLV_TAG_CONTROL_CONTEXT_SPECIFIC, tag))
+
+
 class TLVWriter(object):
     def __init__(self, encoding=None, implicitProfile=None):
         self._encoding = encoding if encoding is not None else bytearray()
@@ -172,6 +236,15 @@ class TLVWriter(object):
     def implicitProfile(self, val):
         self._implicitProfile = val
 
+    def reset(self):
+        """Discard the data written so far so that the writer can be reused for a new encoding.
+
+        The encoding object is kept and emptied in place, so a copy of it must be taken
+        beforehand if the previous encoding is still needed.
+        """
+        del self._encoding[:]
+        self._containerStack.clear()
+
     def put(self, tag, val):
         """Write a value in TLV format with the specified TLV tag.
 
@@ -197,113 +270,153 @@ class TLVWriter(object):
         If tag is a two-integer tuple, it is encoded as a TLV profile-specific tag, with
           the first integer encoded as the profile id and the second as the tag number.
         If tag is None, it is encoded as a TLV anonymous tag.
+
+        Nothing is written when the value cannot be encoded.
         """
-        if val is None:
-            self.putNull(tag)
-        elif isinstance(val, Enum):
-            self.putUnsignedInt(tag, val)
+        containerType = self._containerStack[-1] if self._containerStack else None
+        encoding = self._encoding
+        if not isinstance(encoding, bytearray):
+            buffer = bytearray()
+            self._encodeElement(buffer, tag, val, containerType)
+            encoding.extend(buffer)
+            return
+        start = len(encoding)
+        try:
+            self._encodeElement(encoding, tag, val, containerType)
+        except Exception:
+            del encoding[start:]
+            raise
+
+    def encodedSize(self, tag, val):
+        """Return the number of bytes put(tag, val) would write, without writing anything.
+
+        This goes through the same checks as put() and raises the same errors, which makes it
+        suitable for validating a value or checking it fits in a given payload size up front.
+        """
+        containerType = self._containerStack[-1] if self._containerStack else None
+        return self._encodeElement(None, tag, val, containerType)
+
+    def _encodeElement(self, encoding, tag, val, containerType):
+        """Append the encoding of val to encoding and return the encoded size in bytes.
+
+        When encoding is None, nothing is written: the same checks are done and only the
+        encoded size is computed.
+        """
+        valueStruct = None
+        # Exact type checks first, they are the common case and much cheaper than isinstance().
+        valueClass = val.__class__
+        if valueClass is int:
+            width = _signedIntWidth(val)
+            controlByte = TLV_TYPE_SIGNED_INTEGER | width
+            valueStruct = _SIGNED_INT_STRUCTS[width]
+        elif valueClass is uint:
+            width = _unsignedIntWidth(val)
+            controlByte = TLV_TYPE_UNSIGNED_INTEGER | width
+            valueStruct = _UNSIGNED_INT_STRUCTS[width]
+        elif val is None:
+            controlByte = TLV_TYPE_NULL
+        elif isinstance(val, (Enum, uint)):
+            width = _unsignedIntWidth(val)
+            controlByte = TLV_TYPE_UNSIGNED_INTEGER | width
+            valueStruct = _UNSIGNED_INT_STRUCTS[width]
         elif isinstance(val, bool):
-            self.putBool(tag, val)
-        elif isinstance(val, uint):
-            self.putUnsignedInt(tag, val)
+            controlByte = TLVBoolean_True if val else TLVBoolean_False
         elif isinstance(val, int):
-            self.putSignedInt(tag, val)
+            width = _signedIntWidth(val)
+            controlByte = TLV_TYPE_SIGNED_INTEGER | width
+            valueStruct = _SIGNED_INT_STRUCTS[width]
         elif isinstance(val, float32):
-            self.putFloat(tag, val)
+            controlByte = TLV_TYPE_FLOATING_POINT_NUMBER
+            valueStruct = _FLOAT_STRUCT
         elif isinstance(val, float):
-            self.putDouble(tag, val)
+            controlByte = TLV_TYPE_FLOATING_POINT_NUMBER | 1
+            valueStruct = _DOUBLE_STRUCT
         elif isinstance(val, str):
-            self.putString(tag, val)
-        elif isinstance(val, bytes) or isinstance(val, bytearray):
-            self.putBytes(tag, val)
+            if encoding is None and val.isascii():
+                return self._encodeString(None, TLV_TYPE_UTF8_STRING, tag, val, len(val), containerType)
+            val = val.encode("utf-8")
+            return self._encodeString(encoding, TLV_TYPE_UTF8_STRING, tag, val, len(val), containerType)
+        elif isinstance(val, (bytes, bytearray)):
+            return self._encodeString(encoding, TLV_TYPE_BYTE_STRING, tag, val, len(val), containerType)
         elif isinstance(val, Mapping):
-            self.startStructure(tag)
+            size = self._encodeHeader(encoding, TLV_TYPE_STRUCTURE, tag, containerType)
+            items = val.items()
             if type(val) is dict:
-                val = OrderedDict(
-                    sorted(val.items(),
-                           key=lambda item: tlvTagToSortKey(item[0]))
-                )
-            for containedTag, containedVal in val.items():
-                self.put(containedTag, containedVal)
-            self.endContainer()
+                items = sorted(items, key=lambda item: tlvTagToSortKey(item[0]))
+            for containedTag, containedVal in items:
+                size += self._encodeElement(encoding, containedTag, containedVal, TLV_TYPE_STRUCTURE)
+            return size + self._encodeHeader(encoding, TLVEndOfContainer, None, TLV_TYPE_STRUCTURE)
         elif isinstance(val, TLVList):
-            self.startPath(tag)
+            size = self._encodeHeader(encoding, TLV_TYPE_PATH, tag, containerType)
             for containedTag, containedVal in val:
-                self.put(containedTag, containedVal)
-            self.endContainer()
+                size += self._encodeElement(encoding, containedTag, containedVal, TLV_TYPE_PATH)
+            return size + self._encodeHeader(encoding, TLVEndOfContainer, None, TLV_TYPE_PATH)
         elif isinstance(val, Sequence):
-            self.startArray(tag)
+            size = self._encodeHeader(encoding, TLV_TYPE_ARRAY, tag, containerType)
             for containedVal in val:
-                self.put(None, containedVal)
-            self.endContainer()
+                size += self._encodeElement(encoding, None, containedVal, TLV_TYPE_ARRAY)
+            return size + self._encodeHeader(encoding, TLVEndOfContainer, None, TLV_TYPE_ARRAY)
         else:
             raise ValueError("Attempt to TLV encode unsupported value")
 
+        if tag is None or tag.__class__ is int:
+            header = _encodeControlAndContextTag(controlByte, tag, containerType)
+        else:
+            header = self._controlAndTag(controlByte, tag, containerType)
+        if valueStruct is None:
+            if encoding is not None:
+                encoding += header
+            return len(header)
+        if encoding is not None:
+            encoding += header
+            encoding += valueStruct.pack(val)
+        return len(header) + valueStruct.size
+
+    def _encodeHeader(self, encoding, controlByte, tag, containerType):
+        header = self._controlAndTag(controlByte, tag, containerType)
+        if encoding is not None:
+            encoding += header
+        return len(header)
+
+    def _encodeString(self, encoding, type, tag, val, length, containerType):
+        width = _unsignedIntWidth(length)
+        size = self._encodeHeader(encoding, type | width, tag, containerType)
+        lengthStruct = _UNSIGNED_INT_STRUCTS[width]
+        if encoding is not None:
+            encoding += lengthStruct.pack(length)
+            encoding += val
+        return size + lengthStruct.size + length
+
+    def _writeHeaderAndValue(self, type, tag, valueStruct, val):
+        encoding = self._encoding
+        encoding.extend(self._encodeControlAndTag(type, tag, lenOfLenOrVal=valueStruct.size))
+        encoding.extend(valueStruct.pack(val))
+
     def putSignedInt(self, tag, val):
         """Write a value as a TLV signed integer with the specified TLV tag."""
-        if val >= INT8_MIN and val <= INT8_MAX:
-            format = "<b"
-        elif val >= INT16_MIN and val <= INT16_MAX:
-            format = "<h"
-        elif val >= INT32_MIN and val <= INT32_MAX:
-            format = "<l"
-        elif val >= INT64_MIN and val <= INT64_MAX:
-            format = "<q"
-        else:
-            raise ValueError("Integer value out of range")
-        val = struct.pack(format, val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_SIGNED_INTEGER, tag, lenOfLenOrVal=len(val)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        self._writeHeaderAndValue(TLV_TYPE_SIGNED_INTEGER, tag, _SIGNED_INT_STRUCTS[_signedIntWidth(val)], val)
 
     def putUnsignedInt(self, tag, val):
         """Write a value as a TLV unsigned integer with the specified TLV tag."""
-        val = self._encodeUnsignedInt(val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_UNSIGNED_INTEGER, tag, lenOfLenOrVal=len(val)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        self._writeHeaderAndValue(TLV_TYPE_UNSIGNED_INTEGER, tag, _UNSIGNED_INT_STRUCTS[_unsignedIntWidth(val)], val)
 
     def putFloat(self, tag, val):
         """Write a value as a TLV float with the specified TLV tag."""
-        val = struct.pack("f", val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=len(val)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        self._writeHeaderAndValue(TLV_TYPE_FLOATING_POINT_NUMBER, tag, _FLOAT_STRUCT, val)
 
     def putDouble(self, tag, val):
         """Write a value as a TLV double with the specified TLV tag."""
-        val = struct.pack("d", val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=len(val)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        self._writeHeaderAndValue(TLV_TYPE_FLOATING_POINT_NUMBER, tag, _DOUBLE_STRUCT, val)
 
     def putString(self, tag, val):
         """Write a value as a TLV string with the specified TLV tag."""
         val = val.encode("utf-8")
-        valLen = self._encodeUnsignedInt(len(val))
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_UTF8_STRING, tag, lenOfLenOrVal=len(valLen)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(valLen)
+        self._writeHeaderAndValue(TLV_TYPE_UTF8_STRING, tag, _UNSIGNED_INT_STRUCTS[_unsignedIntWidth(len(val))], len(val))
         self._encoding.extend(val)
 
     def putBytes(self, tag, val):
         """Write a value as a TLV byte string with the specified TLV tag."""
-        valLen = self._encodeUnsignedInt(len(val))
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_BYTE_STRING, tag, lenOfLenOrVal=len(valLen)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(valLen)
+        self._writeHeaderAndValue(TLV_TYPE_BYTE_STRING, tag, _UNSIGNED_INT_STRUCTS[_unsignedIntWidth(len(val))], len(val))
         self._encoding.extend(val)
 
     def putBool(self, tag, val):
@@ -329,7 +442,7 @@ class TLVWriter(object):
         self._verifyValidContainerType(containerType)
         controlAndTag = self._encodeControlAndTag(containerType, tag)
         self._encoding.extend(controlAndTag)
-        self._containerStack.insert(0, containerType)
+        self._containerStack.append(containerType)
 
     def startStructure(self, tag):
         """Start writing a TLV structure with the specified TLV tag."""
@@ -345,42 +458,20 @@ class TLVWriter(object):
 
     def endContainer(self):
         """End writing the current TLV container."""
-        self._containerStack.pop(0)
+        self._containerStack.pop()
         controlAndTag = self._encodeControlAndTag(TLVEndOfContainer, None)
         self._encoding.extend(controlAndTag)
 
     def _encodeControlAndTag(self, type, tag, lenOfLenOrVal=0):
-        controlByte = type
-        if lenOfLenOrVal == 2:
-            controlByte |= 1
-        elif lenOfLenOrVal == 4:
-            controlByte |= 2
-        elif lenOfLenOrVal == 8:
-            controlByte |= 3
-        if tag is None:
-            if (
-                type != TLVEndOfContainer
-                and len(self._containerStack) != 0
-                and self._containerStack[0] == TLV_TYPE_STRUCTURE
-            ):
-                raise ValueError(
-                    "Attempt to encode anonymous tag within TLV structure")
-            controlByte |= TLV_TAG_CONTROL_ANONYMOUS
-            return struct.pack("<B", controlByte)
+        containerType = self._containerStack[-1] if self._containerStack else None
+        return self._controlAndTag(type | _WIDTH_BITS[lenOfLenOrVal], tag, containerType)
+
+    def _controlAndTag(self, controlByte, tag, containerType):
+        if tag is None or tag.__class__ is int:
+            return _encodeControlAndContextTag(controlByte, tag, containerType)
         if isinstance(tag, int):
-            if tag < 0 or tag > UINT8_MAX:
-                raise ValueError(
-                    "Context-specific TLV tag number out of range")
-            if len(self._containerStack) == 0:
-                raise ValueError(
-                    "Attempt to encode context-specific TLV tag at top level"
-                )
-            if self._containerStack[0] == TLV_TYPE_ARRAY:
-                raise ValueError(
-                    "Attempt to encode context-specific tag within TLV array"
-                )
-            controlByte |= TLV_TAG_CONTROL_CONTEXT_SPECIFIC
-            return struct.pack("<BB", controlByte, tag)
+            # int subclasses (e.g. enums) are not cached, they could collide with other keys.
+            return _encodeControlAndContextTag.__wrapped__(controlByte, int(tag), containerType)
         if isinstance(tag, tuple):
             (profile, tagNum) = tag
             if not isinstance(tagNum, int):
@@ -392,10 +483,7 @@ class TLVWriter(object):
                     raise ValueError("Invalid object given for TLV profile id")
                 if profile < 0 or profile > UINT32_MAX:
                     raise ValueError("TLV profile id value out of range")
-            if (
-                len(self._containerStack) != 0
-                and self._containerStack[0] == TLV_TYPE_ARRAY
-            ):
+            if containerType == TLV_TYPE_ARRAY:
                 raise ValueError(
                     "Attempt to encode profile-specific tag within TLV array"
                 )
@@ -421,24 +509,12 @@ class TLVWriter(object):
                     return struct.pack("<BHHH", controlByte, vendorId, profileNum, tagNum)
                 else:
                     controlByte |= TLV_TAG_CONTROL_FULLY_QUALIFIED_8Bytes
-                    return struct.pack("<BHHL", controlByte, vendorId, profileNum, profile, tagNum)
+                    return struct.pack("<BHHL", controlByte, vendorId, profileNum, tagNum)
         raise ValueError("Invalid object given for TLV tag")
 
     @staticmethod
     def _encodeUnsignedInt(val):
-        if val < 0:
-            raise ValueError("Integer value out of range")
-        if val <= UINT8_MAX:
-            format = "<B"
-        elif val <= UINT16_MAX:
-            format = "<H"
-        elif val <= UINT32_MAX:
-            format = "<L"
-        elif val <= UINT64_MAX:
-            format = "<Q"
-        else:
-            raise ValueError("Integer value out of range")
-        return struct.pack(format, val)
+        return _UNSIGNED_INT_STRUCTS[_unsignedIntWidth(val)].pack(val)
 
     @staticmethod
     def _verifyValidContainerType(containerType):
@@ -450,20 +526,529 @@ class TLVWriter(object):
             raise ValueError("Invalid TLV container type")
 
 
+# Value kinds used by the control byte lookup table below.
+_VALUE_KIND_SCALAR = 0
+_VALUE_KIND_CONSTANT = 1
+_VALUE_KIND_UTF8_STRING = 2
+_VALUE_KIND_BYTE_STRING = 3
+_VALUE_KIND_CONTAINER = 4
+_VALUE_KIND_END_OF_CONTAINER = 5
+
+# Tag kinds used by the control byte lookup table below.
+_TAG_KIND_ANONYMOUS = 0
+_TAG_KIND_CONTEXT = 1
+_TAG_KIND_PROFILE = 2
+_TAG_KIND_FULLY_QUALIFIED = 3
+
+_LENGTH_STRUCTS = (struct.Struct("<B"), struct.Struct("<H"), struct.Struct("<L"), struct.Struct("<Q"))
+
+# Constructs a uint without going through uint.__init__, decoded unsigned values are never negative.
+_newUint = functools.partial(int.__new__, uint)
+
+
+def _buildElementTypeTable():
+    ''' Returns a list indexed by element type (the lower 5 bits of the control byte) holding
+        (valueKind, valueStruct, valueArg) tuples, or None for reserved element types.
+    '''
+    table = [None] * 0x20
+    for index, fmt in enumerate(("<b", "<h", "<l", "<q")):
+        table[TLV_TYPE_SIGNED_INTEGER + index] = (_VALUE_KIND_SCALAR, struct.Struct(fmt), None)
+    for index, fmt in enumerate(("<B", "<H", "<L", "<Q")):
+        table[TLV_TYPE_UNSIGNED_INTEGER + index] = (_VALUE_KIND_SCALAR, struct.Struct(fmt), _newUint)
+    table[TLVBoolean_False] = (_VALUE_KIND_CONSTANT, None, False)
+    table[TLVBoolean_True] = (_VALUE_KIND_CONSTANT, None, True)
+    table[TLV_TYPE_FLOATING_POINT_NUMBER] = (_VALUE_KIND_SCALAR, struct.Struct("<f"), float32)
+    table[TLV_TYPE_FLOATING_POINT_NUMBER + 1] = (_VALUE_KIND_SCALAR, struct.Struct("<d"), None)
+    for index, lengthStruct in enumerate(_LENGTH_STRUCTS):
+        table[TLV_TYPE_UTF8_STRING + index] = (_VALUE_KIND_UTF8_STRING, lengthStruct, None)
+        table[TLV_TYPE_BYTE_STRING + index] = (_VALUE_KIND_BYTE_STRING, lengthStruct, None)
+    table[TLV_TYPE_NULL] = (_VALUE_KIND_CONSTANT, None, None)
+    table[TLV_TYPE_STRUCTURE] = (_VALUE_KIND_CONTAINER, None, dict)
+    table[TLV_TYPE_ARRAY] = (_VALUE_KIND_CONTAINER, None, list)
+    table[TLV_TYPE_PATH] = (_VALUE_KIND_CONTAINER, None, TLVList)
+    table[TLVEndOfContainer] = (_VALUE_KIND_END_OF_CONTAINER, None, None)
+    return table
+
+
+def _buildControlByteTable():
+    ''' Returns a list indexed by the raw control byte holding
+        (tagKind, tagStruct, profile, valueKind, valueStruct, valueArg) tuples, or None when the
+        control byte encodes a reserved element type.
+    '''
+    tagControls = {
+        TLV_TAG_CONTROL_ANONYMOUS: (_TAG_KIND_ANONYMOUS, None, None),
+        TLV_TAG_CONTROL_CONTEXT_SPECIFIC: (_TAG_KIND_CONTEXT, None, None),
+        TLV_TAG_CONTROL_COMMON_PROFILE_2Bytes: (_TAG_KIND_PROFILE, struct.Struct("<H"), 0),
+        TLV_TAG_CONTROL_COMMON_PROFILE_4Bytes: (_TAG_KIND_PROFILE, struct.Struct("<L"), 0),
+        TLV_TAG_CONTROL_IMPLICIT_PROFILE_2Bytes: (_TAG_KIND_PROFILE, struct.Struct("<H"), None),
+        TLV_TAG_CONTROL_IMPLICIT_PROFILE_4Bytes: (_TAG_KIND_PROFILE, struct.Struct("<L"), None),
+        TLV_TAG_CONTROL_FULLY_QUALIFIED_6Bytes: (_TAG_KIND_FULLY_QUALIFIED, struct.Struct("<HHH"), None),
+        TLV_TAG_CONTROL_FULLY_QUALIFIED_8Bytes: (_TAG_KIND_FULLY_QUALIFIED, struct.Struct("<HHL"), None),
+    }
+    elementTypes = _buildElementTypeTable()
+    table = []
+    for controlByte in range(0x100):
+        elementType = elementTypes[controlByte & 0x1F]
+        if elementType is None:
+            table.append(None)
+        else:
+            table.append(tagControls[controlByte & 0xE0] + elementType)
+    return table
+
+
+_CONTROL_BYTE_TABLE = _buildControlByteTable()
+
+
+def _decodeElements(tlv, offset, out):
+    ''' Decodes the elements starting at offset into out, stopping at the end of the current
+        container or of the data. Returns the offset following the last decoded element.
+    '''
+    controlByteTable = _CONTROL_BYTE_TABLE
+    end = len(tlv)
+    isStructure = type(out) is dict
+    isPath = type(out) is TLVList
+
+    while offset < end:
+        entry = controlByteTable[tlv[offset]]
+        if entry is None:
+            raise ValueError("Attempt to decode unsupported TLV type")
+        tagKind, tagStruct, profile, valueKind, valueStruct, valueArg = entry
+        offset += 1
+
+        if tagKind == _TAG_KIND_ANONYMOUS:
+            tag = None
+        elif tagKind == _TAG_KIND_CONTEXT:
+            tag = tlv[offset]
+            offset += 1
+        elif tagKind == _TAG_KIND_PROFILE:
+            (tagNum,) = tagStruct.unpack_from(tlv, offset)
+            offset += tagStruct.size
+            tag = (profile, tagNum)
+        else:
+            (vendorId, profileNum, tagNum) = tagStruct.unpack_from(tlv, offset)
+            offset += tagStruct.size
+            tag = ((vendorId << 16) | profileNum, tagNum)
+
+        if valueKind == _VALUE_KIND_SCALAR:
+            (value,) = valueStruct.unpack_from(tlv, offset)
+            offset += valueStruct.size
+            if valueArg is not None:
+                value = valueArg(value)
+        elif valueKind == _VALUE_KIND_CONSTANT:
+            value = valueArg
+        elif valueKind == _VALUE_KIND_CONTAINER:
+            value = valueArg()
+            offset = _decodeElements(tlv, offset, value)
+        elif valueKind == _VALUE_KIND_END_OF_CONTAINER:
+            return offset
+        else:
+            (length,) = valueStruct.unpack_from(tlv, offset)
+            offset += valueStruct.size
+            valueEnd = offset + length
+            if valueEnd > end:
+                raise ValueError("TLV string length exceeds the remaining data")
+            value = bytes(tlv[offset:valueEnd])
+            offset = valueEnd
+            if valueKind == _VALUE_KIND_UTF8_STRING:
+                try:
+                    value = str(value, "utf-8")
+                except UnicodeDecodeError:
+                    pass
+
+        if isStructure:
+            out["Any" if tag is None else tag] = value
+        elif isPath:
+            out.append(tag, value)
+        else:
+            out.append(value)
+
+    return offset
+
+
+def _readElementHeader(tlv, offset):
+    ''' Decodes the control byte and the tag of the element at offset.
+
+        Returns (entry, tag, offset) where entry is the control byte table entry of the element and
+        offset points right after the tag, i.e. at the value (or length field) of the element.
+    '''
+    entry = _CONTROL_BYTE_TABLE[tlv[offset]]
+    if entry is None:
+        raise ValueError("Attempt to decode unsupported TLV type")
+    tagKind, tagStruct, profile = entry[0], entry[1], entry[2]
+    offset += 1
+    if tagKind == _TAG_KIND_ANONYMOUS:
+        return entry, None, offset
+    if tagKind == _TAG_KIND_CONTEXT:
+        return entry, tlv[offset], offset + 1
+    if tagKind == _TAG_KIND_PROFILE:
+        (tagNum,) = tagStruct.unpack_from(tlv, offset)
+        return entry, (profile, tagNum), offset + tagStruct.size
+    (vendorId, profileNum, tagNum) = tagStruct.unpack_from(tlv, offset)
+    return entry, ((vendorId << 16) | profileNum, tagNum), offset + tagStruct.size
+
+
+def _readPrimitiveValue(tlv, offset, entry):
+    ''' Decodes the value of a non container element whose value (or length field) starts at offset.
+
+        Returns (value, offset) where offset points right after the element.
+    '''
+    valueKind, valueStruct, valueArg = entry[3], entry[4], entry[5]
+    if valueKind == _VALUE_KIND_SCALAR:
+        (value,) = valueStruct.unpack_from(tlv, offset)
+        return (value if valueArg is None else valueArg(value)), offset + valueStruct.size
+    if valueKind == _VALUE_KIND_CONSTANT:
+        return valueArg, offset
+    (length,) = valueStruct.unpack_from(tlv, offset)
+    offset += valueStruct.size
+    valueEnd = offset + length
+    if valueEnd > len(tlv):
+        raise ValueError("TLV string length exceeds the remaining data")
+    value = bytes(tlv[offset:valueEnd])
+    if valueKind == _VALUE_KIND_UTF8_STRING:
+        try:
+            value = str(value, "utf-8")
+        except UnicodeDecodeError:
+            pass
+    return value, valueEnd
+
+
+def _buildElementSizeTable():
+    ''' Returns a list indexed by the raw control byte holding (fixedSize, lengthStruct, depthChange)
+        tuples used to step over elements without decoding them, or None for reserved element types.
+
+        fixedSize covers the control byte, the tag and either the value or the length field of strings,
+        in which case lengthStruct decodes the number of bytes that follow.
+    '''
+    tagSizes = {
+        TLV_TAG_CONTROL_ANONYMOUS: 0,
+        TLV_TAG_CONTROL_CONTEXT_SPECIFIC: 1,
+        TLV_TAG_CONTROL_COMMON_PROFILE_2Bytes: 2,
+        TLV_TAG_CONTROL_COMMON_PROFILE_4Bytes: 4,
+        TLV_TAG_CONTROL_IMPLICIT_PROFILE_2Bytes: 2,
+        TLV_TAG_CONTROL_IMPLICIT_PROFILE_4Bytes: 4,
+        TLV_TAG_CONTROL_FULLY_QUALIFIED_6Bytes: 6,
+        TLV_TAG_CONTROL_FULLY_QUALIFIED_8Bytes: 8,
+    }
+    table = []
+    for controlByte, entry in enumerate(_CONTROL_BYTE_TABLE):
+        if entry is None:
+            table.append(None)
+            continue
+        valueKind, valueStruct = entry[3], entry[4]
+        fixedSize = 1 + tagSizes[controlByte & 0xE0]
+        if valueKind == _VALUE_KIND_SCALAR:
+            table.append((fixedSize + valueStruct.size, None, 0))
+        elif valueKind == _VALUE_KIND_CONSTANT:
+            table.append((fixedSize, None, 0))
+        elif valueKind == _VALUE_KIND_CONTAINER:
+            table.append((fixedSize, None, 1))
+        elif valueKind == _VALUE_KIND_END_OF_CONTAINER:
+            table.append((fixedSize, None, -1))
+        else:
+            table.append((fixedSize + valueStruct.size, valueStruct, 0))
+    return table
+
+
+_ELEMENT_SIZE_TABLE = _buildElementSizeTable()
+
+
+def _skipContainer(tlv, offset):
+    ''' Steps over the elements of a container whose first element starts at offset, without decoding them.
+
+        Returns the offset following the end of container marker (or the end of the data).
+    '''
+    sizeTable = _ELEMENT_SIZE_TABLE
+    end = len(tlv)
+    depth = 1
+    while offset < end:
+        entry = sizeTable[tlv[offset]]
+        if entry is None:
+            raise ValueError("Attempt to decode unsupported TLV type")
+        fixedSize, lengthStruct, depthChange = entry
+        if lengthStruct is not None:
+            (length,) = lengthStruct.unpack_from(tlv, offset + fixedSize - lengthStruct.size)
+            offset += length
+        offset += fixedSize
+        if depthChange:
+            depth += depthChange
+            if depth == 0:
+                break
+    if offset > end:
+        raise ValueError("TLV element exceeds the remaining data")
+    return offset
+
+
+class LazyTLVView(object):
+    ''' Base class of the read-only views over a TLV container returned by TLVReader.get(lazy=True).
+
+        A view holds a reference to the original buffer and the offset of the first element of the
+        container. Nothing is decoded until the view is accessed: the first access builds an index of
+        the (tag, offset) of the direct children and values are then decoded on demand and cached.
+        Nested structures and arrays are returned as views too, so containers that are never accessed
+        are never materialised. Paths are small and are always decoded eagerly into a TLVList.
+    '''
+
+    __slots__ = ("_tlv", "_offset", "_endOffset", "_elements", "_values")
+
+    def __init__(self, tlv, offset=0):
+        if not isinstance(tlv, (bytes, memoryview)):
+            tlv = memoryview(tlv).cast("B")
+        self._tlv = tlv
+        self._offset = offset
+        self._endOffset = None
+        self._elements = None
+        self._values = {}
+
+    def _index(self):
+        ''' Returns the list of (tag, entry, valueOffset) of the direct children of the container. '''
+        if self._elements is not None:
+            return self._elements
+        tlv = self._tlv
+        end = len(tlv)
+        offset = self._offset
+        elements = []
+        while offset < end:
+            entry, tag, valueOffset = _readElementHeader(tlv, offset)
+            valueKind = entry[3]
+            if valueKind == _VALUE_KIND_END_OF_CONTAINER:
+                offset = valueOffset
+                break
+            if valueKind == _VALUE_KIND_CONTAINER:
+                nextOffset = _skipContainer(tlv, valueOffset)
+            else:
+                fixedSize, lengthStruct, _ = _ELEMENT_SIZE_TABLE[tlv[offset]]
+                nextOffset = offset + fixedSize
+                if lengthStruct is not None:
+                    nextOffset += lengthStruct.unpack_from(tlv, nextOffset - lengthStruct.size)[0]
+                if nextOffset > end:
+                    raise ValueError("TLV element exceeds the remaining data")
+            elements.append((tag, entry, valueOffset))
+            offset = nextOffset
+        self._endOffset = offset
+        self._elements = elements
+        self._onIndexed(elements)
+        return elements
+
+    def _onIndexed(self, elements):
+        pass
+
+    def _valueAt(self, position):
+        try:
+            return self._values[position]
+        except KeyError:
+            pass
+        _, entry, valueOffset = self._index()[position]
+        valueKind, valueArg = entry[3], entry[5]
+        if valueKind != _VALUE_KIND_CONTAINER:
+            value, _ = _readPrimitiveValue(self._tlv, valueOffset, entry)
+        elif valueArg is dict:
+            value = LazyTLVStructureView(self._tlv, valueOffset)
+        elif valueArg is list:
+            value = LazyTLVArrayView(self._tlv, valueOffset)
+        else:
+            value = valueArg()
+            _decodeElements(self._tlv, valueOffset, value)
+        self._values[position] = value
+        return value
+
+    def __len__(self):
+        return len(self._index())
+
+    def materialize(self):
+        ''' Decodes the whole container into the plain dict / list TLVReader.get() would produce. '''
+        out = self._materializedType()
+        _decodeElements(self._tlv, self._offset, out)
+        return out
+
+
+class LazyTLVStructureView(LazyTLVView, Mapping):
+    ''' Mapping view over a TLV structure, keyed exactly like the dict built by TLVReader.get(). '''
+
+    __slots__ = ("_positions",)
+    _materializedType = dict
+
+    def __init__(self, tlv, offset=0):
+        super().__init__(tlv, offset)
+        self._positions = None
+
+    def _onIndexed(self, elements):
+        # Later duplicates win, like they do when decoding into a dict.
+        self._positions = {("Any" if tag is None else tag): position for position, (tag, _, _) in enumerate(elements)}
+
+    def __getitem__(self, key):
+        if self._positions is None:
+            self._index()
+        return self._valueAt(self._positions[key])
+
+    def __iter__(self):
+        if self._positions is None:
+            self._index()
+        return iter(self._positions)
+
+    def __len__(self):
+        if self._positions is None:
+            self._index()
+        return len(self._positions)
+
+    def __contains__(self, key):
+        if self._positions is None:
+            self._index()
+        return key in self._positions
+
+    def __repr__(self):
+        return f"LazyTLVStructureView({self.materialize()!r})"
+
+
+class LazyTLVArrayView(LazyTLVView, Sequence):
+    ''' Sequence view over a TLV array. Compares equal to lists and tuples holding the same values. '''
+
+    __slots__ = ()
+    _materializedType = list
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._valueAt(position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("LazyTLVArrayView index out of range")
+        return self._valueAt(index)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"LazyTLVArrayView({self.materialize()!r})"
+
+
+def _buildBaseElementTypes():
+    ''' Returns a list mapping the element type of a control byte to the TLV_TYPE_* constant of its
+        family, dropping the width information (e.g. 0x05 -> TLV_TYPE_UNSIGNED_INTEGER).
+    '''
+    bases = (TLV_TYPE_SIGNED_INTEGER, TLV_TYPE_UNSIGNED_INTEGER, TLV_TYPE_BOOLEAN, TLV_TYPE_FLOATING_POINT_NUMBER,
+             TLV_TYPE_UTF8_STRING, TLV_TYPE_BYTE_STRING, TLV_TYPE_NULL, TLV_TYPE_STRUCTURE, TLV_TYPE_ARRAY,
+             TLV_TYPE_PATH, TLVEndOfContainer)
+    return [max(base for base in bases if base <= elementType) for elementType in range(0x20)]
+
+
+_BASE_ELEMENT_TYPES = _buildBaseElementTypes()
+
+
+class TLVEventReader(object):
+    ''' Streaming reader yielding one (depth, tag, type, value) event per TLV element.
+
+        Unlike TLVReader, nothing is accumulated: nested containers are reported as a start event
+        (value None) followed by the events of their members at depth + 1 and an end event
+        (tag None, type TLVEndOfContainer) at the depth of the container. type is the TLV_TYPE_*
+        constant of the element family (TLV_TYPE_UNSIGNED_INTEGER for all unsigned widths, ...).
+        Tags and values are the same as the ones TLVReader.get() produces.
+
+        skipContainer() steps over the rest of the innermost open container without decoding it,
+        which allows filtering large lists or structures with constant memory usage.
+    '''
+
+    def __init__(self, tlv, offset=0):
+        if not isinstance(tlv, (bytes, memoryview)):
+            tlv = memoryview(tlv).cast("B")
+        self._tlv = tlv
+        self._offset = offset
+        self._depth = 0
+
+    @property
+    def depth(self):
+        ''' Number of containers entered and not yet left. '''
+        return self._depth
+
+    @property
+    def offset(self):
+        ''' Offset of the next element in the buffer. '''
+        return self._offset
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tlv = self._tlv
+        offset = self._offset
+        if offset >= len(tlv):
+            raise StopIteration
+        elementType = _BASE_ELEMENT_TYPES[tlv[offset] & 0x1F]
+        entry, tag, offset = _readElementHeader(tlv, offset)
+        valueKind = entry[3]
+        depth = self._depth
+        if valueKind == _VALUE_KIND_END_OF_CONTAINER:
+            if depth == 0:
+                raise ValueError("Unexpected TLV end of container")
+            self._depth = depth - 1
+            self._offset = offset
+            return (depth - 1, None, TLVEndOfContainer, None)
+        if valueKind == _VALUE_KIND_CONTAINER:
+            self._depth = depth + 1
+            self._offset = offset
+            return (depth, tag, elementType, None)
+        value, self._offset = _readPrimitiveValue(tlv, offset, entry)
+        return (depth, tag, elementType, value)
+
+    def skipContainer(self):
+        ''' Skips the remaining members and the end of the innermost open container.
+
+            When called right after the start event of a container, the next event is the one of
+            the element following that container.
+        '''
+        if self._depth == 0:
+            raise ValueError("Not inside a TLV container")
+        self._offset = _skipContainer(self._tlv, self._offset)
+        self._depth -= 1
+
+
+def iterElements(tlv):
+    ''' Returns a TLVEventReader over tlv, see TLVEventReader for the events produced. '''
+    return TLVEventReader(tlv)
+
+
 class TLVReader(object):
-    def __init__(self, tlv):
+    def __init__(self, tlv, traceDecoding=False):
+        """Create a reader for the TLV data in tlv (bytes, bytearray or any buffer object).
+
+        Elements are decoded through lookup tables indexed by the raw control byte and only the
+        decoded values are built. When traceDecoding is True, a per-element description of the
+        encoding (tag control, element type, lengths...) is additionally recorded in the decoding
+        property. Tracing is considerably slower and is only meant for debugging.
+        """
         self._tlv = tlv
         self._bytesRead = 0
         self._decodings = []
+        self._traceDecoding = traceDecoding
 
     @property
     def decoding(self):
+        """The per-element decoding trace. Only populated when the reader traces decoding."""
         return self._decodings
 
-    def get(self):
-        """Get the dictionary representation of tlv data"""
+    def get(self, lazy=False):
+        """Get the dictionary representation of tlv data
+
+        When lazy is True, the structures and arrays of the returned dict are LazyTLVView objects
+        backed by the original buffer instead of plain dicts and lists: they are only decoded when
+        accessed, use materialize() to obtain the plain representation. Ignored when tracing.
+        """
         out = {}
-        self._get(self._tlv, self._decodings, out)
+        if self._traceDecoding:
+            self._get(self._tlv, self._decodings, out)
+            return out
+        tlv = self._tlv
+        if not isinstance(tlv, bytes):
+            tlv = memoryview(tlv).cast("B")
+        if lazy:
+            view = LazyTLVStructureView(tlv, self._bytesRead)
+            out.update(view.items())
+            self._bytesRead = view._endOffset
+            return out
+        self._bytesRead = _decodeElements(tlv, self._bytesRead, out)
         return out
 
     def _decodeControlByte(self, tlv, decoding):
@@ -181,7 +181,7 @@ class InvokeAction(BaseAction):
             except ValueError:
                 raise UnexpectedActionCreationError('Could not covert yaml type')
 
-            self._request_object = command_object.FromDict(request_data)
+            self._request_object = command_object.FromDict(request_data, strict=True)
         else:
             self._request_object = command_object
 
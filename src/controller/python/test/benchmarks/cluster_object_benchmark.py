@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Compares decoding and encoding cluster objects through the decoders and encoders compiled from
+their descriptors (FromTLV / FromTagDict / FromDict / ToTLV) against the generic
+TagDictToLabelDict + dacite (FromDict with strict=True) and asdict + DictToTLV paths.
+
+Usage (with the chip-core and chip-clusters wheels installed):
+    python3 cluster_object_benchmark.py [--iterations N]
+'''
+
+import argparse
+import timeit
+from dataclasses import asdict
+
+import chip.clusters as Clusters
+from chip.clusters.Types import NullValue
+from chip.tlv import TLVReader, TLVWriter
+
+
+def _acl(entries: int):
+    AccessControl = Clusters.AccessControl
+    return [AccessControl.Structs.AccessControlEntryStruct(
+        privilege=AccessControl.Enums.AccessControlEntryPrivilegeEnum.kOperate,
+        authMode=AccessControl.Enums.AccessControlEntryAuthModeEnum.kCase,
+        subjects=[0x0000000100000000 + i, 0x0000000200000000 + i],
+        targets=[AccessControl.Structs.AccessControlTargetStruct(cluster=6, endpoint=1)],
+        fabricIndex=1) for i in range(entries)]
+
+
+def _generic_attribute_decode(attribute, tlv: bytes):
+    obj_class = attribute._cluster_object
+    return obj_class.FromDict(obj_class.descriptor.TagDictToLabelDict('', {0: TLVReader(tlv).get()['Any']}), strict=True).Value
+
+
+def _generic_object_decode(cls, tlv: bytes):
+    return cls.FromDict(cls.descriptor.TagDictToLabelDict('', TLVReader(tlv).get()['Any']), strict=True)
+
+
+def _generic_attribute_encode(attribute, value):
+    writer = TLVWriter()
+    attribute.attribute_type.PutFieldToTLV(None, asdict(attribute._cluster_object(Value=value))['Value'], writer, '')
+    return writer.encoding
+
+
+def _decode_cases():
+    acl = Clusters.AccessControl.Attributes.Acl
+    aclTLV = bytes(acl.ToTLV(None, _acl(16)))
+    partsList = Clusters.Descriptor.Attributes.PartsList
+    partsListTLV = bytes(partsList.ToTLV(None, list(range(1, 201))))
+    response = Clusters.GeneralCommissioning.Commands.ArmFailSafeResponse
+    responseTLV = response(errorCode=0, debugText='').ToTLV()
+    event = Clusters.AccessControl.Events.AccessControlEntryChanged
+    eventTLV = event(adminNodeID=1, adminPasscodeID=NullValue, changeType=1, latestValue=_acl(1)[0], fabricIndex=1).ToTLV()
+    # Cluster view of the BasicInformation cluster, as held in the attribute cache.
+    basic = Clusters.BasicInformation
+    basicTagDict = {
+        basic.Attributes.VendorName.attribute_id: 'Test Vendor',
+        basic.Attributes.VendorID.attribute_id: TLVReader(basic.Attributes.VendorID.ToTLV(None, 0xFFF1)).get()['Any'],
+        basic.Attributes.ProductName.attribute_id: 'Bridge',
+        basic.Attributes.AttributeList.attribute_id: TLVReader(
+            basic.Attributes.AttributeList.ToTLV(None, list(range(0x14)))).get()['Any'],
+    }
+    accessControl = Clusters.AccessControl
+    accessControlLabelDict = {'acl': asdict(accessControl.FromTagDict({acl.attribute_id: TLVReader(aclTLV).get()['Any']}))['acl']}
+
+    return {
+        'AccessControl.Acl (16 entries)': (
+            lambda: _generic_attribute_decode(acl, aclTLV), lambda: acl.FromTLV(aclTLV)),
+        'Descriptor.PartsList (200 endpoints)': (
+            lambda: _generic_attribute_decode(partsList, partsListTLV), lambda: partsList.FromTLV(partsListTLV)),
+        'ArmFailSafeResponse': (
+            lambda: _generic_object_decode(response, responseTLV), lambda: response.FromTLV(responseTLV)),
+        'AccessControlEntryChanged event': (
+            lambda: _generic_object_decode(event, eventTLV), lambda: event.FromTLV(eventTLV)),
+        'BasicInformation cluster view': (
+            lambda: basic.FromDict(basic.descriptor.TagDictToLabelDict('', basicTagDict), strict=True),
+            lambda: basic.FromTagDict(basicTagDict)),
+        'AccessControl FromDict (16 entries)': (
+            lambda: accessControl.FromDict(accessControlLabelDict, strict=True),
+            lambda: accessControl.FromDict(accessControlLabelDict)),
+    }
+
+
+def _encode_cases():
+    acl = Clusters.AccessControl.Attributes.Acl
+    aclValue = _acl(16)
+    partsList = Clusters.Descriptor.Attributes.PartsList
+    partsListValue = list(range(1, 201))
+    command = Clusters.LevelControl.Commands.MoveToLevel(level=128, transitionTime=10, optionsMask=0, optionsOverride=0)
+    GroupKeyManagement = Clusters.GroupKeyManagement
+    keySetWrite = GroupKeyManagement.Commands.KeySetWrite(groupKeySet=GroupKeyManagement.Structs.GroupKeySetStruct(
+        groupKeySetID=1, groupKeySecurityPolicy=0, epochKey0=b'\x01' * 16, epochStartTime0=1,
+        epochKey1=NullValue, epochStartTime1=NullValue, epochKey2=NullValue, epochStartTime2=NullValue))
+
+    return {
+        'AccessControl.Acl (16 entries)': (
+            lambda: _generic_attribute_encode(acl, aclValue), lambda: acl.ToTLV(None, aclValue)),
+        'Descriptor.PartsList (200 endpoints)': (
+            lambda: _generic_attribute_encode(partsList, partsListValue), lambda: partsList.ToTLV(None, partsListValue)),
+        'LevelControl.MoveToLevel': (
+            lambda: command.descriptor.DictToTLV(asdict(command)), command.ToTLV),
+        'GroupKeyManagement.KeySetWrite': (
+            lambda: keySetWrite.descriptor.DictToTLV(asdict(keySetWrite)), keySetWrite.ToTLV),
+    }
+
+
+def _compare(name: str, generic, compiled, iterations: int):
+    genericTime = min(timeit.repeat(generic, number=iterations, repeat=3)) / iterations * 1e6
+    compiledTime = min(timeit.repeat(compiled, number=iterations, repeat=3)) / iterations * 1e6
+    print(f"{name:40} {genericTime:>13.1f} {compiledTime:>14.1f} {genericTime / compiledTime:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'decode':40} {'generic (us)':>13} {'compiled (us)':>14} {'speedup':>8}")
+    for name, (generic, compiled) in _decode_cases().items():
+        assert generic() == compiled()
+        _compare(name, generic, compiled, args.iterations)
+
+    print(f"\n{'encode':40} {'generic (us)':>13} {'compiled (us)':>14} {'speedup':>8}")
+    for name, (generic, compiled) in _encode_cases().items():
+        assert bytes(generic()) == bytes(compiled())
+        _compare(name, generic, compiled, args.iterations)
+
+
+if __name__ == '__main__':
+    main()
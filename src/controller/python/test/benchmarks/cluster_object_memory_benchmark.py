@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Compares the resident memory of a fleet of cluster-view AttributeCaches (one per node) built with
+the cluster objects generated as plain dataclasses and as slots dataclasses, and of the same fleet
+kept in CompactAttributeCaches storing the received TLV.
+
+The slots variant is a copy of the installed chip package whose generated modules are rewritten
+the way split_python_cluster_objects.py --slots generates them. Each variant is measured in its own
+process, requires Python 3.10.
+
+Usage (with the chip-core and chip-clusters wheels installed):
+    python3 cluster_object_memory_benchmark.py [--nodes N] [--endpoints N]
+'''
+
+import argparse
+import gc
+import json
+import os
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+
+
+def _rss_kb() -> int:
+    ''' Returns the resident set size of the process in kB. '''
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        # Peak RSS, in bytes on macOS.
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss // 1024 if sys.platform == 'darwin' else maxrss
+
+
+def _node_reports(endpoints: int):
+    ''' Returns (endpoint, attribute, TLV encoding) of a read of a light with the given number of endpoints. '''
+    import chip.clusters as Clusters
+
+    def tlv(attribute, value):
+        return attribute, attribute.ToTLV(None, value)
+
+    BasicInformation = Clusters.BasicInformation.Attributes
+    Descriptor = Clusters.Descriptor
+    rootAttributes = [
+        tlv(BasicInformation.VendorName, 'Test Vendor'),
+        tlv(BasicInformation.VendorID, 0xFFF1),
+        tlv(BasicInformation.ProductName, 'Light'),
+        tlv(BasicInformation.SerialNumber, '0123456789'),
+        tlv(Descriptor.Attributes.PartsList, list(range(1, endpoints + 1))),
+    ]
+    endpointAttributes = [
+        tlv(Clusters.OnOff.Attributes.OnOff, True),
+        tlv(Clusters.LevelControl.Attributes.CurrentLevel, 128),
+        tlv(Clusters.ColorControl.Attributes.CurrentHue, 10),
+        tlv(Clusters.ColorControl.Attributes.CurrentSaturation, 20),
+        tlv(Descriptor.Attributes.DeviceTypeList, [Descriptor.Structs.DeviceTypeStruct(deviceType=0x10D, revision=1)]),
+    ]
+    reports = [(0, attribute, data) for attribute, data in rootAttributes]
+    for endpoint in range(1, endpoints + 1):
+        reports.extend((endpoint, attribute, data) for attribute, data in endpointAttributes)
+    return reports
+
+
+def _measure(nodes: int, endpoints: int, compact: bool):
+    from chip.clusters.Attribute import AttributeCache, AttributePath, CompactAttributeCache
+    from chip.tlv import TLVReader
+
+    reports = [(AttributePath(EndpointId=endpoint, ClusterId=attribute.cluster_id, AttributeId=attribute.attribute_id),
+                data if compact else TLVReader(data).get()['Any'])
+               for endpoint, attribute, data in _node_reports(endpoints)]
+
+    def nodeCache(node: int):
+        if compact:
+            cache = CompactAttributeCache(returnClusterObject=True, storeRawTLV=True)
+        else:
+            cache = AttributeCache(returnClusterObject=True)
+        for path, data in reports:
+            cache.UpdateTLV(path, node, data)
+        cache.GetUpdatedAttributeCache()
+        return cache
+
+    # The first cache compiles the decoders of the clusters, which is not part of the measurement.
+    nodeCache(0)
+    gc.collect()
+    before = _rss_kb()
+    caches = [nodeCache(node) for node in range(nodes)]
+    print(json.dumps({'rss': _rss_kb() - before, 'nodes': len(caches)}))
+
+
+def _slots_package(directory: str) -> str:
+    import chip
+
+    packageDir = os.path.dirname(chip.__file__)
+    shutil.copytree(packageDir, os.path.join(directory, 'chip'))
+    generatedDir = os.path.join(directory, 'chip', 'clusters', 'generated')
+    for name in os.listdir(generatedDir):
+        if name.endswith('.py'):
+            path = os.path.join(generatedDir, name)
+            with open(path) as f:
+                source = f.read()
+            with open(path, 'w') as f:
+                f.write(re.sub(r'^( *)@dataclass$', r'\1@dataclass(slots=True)', source, flags=re.MULTILINE))
+    return directory
+
+
+def _run(args, pythonPath=None, compact=False) -> int:
+    env = dict(os.environ)
+    if pythonPath:
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [pythonPath, env.get('PYTHONPATH')]))
+    output = subprocess.check_output([sys.executable, __file__, '--measure', '--nodes', str(args.nodes),
+                                      '--endpoints', str(args.endpoints)] + (['--compact'] if compact else []), env=env)
+    return json.loads(output.decode().splitlines()[-1])['rss']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--nodes', type=int, default=10000)
+    parser.add_argument('--endpoints', type=int, default=4)
+    parser.add_argument('--measure', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--compact', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        _measure(args.nodes, args.endpoints, args.compact)
+        return
+
+    if sys.version_info < (3, 10):
+        sys.exit('slots dataclasses require Python 3.10')
+
+    plain = _run(args)
+    with tempfile.TemporaryDirectory() as directory:
+        slots = _run(args, _slots_package(directory))
+
+    print(f"{'AttributeCache':40} {'dataclass (MB)':>15} {'slots (MB)':>11} {'saved':>7}")
+    print(f"{f'{args.nodes} nodes, {args.endpoints} endpoints':40} {plain / 1024:>15.1f} {slots / 1024:>11.1f} "
+          f"{1 - slots / plain:>7.0%}")
+
+    compact = _run(args, compact=True)
+    print(f"{'CompactAttributeCache':40} {plain / 1024:>15.1f} {compact / 1024:>11.1f} {1 - compact / plain:>7.0%}")
+
+
+if __name__ == '__main__':
+    main()
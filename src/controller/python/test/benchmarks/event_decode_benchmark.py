@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Feeds a synthetic stream of event reports (switch presses, energy management and access control
+events) through AsyncReadTransaction.handleEventData, and through the previous handling which
+looked the event class up by str(EventPath) and decoded the TLV twice (once for the failure value,
+once in FromTLV).
+
+Usage (with the chip-core and chip-clusters wheels installed):
+    python3 event_decode_benchmark.py [--events N]
+'''
+
+import argparse
+import time
+
+import chip.clusters as Clusters
+import chip.interaction_model
+from chip.clusters.Attribute import AsyncReadTransaction, EventHeader, EventPath, EventPriority, EventReadResult, EventTimestampType
+from chip.clusters.ClusterObjects import ALL_EVENTS
+from chip.clusters.Types import NullValue
+from chip.tlv import TLVReader
+
+
+def _event_payloads():
+    Switch = Clusters.Switch.Events
+    DeviceEnergyManagement = Clusters.DeviceEnergyManagement
+    AccessControl = Clusters.AccessControl
+    entry = AccessControl.Structs.AccessControlEntryStruct(
+        privilege=AccessControl.Enums.AccessControlEntryPrivilegeEnum.kOperate,
+        authMode=AccessControl.Enums.AccessControlEntryAuthModeEnum.kCase,
+        subjects=[0x0000000100000000], targets=NullValue, fabricIndex=1)
+    events = [
+        Switch.InitialPress(newPosition=1),
+        Switch.ShortRelease(previousPosition=1),
+        Switch.MultiPressComplete(previousPosition=1, totalNumberOfPressesCounted=2),
+        DeviceEnergyManagement.Events.PowerAdjustEnd(
+            cause=DeviceEnergyManagement.Enums.CauseEnum.kNormalCompletion, duration=60, energyUse=1200),
+        AccessControl.Events.AccessControlEntryChanged(
+            adminNodeID=1, adminPasscodeID=NullValue, changeType=1, latestValue=entry, fabricIndex=1),
+    ]
+    return [(event.cluster_id, event.event_id, event.ToTLV()) for event in events]
+
+
+def _event_stream(count: int):
+    payloads = _event_payloads()
+    stream = []
+    for number in range(count):
+        clusterId, eventId, data = payloads[number % len(payloads)]
+        header = EventHeader(EndpointId=1, ClusterId=clusterId, EventId=eventId, EventNumber=number,
+                             Priority=EventPriority.INFO, Timestamp=number, TimestampType=EventTimestampType.SYSTEM)
+        stream.append((header, EventPath(ClusterId=clusterId, EventId=eventId), data))
+    return stream
+
+
+class _LegacyEventHandler:
+    def __init__(self):
+        self._eventIndex = {str(EventPath(ClusterId=clusterId, EventId=eventId)): event
+                            for clusterId, events in ALL_EVENTS.items() for eventId, event in events.items()}
+        self._events = []
+
+    def handleEventData(self, header: EventHeader, path: EventPath, data: bytes, status: int):
+        eventType = self._eventIndex.get(str(path), None)
+        TLVReader(data).get().get("Any", {})
+        self._events.append(EventReadResult(
+            Header=header, Data=eventType.FromTLV(data), Status=chip.interaction_model.Status(status)))
+
+
+def _run(handler, stream) -> float:
+    status = chip.interaction_model.Status.Success.value
+    start = time.perf_counter()
+    for header, path, data in stream:
+        handler.handleEventData(header, path, data, status)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=100000)
+    args = parser.parse_args()
+
+    stream = _event_stream(args.events)
+    legacy = _LegacyEventHandler()
+    transaction = AsyncReadTransaction(None, None, None, returnClusterObject=False)
+    legacyTime = _run(legacy, stream)
+    currentTime = _run(transaction, stream)
+    assert legacy._events == transaction.GetAllEventValues()
+
+    print(f"{'handleEventData':40} {'previous (s)':>13} {'current (s)':>12} {'speedup':>8}")
+    print(f"{f'{args.events} events':40} {legacyTime:>13.3f} {currentTime:>12.3f} {legacyTime / currentTime:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
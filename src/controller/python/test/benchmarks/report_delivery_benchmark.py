@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Feeds a stream of electrical power measurement reports through a subscription and delivers the
+changes to the event loop:
+
+  - per path: the attribute update callback hands each changed path to the event loop with
+    call_soon_threadsafe, the way applications consuming subscriptions in asyncio do, and each
+    TypedAttributePath is resolved from the cluster descriptor as before.
+  - batched: the attribute batch update callback receives each report in a single call on the
+    event loop, with the typed paths resolved once per (cluster, attribute).
+
+Usage (with the chip-core and chip-clusters wheels installed):
+    python3 report_delivery_benchmark.py [--reports N]
+'''
+
+import argparse
+import asyncio
+import time
+from unittest import mock
+
+import chip.clusters as Clusters
+import chip.clusters.Attribute as ClusterAttribute
+import chip.interaction_model
+from chip.clusters.Attribute import AsyncReadTransaction, AttributePath
+
+
+def _reports(count: int):
+    Attributes = Clusters.ElectricalPowerMeasurement.Attributes
+    attributes = [Attributes.Voltage, Attributes.ActiveCurrent, Attributes.ReactiveCurrent, Attributes.ApparentCurrent,
+                  Attributes.ActivePower, Attributes.ReactivePower, Attributes.ApparentPower, Attributes.RMSVoltage,
+                  Attributes.RMSCurrent, Attributes.RMSPower, Attributes.Frequency, Attributes.PowerFactor]
+    reports = []
+    for number in range(count):
+        reports.append([(AttributePath(EndpointId=1 + number % 8, ClusterId=attribute.cluster_id,
+                                       AttributeId=attribute.attribute_id), number, attribute.ToTLV(None, number))
+                        for attribute in attributes])
+    return reports
+
+
+async def _run(reports, batched: bool) -> float:
+    eventLoop = asyncio.get_running_loop()
+    transaction = AsyncReadTransaction(eventLoop.create_future(), eventLoop, None, returnClusterObject=False)
+    with mock.patch('builtins.chipStack', create=True):
+        transaction._handleSubscriptionEstablished(1)
+    subscription = transaction.GetSubscriptionHandler()
+
+    expected = sum(len(report) for report in reports)
+    received = 0
+    done = eventLoop.create_future()
+
+    def consume(count: int):
+        nonlocal received
+        received += count
+        if received == expected:
+            done.set_result(None)
+
+    if batched:
+        subscription.SetAttributeBatchUpdateCallback(lambda paths, transaction: consume(len(paths)))
+    else:
+        subscription.SetAttributeUpdateCallback(lambda path, transaction: eventLoop.call_soon_threadsafe(consume, 1))
+
+    status = chip.interaction_model.Status.Success.value
+    start = time.perf_counter()
+    for report in reports:
+        if not batched:
+            # Each typed path is resolved from the cluster descriptor, as before the per (cluster, attribute) cache.
+            ClusterAttribute._TypedAttributeIndex.clear()
+        for path, dataVersion, data in report:
+            transaction.handleAttributeData(path, dataVersion, status, data)
+        transaction.handleReportEnd()
+    await done
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reports', type=int, default=20000)
+    args = parser.parse_args()
+
+    reports = _reports(args.reports)
+    perPathTime = asyncio.run(_run(reports, batched=False))
+    batchedTime = asyncio.run(_run(reports, batched=True))
+
+    print(f"{'attribute change delivery':40} {'per path (s)':>13} {'batched (s)':>12} {'speedup':>8}")
+    print(f"{f'{args.reports} reports of {len(reports[0])} paths':40} {perPathTime:>13.3f} {batchedTime:>12.3f} "
+          f"{perPathTime / batchedTime:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
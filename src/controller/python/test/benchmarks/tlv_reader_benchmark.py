@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Compares the table driven TLVReader decoding against the tracing decoder on attribute payloads
+encoded through the generated cluster objects. The lazy column only builds the top level
+LazyTLVView of each payload, which is what a read pays for attributes that are never accessed.
+
+Usage (with the chip-core and chip-clusters wheels installed):
+    python3 tlv_reader_benchmark.py [--iterations N]
+'''
+
+import argparse
+import timeit
+
+import chip.clusters as Clusters
+from chip.tlv import TLVReader
+
+
+def _acl_payload(entries: int) -> bytes:
+    AccessControl = Clusters.AccessControl
+    acl = [AccessControl.Structs.AccessControlEntryStruct(
+        privilege=AccessControl.Enums.AccessControlEntryPrivilegeEnum.kOperate,
+        authMode=AccessControl.Enums.AccessControlEntryAuthModeEnum.kCase,
+        subjects=[0x0000000100000000 + i, 0x0000000200000000 + i],
+        targets=[AccessControl.Structs.AccessControlTargetStruct(cluster=6, endpoint=1)],
+        fabricIndex=1) for i in range(entries)]
+    return bytes(AccessControl.Attributes.Acl.ToTLV(None, acl))
+
+
+def _parts_list_payload(endpoints: int) -> bytes:
+    return bytes(Clusters.Descriptor.Attributes.PartsList.ToTLV(None, list(range(1, endpoints + 1))))
+
+
+def _device_type_list_payload(entries: int) -> bytes:
+    deviceTypes = [Clusters.Descriptor.Structs.DeviceTypeStruct(deviceType=0x100 + i, revision=1) for i in range(entries)]
+    return bytes(Clusters.Descriptor.Attributes.DeviceTypeList.ToTLV(None, deviceTypes))
+
+
+def _basic_information_payloads() -> list:
+    BasicInformation = Clusters.BasicInformation.Attributes
+    return [
+        bytes(BasicInformation.VendorName.ToTLV(None, 'Test Vendor')),
+        bytes(BasicInformation.VendorID.ToTLV(None, 0xFFF1)),
+        bytes(BasicInformation.ProductName.ToTLV(None, 'Bridge')),
+        bytes(BasicInformation.SerialNumber.ToTLV(None, 'TEST_SN_0123456789')),
+        bytes(BasicInformation.AttributeList.ToTLV(None, list(range(0, 0x14)) + [0xFFF8, 0xFFF9, 0xFFFB, 0xFFFC, 0xFFFD])),
+    ]
+
+
+def _measure(payloads, iterations: int, traceDecoding: bool, lazy: bool = False) -> float:
+    def decodeAll():
+        for payload in payloads:
+            TLVReader(payload, traceDecoding=traceDecoding).get(lazy=lazy)
+    return min(timeit.repeat(decodeAll, number=iterations, repeat=3))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    cases = {
+        'ACL (16 entries)': [_acl_payload(16)],
+        'PartsList (200 endpoints)': [_parts_list_payload(200)],
+        'DeviceTypeList (50 entries)': [_device_type_list_payload(50)],
+        'BasicInformation attributes': _basic_information_payloads(),
+    }
+
+    print(f"{'payload':32} {'bytes':>8} {'traced (ms)':>12} {'table (ms)':>12} {'speedup':>8} {'lazy (ms)':>10}")
+    for name, payloads in cases.items():
+        size = sum(len(p) for p in payloads)
+        traced = _measure(payloads, args.iterations, traceDecoding=True)
+        table = _measure(payloads, args.iterations, traceDecoding=False)
+        lazy = _measure(payloads, args.iterations, traceDecoding=False, lazy=True)
+        print(f"{name:32} {size:>8} {traced * 1000:>12.2f} {table * 1000:>12.2f} {traced / table:>7.1f}x {lazy * 1000:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
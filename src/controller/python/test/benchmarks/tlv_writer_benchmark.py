@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2024 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Measures TLV encoding of typical command payloads and large list writes, both through the
+generated cluster objects (ClusterCommand.ToTLV / ClusterAttributeDescriptor.ToTLV) and through
+TLVWriter.put directly.
+
+Usage (with the chip-core and chip-clusters wheels installed):
+    python3 tlv_writer_benchmark.py [--iterations N]
+'''
+
+import argparse
+import timeit
+
+import chip.clusters as Clusters
+from chip.tlv import TLVWriter, uint
+
+
+def _commands():
+    return {
+        'OnOff.On': Clusters.OnOff.Commands.On(),
+        'LevelControl.MoveToLevel': Clusters.LevelControl.Commands.MoveToLevel(
+            level=128, transitionTime=10, optionsMask=0, optionsOverride=0),
+        'ColorControl.MoveToHueAndSaturation': Clusters.ColorControl.Commands.MoveToHueAndSaturation(
+            hue=10, saturation=20, transitionTime=5, optionsMask=0, optionsOverride=0),
+        'GroupKeyManagement.KeySetWrite': Clusters.GroupKeyManagement.Commands.KeySetWrite(
+            groupKeySet=Clusters.GroupKeyManagement.Structs.GroupKeySetStruct(
+                groupKeySetID=1, groupKeySecurityPolicy=0, epochKey0=b'\x01' * 16, epochStartTime0=1,
+                epochKey1=b'\x02' * 16, epochStartTime1=2, epochKey2=b'\x03' * 16, epochStartTime2=3)),
+    }
+
+
+def _attribute_writes(entries: int):
+    AccessControl = Clusters.AccessControl
+    acl = [AccessControl.Structs.AccessControlEntryStruct(
+        privilege=AccessControl.Enums.AccessControlEntryPrivilegeEnum.kOperate,
+        authMode=AccessControl.Enums.AccessControlEntryAuthModeEnum.kCase,
+        subjects=[0x0000000100000000 + i, 0x0000000200000000 + i],
+        targets=[AccessControl.Structs.AccessControlTargetStruct(cluster=6, endpoint=1)],
+        fabricIndex=1) for i in range(entries)]
+    return {
+        f'AccessControl.Acl ({entries} entries)': (AccessControl.Attributes.Acl, acl),
+        'Descriptor.PartsList (1000 endpoints)': (Clusters.Descriptor.Attributes.PartsList, list(range(1, 1001))),
+    }
+
+
+def _raw_values():
+    return {
+        'list of 5000 uint': [uint(i) for i in range(5000)],
+        'list of 1000 structs': [{0: uint(i), 1: 'name', 2: b'\x00' * 8} for i in range(1000)],
+    }
+
+
+def _time(func, iterations: int) -> float:
+    ''' Returns the best time of one call in microseconds. '''
+    return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'payload':48} {'bytes':>8} {'us/encode':>10}")
+    for name, command in _commands().items():
+        size = len(command.ToTLV())
+        print(f"{name:48} {size:>8} {_time(command.ToTLV, args.iterations * 10):>10.1f}")
+
+    for name, (attribute, value) in _attribute_writes(16).items():
+        size = len(attribute.ToTLV(None, value))
+        print(f"{name:48} {size:>8} {_time(lambda: attribute.ToTLV(None, value), args.iterations):>10.1f}")
+
+    writer = TLVWriter()
+    for name, value in _raw_values().items():
+        def encode():
+            writer.reset()
+            writer.put(None, value)
+        encode()
+        print(f"{'TLVWriter.put: ' + name:48} {len(writer.encoding):>8} {_time(encode, args.iterations):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
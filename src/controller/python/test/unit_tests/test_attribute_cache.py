@@ -0,0 +1,328 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import chip.clusters as Clusters
+import chip.interaction_model
+from chip.clusters.Attribute import (AsyncReadTransaction, AttributeCache, AttributePath, CompactAttributeCache, DataVersion,
+                                     DataVersionFilter, ValueDecodeFailure)
+from chip.clusters.AttributeCacheManager import AttributeCacheManager
+from chip.clusters.PersistentAttributeCache import NodeAttributeCache, PersistentAttributeCache
+from chip.tlv import LazyTLVView, TLVReader
+
+'''
+This file contains tests for the caches of the attribute data received by reads and subscriptions.
+'''
+
+
+def _report(dataVersion: int, endpoint: int, *values):
+    ''' Returns the (data version, TLV) of each (attribute, value) on the endpoint, as saved by the caches. '''
+    return {AttributePath(EndpointId=endpoint, ClusterId=attribute.cluster_id, AttributeId=attribute.attribute_id):
+            (dataVersion, attribute.ToTLV(None, value)) for attribute, value in values}
+
+
+class TestAttributeCache(unittest.TestCase):
+    def _update(self, cache, endpoint: int, attribute, value):
+        path = AttributePath(EndpointId=endpoint, ClusterId=attribute.cluster_id, AttributeId=attribute.attribute_id)
+        cache.UpdateTLV(path, 7, TLVReader(attribute.ToTLV(None, value)).get()['Any'])
+
+    def test_cluster_view_rebuilt_once_per_cluster(self):
+        OnOff = Clusters.OnOff
+        cache = AttributeCache(returnClusterObject=True)
+        for endpoint in (1, 2):
+            self._update(cache, endpoint, OnOff.Attributes.OnOff, True)
+            self._update(cache, endpoint, OnOff.Attributes.OnTime, 10)
+            self._update(cache, endpoint, OnOff.Attributes.OffWaitTime, 20)
+
+        with mock.patch.object(OnOff, 'FromTagDict', wraps=OnOff.FromTagDict) as fromTagDict:
+            result = cache.GetUpdatedAttributeCache()
+        self.assertEqual(fromTagDict.call_count, 2)
+        self.assertEqual(result[1][OnOff], OnOff(onOff=True, onTime=10, offWaitTime=20))
+        self.assertEqual(result[2][OnOff].data_version, 7)
+
+    def test_attribute_view_decodes_updated_attributes(self):
+        OnOff = Clusters.OnOff
+        cache = AttributeCache()
+        self._update(cache, 1, OnOff.Attributes.OnOff, True)
+        self._update(cache, 1, OnOff.Attributes.OnTime, 10)
+        cache.GetUpdatedAttributeCache()
+
+        self._update(cache, 1, OnOff.Attributes.OnTime, 30)
+        with mock.patch.object(OnOff.Attributes.OnOff, 'FromTagDictOrRawValue') as onOffDecode:
+            result = cache.GetUpdatedAttributeCache()
+        onOffDecode.assert_not_called()
+        self.assertEqual(result[1][OnOff], {DataVersion: 7, OnOff.Attributes.OnOff: True, OnOff.Attributes.OnTime: 30})
+
+    def test_updates_from_another_thread(self):
+        OnOff = Clusters.OnOff
+        cache = AttributeCache()
+
+        def update():
+            for value in range(50):
+                for endpoint in range(20):
+                    self._update(cache, endpoint, OnOff.Attributes.OnTime, value)
+
+        # The Matter thread updates the cache while the event loop reads it.
+        thread = threading.Thread(target=update)
+        thread.start()
+        while thread.is_alive():
+            cache.GetUpdatedAttributeCache()
+        thread.join()
+
+        result = cache.GetUpdatedAttributeCache()
+        self.assertEqual([result[endpoint][OnOff][OnOff.Attributes.OnTime] for endpoint in range(20)], [49] * 20)
+
+
+class TestCompactAttributeCache(unittest.TestCase):
+    def _fill(self, cache, raw: bool):
+        values = [
+            (0, Clusters.BasicInformation.Attributes.VendorName, 'Test Vendor'),
+            (0, Clusters.BasicInformation.Attributes.VendorID, 0xFFF1),
+            (1, Clusters.OnOff.Attributes.OnOff, True),
+            (1, Clusters.OnOff.Attributes.OnTime, 10),
+            (1, Clusters.Descriptor.Attributes.PartsList, [2, 3]),
+        ]
+        for endpoint, attribute, value in values:
+            path = AttributePath(EndpointId=endpoint, ClusterId=attribute.cluster_id, AttributeId=attribute.attribute_id)
+            data = attribute.ToTLV(None, value)
+            cache.UpdateTLV(path, 7, data if raw else TLVReader(data).get()['Any'])
+        # A mismatched type and an attribute read with an error status.
+        path = AttributePath(EndpointId=1, ClusterId=Clusters.OnOff.id,
+                             AttributeId=Clusters.OnOff.Attributes.OffWaitTime.attribute_id)
+        data = Clusters.OnOff.Attributes.OnOff.ToTLV(None, False)
+        cache.UpdateTLV(path, 7, data if raw else TLVReader(data).get()['Any'])
+        path = AttributePath(EndpointId=1, ClusterId=Clusters.OnOff.id,
+                             AttributeId=Clusters.OnOff.Attributes.StartUpOnOff.attribute_id)
+        cache.UpdateTLV(path, 7, ValueDecodeFailure(None, LookupError()))
+
+    def _assertSameView(self, returnClusterObject: bool):
+        cache = AttributeCache(returnClusterObject=returnClusterObject)
+        compactCache = CompactAttributeCache(returnClusterObject=returnClusterObject, storeRawTLV=True)
+        self._fill(cache, raw=False)
+        self._fill(compactCache, raw=True)
+
+        expected = cache.GetUpdatedAttributeCache()
+        actual = compactCache.GetUpdatedAttributeCache()
+        self.assertEqual(list(actual), list(expected))
+        for endpoint, clusters in expected.items():
+            self.assertEqual(set(actual[endpoint]), set(clusters))
+            for cluster, value in clusters.items():
+                if returnClusterObject:
+                    self.assertEqual(repr(actual[endpoint][cluster]), repr(value))
+                else:
+                    self.assertEqual(set(actual[endpoint][cluster]), set(value))
+                    for key, attributeValue in value.items():
+                        self.assertEqual(repr(actual[endpoint][cluster][key]), repr(attributeValue))
+
+        self.assertEqual(compactCache.versionList, cache.versionList)
+        self.assertEqual(repr({endpoint: {cluster: dict(attributes) for cluster, attributes in clusters.items()}
+                               for endpoint, clusters in compactCache.attributeTLVCache.items()}),
+                         repr(cache.attributeTLVCache))
+
+    def test_attribute_view(self):
+        self._assertSameView(returnClusterObject=False)
+
+    def test_cluster_view(self):
+        self._assertSameView(returnClusterObject=True)
+
+    def test_missing_keys(self):
+        cache = CompactAttributeCache(storeRawTLV=True)
+        self._fill(cache, raw=True)
+        view = cache.GetUpdatedAttributeCache()
+        self.assertNotIn(2, view)
+        self.assertNotIn(Clusters.LevelControl, view[1])
+        self.assertNotIn(Clusters.OnOff.Attributes.GlobalSceneControl, view[1][Clusters.OnOff])
+        self.assertNotIn(Clusters.BasicInformation.Attributes.VendorID, view[1][Clusters.OnOff])
+        with self.assertRaises(KeyError):
+            cache.attributeTLVCache[1][Clusters.OnOff.id][0xFFFF]
+
+    def test_lazy_read_transaction(self):
+        PartsList = Clusters.Descriptor.Attributes.PartsList
+        transaction = AsyncReadTransaction(None, None, None, returnClusterObject=False, lazyDecode=True)
+        path = AttributePath(EndpointId=0, ClusterId=PartsList.cluster_id, AttributeId=PartsList.attribute_id)
+        transaction.handleAttributeData(path, 7, chip.interaction_model.Status.Success.value, PartsList.ToTLV(None, [1, 2]))
+
+        with mock.patch.object(PartsList, 'FromTagDictOrRawValue', wraps=PartsList.FromTagDictOrRawValue) as decode:
+            response = transaction.GetReadResponse()
+            # Nothing is decoded until accessed.
+            decode.assert_not_called()
+            self.assertEqual(response.attributes[0][Clusters.Descriptor][PartsList], [1, 2])
+            decode.assert_called_once()
+        tlvValue = response.tlvAttributes[0][PartsList.cluster_id][PartsList.attribute_id]
+        self.assertIsInstance(tlvValue, LazyTLVView)
+        self.assertEqual(list(tlvValue), [1, 2])
+
+
+class TestPersistentAttributeCache(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def test_data_version_filters(self):
+        OnOff = Clusters.OnOff
+        clusterPath = AttributePath.from_cluster(EndpointId=1, Cluster=OnOff)
+        nodeCache = PersistentAttributeCache(self._directory.name).GetNodeCache(1, 2)
+        self.assertEqual(nodeCache.DataVersionFilters([clusterPath]), [])
+        nodeCache.Update([clusterPath], _report(7, 1, (OnOff.Attributes.OnOff, True), (OnOff.Attributes.OnTime, 10)),
+                         priming=True)
+
+        # Loaded from its file by another instance.
+        nodeCache = PersistentAttributeCache(self._directory.name).GetNodeCache(1, 2)
+        onOffFilter = DataVersionFilter(EndpointId=1, ClusterId=OnOff.id, DataVersion=7)
+        self.assertEqual(nodeCache.DataVersionFilters([clusterPath]), [onOffFilter])
+        self.assertEqual(nodeCache.DataVersionFilters([AttributePath()]), [onOffFilter])
+        self.assertEqual(nodeCache.DataVersionFilters(
+            [AttributePath.from_attribute(EndpointId=1, Attribute=OnOff.Attributes.OnTime)]), [onOffFilter])
+        self.assertEqual(nodeCache.DataVersionFilters([AttributePath.from_cluster(EndpointId=2, Cluster=OnOff)]), [])
+        self.assertEqual(PersistentAttributeCache(self._directory.name).GetNodeCache(1, 3).DataVersionFilters([clusterPath]), [])
+
+        # Only the attributes read by the paths are merged.
+        onTimePath = AttributePath.from_attribute(EndpointId=1, Attribute=OnOff.Attributes.OnTime)
+        self.assertEqual([(path, dataVersion, TLVReader(data).get()['Any'])
+                          for path, dataVersion, data in nodeCache.CachedAttributes([onTimePath], [onOffFilter])],
+                         [(onTimePath, 7, 10)])
+
+    def test_update(self):
+        OnOff = Clusters.OnOff
+        clusterPath = AttributePath.from_cluster(EndpointId=1, Cluster=OnOff)
+        onTimePath = AttributePath.from_attribute(EndpointId=1, Attribute=OnOff.Attributes.OnTime)
+        nodeCache = PersistentAttributeCache(self._directory.name).GetNodeCache(1, 2)
+        nodeCache.Update([clusterPath], _report(7, 1, (OnOff.Attributes.OnOff, True), (OnOff.Attributes.OnTime, 10)),
+                         priming=True)
+
+        # A subscription report only has the changed attributes, the others are still current.
+        nodeCache.Update([clusterPath], _report(8, 1, (OnOff.Attributes.OnOff, False)), priming=False)
+        self.assertEqual(len(nodeCache.DataVersionFilters([clusterPath])), 1)
+        self.assertEqual(len(list(nodeCache.CachedAttributes([clusterPath], nodeCache.DataVersionFilters([clusterPath])))), 2)
+
+        # The attributes not read with a new data version may have changed.
+        nodeCache.Update([onTimePath], _report(9, 1, (OnOff.Attributes.OnTime, 20)), priming=True)
+        self.assertEqual(nodeCache.DataVersionFilters([clusterPath]), [])
+        self.assertEqual([(path, dataVersion) for path, dataVersion, _ in
+                          nodeCache.CachedAttributes([clusterPath], nodeCache.DataVersionFilters([onTimePath]))],
+                         [(onTimePath, 9)])
+
+    def test_read_transaction(self):
+        OnOff = Clusters.OnOff
+        LevelControl = Clusters.LevelControl
+        paths = [AttributePath.from_cluster(EndpointId=1, Cluster=OnOff),
+                 AttributePath.from_attribute(EndpointId=1, Attribute=LevelControl.Attributes.CurrentLevel)]
+        cache = PersistentAttributeCache(self._directory.name)
+        nodeCache = cache.GetNodeCache(1, 2)
+        nodeCache.Update(paths, {**_report(7, 1, (OnOff.Attributes.OnOff, True), (OnOff.Attributes.OnTime, 10)),
+                                 **_report(3, 1, (LevelControl.Attributes.CurrentLevel, 100))}, priming=True)
+
+        # The publisher only reports LevelControl, which changed.
+        eventLoop = asyncio.new_event_loop()
+        self.addCleanup(eventLoop.close)
+        transaction = AsyncReadTransaction(None, eventLoop, None, returnClusterObject=False)
+        filters = nodeCache.DataVersionFilters(paths)
+        self.assertEqual(len(filters), 2)
+        transaction.UsePersistentCache(nodeCache, paths, filters)
+        for path, (dataVersion, data) in _report(4, 1, (LevelControl.Attributes.CurrentLevel, 50)).items():
+            transaction.handleAttributeData(path, dataVersion, chip.interaction_model.Status.Success.value, data)
+        transaction._handleReportEnd()
+        eventLoop.run_until_complete(asyncio.sleep(0))
+
+        attributes = transaction.GetReadResponse().attributes
+        self.assertEqual(attributes[1][OnOff], {DataVersion: 7, OnOff.Attributes.OnOff: True, OnOff.Attributes.OnTime: 10})
+        self.assertEqual(attributes[1][LevelControl], {DataVersion: 4, LevelControl.Attributes.CurrentLevel: 50})
+        cache.Flush()
+        nodeCache = PersistentAttributeCache(self._directory.name).GetNodeCache(1, 2)
+        self.assertIn(4, [dataVersionFilter.DataVersion for dataVersionFilter in nodeCache.DataVersionFilters(paths)])
+
+    def test_deferred_save(self):
+        OnOff = Clusters.OnOff
+        path = AttributePath.from_cluster(EndpointId=1, Cluster=OnOff)
+
+        def load():
+            return PersistentAttributeCache(self._directory.name).GetNodeCache(1, 2).DataVersionFilters([path])
+
+        async def run():
+            cache = PersistentAttributeCache(self._directory.name, saveDelay=0.05)
+            nodeCache = cache.GetNodeCache(1, 2)
+            for dataVersion in range(7, 10):
+                nodeCache.Update([path], _report(dataVersion, 1, (OnOff.Attributes.OnOff, True)), priming=False)
+            self.assertEqual(load(), [])
+            await asyncio.sleep(0.1)
+            cache.Flush()
+            self.assertEqual([dataVersionFilter.DataVersion for dataVersionFilter in load()], [9])
+
+            nodeCache.Update([path], _report(10, 1, (OnOff.Attributes.OnOff, False)), priming=False)
+            cache.Flush()
+            self.assertEqual([dataVersionFilter.DataVersion for dataVersionFilter in load()], [10])
+
+        with mock.patch.object(NodeAttributeCache, '_Write', autospec=True, side_effect=NodeAttributeCache._Write) as write:
+            asyncio.run(run())
+        # The reports received before the save are written at once.
+        self.assertEqual(write.call_count, 2)
+
+    def test_remove_node(self):
+        path = AttributePath.from_cluster(EndpointId=1, Cluster=Clusters.OnOff)
+        cache = PersistentAttributeCache(self._directory.name)
+        cache.GetNodeCache(1, 2).Update([path], _report(7, 1, (Clusters.OnOff.Attributes.OnOff, True)), priming=True)
+        cache.RemoveNode(1, 2)
+        self.assertEqual(os.listdir(self._directory.name), [])
+        self.assertEqual(PersistentAttributeCache(self._directory.name).GetNodeCache(1, 2).DataVersionFilters([path]), [])
+
+
+class TestAttributeCacheManager(unittest.TestCase):
+    def test_lru_eviction(self):
+        OnOff = Clusters.OnOff
+        paths = [AttributePath.from_cluster(EndpointId=1, Cluster=OnOff)]
+        manager = AttributeCacheManager(maxEntries=4)
+        for nodeId in (1, 2):
+            manager.GetNodeCache(nodeId).Update(
+                paths, _report(nodeId, 1, (OnOff.Attributes.OnOff, True), (OnOff.Attributes.OnTime, 10)), priming=True)
+        self.assertEqual(manager.GetAttributes(1)[1][OnOff],
+                         {DataVersion: 1, OnOff.Attributes.OnOff: True, OnOff.Attributes.OnTime: 10})
+
+        # Node 1 was used last, node 2 is evicted but keeps its data versions.
+        manager.GetNodeCache(3).Update(paths, _report(3, 1, (OnOff.Attributes.OnOff, False)), priming=True)
+        self.assertIsNone(manager.GetAttributes(2))
+        self.assertEqual(manager.GetDataVersions(2), {(1, OnOff.id): 2})
+        self.assertIsNotNone(manager.GetAttributes(3))
+
+        stats = manager.stats
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (2, 4, 1))
+        self.assertEqual((stats.nodes, stats.entries), (2, 3))
+        cachedTLV = [OnOff.Attributes.OnOff.ToTLV(None, True), OnOff.Attributes.OnTime.ToTLV(None, 10),
+                     OnOff.Attributes.OnOff.ToTLV(None, False)]
+        self.assertEqual(stats.bytes, sum(len(data) for data in cachedTLV))
+
+        manager.RemoveNode(1)
+        self.assertEqual((manager.stats.nodes, manager.stats.entries), (1, 1))
+        self.assertEqual(manager.GetDataVersions(1), {})
+
+    def test_read_transaction(self):
+        OnOff = Clusters.OnOff
+        paths = [AttributePath.from_cluster(EndpointId=1, Cluster=OnOff)]
+        manager = AttributeCacheManager(maxBytes=1024)
+        eventLoop = asyncio.new_event_loop()
+        self.addCleanup(eventLoop.close)
+
+        def read(report):
+            nodeCache = manager.GetNodeCache(5)
+            filters = nodeCache.DataVersionFilters(paths)
+            transaction = AsyncReadTransaction(None, eventLoop, None, returnClusterObject=False)
+            transaction.UsePersistentCache(nodeCache, paths, filters)
+            for path, (dataVersion, data) in report.items():
+                transaction.handleAttributeData(path, dataVersion, chip.interaction_model.Status.Success.value, data)
+            transaction._handleReportEnd()
+            eventLoop.run_until_complete(asyncio.sleep(0))
+            return filters, transaction.GetReadResponse().attributes
+
+        filters, _ = read(_report(7, 1, (OnOff.Attributes.OnOff, True), (OnOff.Attributes.OnTime, 10)))
+        self.assertEqual(filters, [])
+        # The cluster did not change, the publisher reports nothing.
+        filters, attributes = read({})
+        self.assertEqual([dataVersionFilter.DataVersion for dataVersionFilter in filters], [7])
+        self.assertEqual(attributes[1][OnOff], {DataVersion: 7, OnOff.Attributes.OnOff: True, OnOff.Attributes.OnTime: 10})
+        self.assertEqual(manager.stats.entries, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
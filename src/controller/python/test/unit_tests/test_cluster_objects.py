@@ -1,9 +1,14 @@
+import os
+import sys
+import tempfile
 import typing
 import unittest
 from dataclasses import dataclass
 
 import chip.ChipUtility
+import dacite
 from chip.clusters import ClusterObjects
+from chip.clusters.Types import Nullable, NullValue
 from chip.tlv import TLVReader, TLVWriter, uint
 
 '''
@@ -186,6 +191,102 @@ class TestClusterObjects(unittest.TestCase):
 
         self.assertEqual(res, data)
 
+    @dataclass
+    class StructWithNullableAndOptional(ClusterObjects.ClusterObject):
+        @chip.ChipUtility.classproperty
+        def descriptor(cls) -> ClusterObjects.ClusterObjectDescriptor:
+            return ClusterObjects.ClusterObjectDescriptor(
+                Fields=[
+                    ClusterObjects.ClusterObjectFieldDescriptor(
+                        Label="X", Tag=0, Type=typing.Union[None, Nullable, uint]),
+                    ClusterObjects.ClusterObjectFieldDescriptor(
+                        Label="Y", Tag=1, Type=typing.Optional[typing.List[TestClusterObjects.C]]),
+                ])
+
+        X: 'typing.Union[None, Nullable, uint]' = None
+        Y: 'typing.Optional[typing.List[TestClusterObjects.C]]' = None
+
+    def test_struct_with_nullable_and_optional_decode(self):
+        res = _encode_from_native_and_then_decode(
+            {0: None, 1: [{0: uint(1), 1: 2}], 5: 'unknown tag'}, TestClusterObjects.StructWithNullableAndOptional)
+        self.assertEqual(res, TestClusterObjects.StructWithNullableAndOptional(
+            X=NullValue, Y=[TestClusterObjects.C(X=1, Y=2)]))
+
+        res = _encode_from_native_and_then_decode({}, TestClusterObjects.StructWithNullableAndOptional)
+        self.assertEqual(res, TestClusterObjects.StructWithNullableAndOptional())
+
+    def test_struct_with_nullable_and_optional_encode(self):
+        SWNAO = TestClusterObjects.StructWithNullableAndOptional
+        res = _encode_and_then_decode_to_native(SWNAO(X=NullValue, Y=[TestClusterObjects.C(X=1, Y=2)]))
+        self.assertEqual(res, {0: None, 1: [{0: 1, 1: 2}]})
+
+        res = _encode_and_then_decode_to_native(SWNAO())
+        self.assertEqual(res, {})
+
+        # Structs may also be given as label dicts.
+        res = _encode_and_then_decode_to_native(SWNAO(X=3, Y=[{'X': 1, 'Y': 2}]))
+        self.assertEqual(res, {0: 3, 1: [{0: 1, 1: 2}]})
+
+    def test_from_dict(self):
+        C = TestClusterObjects.C
+        SWA = TestClusterObjects.StructWithArray
+        SWAOSWA = TestClusterObjects.StructWithArrayOfStructWithArray
+        data = {'X': ['test-str'], 'Y': [{'X': uint(1), 'Y': 2}], 'Z': [{'X': [uint(3)], 'Y': 4}],
+                'W': [{'Y': [C(X=uint(5), Y=6)]}], 'unknown': 7}
+        expected = SWAOSWA(X=['test-str'], Y=[C(X=1, Y=2)], Z=[SWA(X=[3], Y=4)], W=[SWAOSWA(Y=[C(X=5, Y=6)])])
+        self.assertEqual(SWAOSWA.FromDict(data), expected)
+        self.assertEqual(SWAOSWA.FromDict(data, strict=True), expected)
+
+        res = TestClusterObjects.StructWithNullableAndOptional.FromDict({'X': NullValue, 'Y': [{'X': uint(1)}]})
+        self.assertEqual(res, TestClusterObjects.StructWithNullableAndOptional(X=NullValue, Y=[C(X=1)]))
+
+        # Values are only checked against the field types in strict mode.
+        self.assertEqual(C.FromDict({'X': 'str', 'Y': 2}), C(X='str', Y=2))
+        with self.assertRaises(dacite.WrongTypeError):
+            C.FromDict({'X': 'str', 'Y': 2}, strict=True)
+
+    def test_descriptor(self):
+        SWNAO = TestClusterObjects.StructWithNullableAndOptional
+        descriptor = SWNAO.descriptor
+        self.assertIs(descriptor, SWNAO.descriptor)
+        self.assertIsNot(descriptor, TestClusterObjects.C.descriptor)
+
+        self.assertIs(descriptor.GetFieldByTag(1), descriptor.Fields[1])
+        self.assertIs(descriptor.GetFieldByLabel('X'), descriptor.Fields[0])
+        self.assertIsNone(descriptor.GetFieldByTag(2))
+        self.assertIsNone(descriptor.GetFieldByLabel('Z'))
+
+        x, y = descriptor.Fields
+        self.assertTrue(x.IsNullable)
+        self.assertTrue(x.IsOptional)
+        self.assertIs(x.UnderlyingType, uint)
+        self.assertIsNone(x.ListElementType)
+        self.assertFalse(y.IsNullable)
+        self.assertTrue(y.IsOptional)
+        self.assertIs(y.ListElementType, TestClusterObjects.C)
+
+    def test_encode_type_mismatch(self):
+        SWNAO = TestClusterObjects.StructWithNullableAndOptional
+        with self.assertRaisesRegex(ValueError, r'\.Y\[1\]\.'):
+            SWNAO(Y=[TestClusterObjects.C(X=1, Y=2), TestClusterObjects.C(X=-1, Y=2)]).ToTLV()
+        with self.assertRaisesRegex(ValueError, 'expected a struct'):
+            SWNAO(Y=[1]).ToTLV()
+        with self.assertRaisesRegex(ValueError, 'expected a list'):
+            SWNAO(Y=TestClusterObjects.C(X=1, Y=2)).ToTLV()
+        with self.assertRaisesRegex(ValueError, 'not nullable'):
+            TestClusterObjects.C(X=NullValue, Y=1).ToTLV()
+        with self.assertRaisesRegex(ValueError, 'not optional'):
+            TestClusterObjects.C(X=1).ToTLV()
+
+    def test_decode_type_mismatch(self):
+        with self.assertRaisesRegex(ValueError, r'\.Y\[1\]\.X'):
+            _encode_from_native_and_then_decode(
+                {1: [{0: uint(1)}, {0: 'str'}]}, TestClusterObjects.StructWithNullableAndOptional)
+        with self.assertRaisesRegex(ValueError, 'not nullable'):
+            _encode_from_native_and_then_decode({1: None}, TestClusterObjects.StructWithNullableAndOptional)
+        with self.assertRaisesRegex(ValueError, 'struct expected'):
+            _encode_from_native_and_then_decode({1: [uint(1)]}, TestClusterObjects.StructWithNullableAndOptional)
+
 
 class TestAttributeDescriptor(unittest.TestCase):
     class IntAttribute(ClusterObjects.ClusterAttributeDescriptor):
@@ -258,5 +359,128 @@ class TestAttributeDescriptor(unittest.TestCase):
         self.assertEqual(res, [1, 2, 3, 4, 5])
 
 
+class TestLazyClusterModules(unittest.TestCase):
+    CLUSTER_ID = 0xFFF1FC30
+    MODULE = '''
+import typing
+from dataclasses import dataclass
+
+from chip import ChipUtility
+from chip.clusters.ClusterObjects import Cluster, ClusterAttributeDescriptor, ClusterObjectDescriptor, ClusterObjectFieldDescriptor
+
+
+@dataclass
+class LazyCluster(Cluster):
+    id: typing.ClassVar[int] = 0xFFF1FC30
+
+    @ChipUtility.classproperty
+    def descriptor(cls) -> ClusterObjectDescriptor:
+        return ClusterObjectDescriptor(Fields=[ClusterObjectFieldDescriptor(Label="value", Tag=0x00000000, Type=int)])
+
+    value: int = 0
+
+    class Attributes:
+        @dataclass
+        class Value(ClusterAttributeDescriptor):
+            @ChipUtility.classproperty
+            def cluster_id(cls) -> int:
+                return 0xFFF1FC30
+
+            @ChipUtility.classproperty
+            def attribute_id(cls) -> int:
+                return 0x00000000
+
+            @ChipUtility.classproperty
+            def attribute_type(cls) -> ClusterObjectFieldDescriptor:
+                return ClusterObjectFieldDescriptor(Type=int)
+'''
+
+    def setUp(self):
+        self.moduleDir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.moduleDir.name, 'lazy_cluster_module.py'), 'w') as f:
+            f.write(self.MODULE)
+        sys.path.insert(0, self.moduleDir.name)
+        ClusterObjects.RegisterLazyClusterModules({self.CLUSTER_ID: 'lazy_cluster_module'})
+
+    def tearDown(self):
+        sys.path.remove(self.moduleDir.name)
+        sys.modules.pop('lazy_cluster_module', None)
+        for registry in (ClusterObjects.ALL_CLUSTERS, ClusterObjects.ALL_ATTRIBUTES):
+            dict.pop(registry, self.CLUSTER_ID, None)
+        self.moduleDir.cleanup()
+
+    def test_lookup_imports_module(self):
+        self.assertNotIn('lazy_cluster_module', sys.modules)
+        attribute = ClusterObjects.ALL_ATTRIBUTES[self.CLUSTER_ID][0x00000000]
+        self.assertIn('lazy_cluster_module', sys.modules)
+        self.assertIs(attribute, sys.modules['lazy_cluster_module'].LazyCluster.Attributes.Value)
+        self.assertIn(self.CLUSTER_ID, ClusterObjects.ALL_CLUSTERS)
+        self.assertEqual(attribute.FromTLV(attribute.ToTLV(None, 42)), 42)
+
+    def test_iteration_imports_module(self):
+        self.assertIn(self.CLUSTER_ID, list(ClusterObjects.ALL_CLUSTERS.keys()))
+
+    def test_unknown_cluster(self):
+        self.assertNotIn(0xFFF1FC31, ClusterObjects.ALL_CLUSTERS)
+        self.assertIsNone(ClusterObjects.ALL_CLUSTERS.get(0xFFF1FC31))
+        with self.assertRaises(KeyError):
+            ClusterObjects.ALL_ATTRIBUTES[0xFFF1FC31]
+
+    def test_generated_clusters(self):
+        import chip.clusters as Clusters
+        from chip.clusters.Objects import OnOff
+
+        self.assertIs(Clusters.OnOff, OnOff)
+        self.assertIs(ClusterObjects.ALL_CLUSTERS[OnOff.id], OnOff)
+        self.assertIs(ClusterObjects.ALL_ATTRIBUTES[OnOff.id][0x00000000], Clusters.OnOff.Attributes.OnOff)
+        self.assertIn('OnOff', dir(Clusters))
+        with self.assertRaises(AttributeError):
+            Clusters.NotACluster
+
+    def test_lookup_by_path(self):
+        import chip.clusters as Clusters
+        from chip.clusters.Attribute import AttributePath, TypedAttributePath
+        from chip.clusters.Command import CommandPath, FindCommandClusterObject
+
+        GeneralCommissioning = Clusters.GeneralCommissioning
+        path = CommandPath(EndpointId=0, ClusterId=GeneralCommissioning.id, CommandId=0x00000001)
+        self.assertIs(FindCommandClusterObject(False, path), GeneralCommissioning.Commands.ArmFailSafeResponse)
+        self.assertIsNone(FindCommandClusterObject(True, path))
+        typedPath = TypedAttributePath(Path=AttributePath(EndpointId=0, ClusterId=Clusters.OnOff.id, AttributeId=0x00000000))
+        self.assertIs(typedPath.ClusterType, Clusters.OnOff)
+        self.assertIs(typedPath.AttributeType, Clusters.OnOff.Attributes.OnOff)
+        with self.assertRaises(KeyError):
+            TypedAttributePath(Path=AttributePath(EndpointId=0, ClusterId=0xFFF1FC31, AttributeId=0x00000000))
+
+
+@unittest.skipIf(sys.version_info < (3, 10), 'slots dataclasses require Python 3.10')
+class TestSlotsClusterObjects(unittest.TestCase):
+    def test_slots_cluster(self):
+        @dataclass(slots=True)
+        class SlotsCluster(ClusterObjects.Cluster):
+            id: typing.ClassVar[int] = 0xFFF1FC32
+
+            @chip.ChipUtility.classproperty
+            def descriptor(cls) -> ClusterObjects.ClusterObjectDescriptor:
+                return ClusterObjects.ClusterObjectDescriptor(
+                    Fields=[
+                        ClusterObjects.ClusterObjectFieldDescriptor(Label="X", Tag=0, Type=uint),
+                        ClusterObjects.ClusterObjectFieldDescriptor(Label="Y", Tag=1, Type=typing.List[uint]),
+                    ])
+            X: 'uint' = None
+            Y: typing.List[uint] = None
+
+        try:
+            res = SlotsCluster.FromTLV(SlotsCluster(X=1, Y=[2, 3]).ToTLV())
+            self.assertFalse(hasattr(res, '__dict__'))
+            self.assertEqual(res, SlotsCluster(X=1, Y=[2, 3]))
+            res.SetDataVersion(42)
+            self.assertEqual(res.data_version, 42)
+            self.assertEqual(list(res.__rich_repr__()), [("(data version)", 42), ("X", 1), ("Y", [2, 3])])
+            self.assertIs(ClusterObjects.ALL_CLUSTERS[SlotsCluster.id], SlotsCluster)
+        finally:
+            dict.pop(ClusterObjects.ALL_CLUSTERS, SlotsCluster.id, None)
+
+
 if __name__ == '__main__':
     unittest.main()
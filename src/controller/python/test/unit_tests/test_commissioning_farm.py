@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+
+from chip.commissioning.farm import STAGE_COMMISSIONING, STAGE_PASE, STAGE_QUEUED, STAGE_WAIT_ON_NETWORK, CommissioningFarm
+
+'''
+This file contains tests for the parallel commissioning of devices by a CommissioningFarm.
+'''
+
+
+class _FakeController:
+    ''' Commissions a single device at a time, as ChipDeviceController does. '''
+
+    def __init__(self, nodeId: int, running: list):
+        self.nodeId = nodeId
+        self._running = running
+        self._lock = asyncio.Lock()
+        self.isShutdown = False
+
+    async def EstablishPASESession(self, setUpCode: str, nodeid: int):
+        async with self._lock:
+            await asyncio.sleep(0.01)
+
+    async def Commission(self, nodeid: int) -> int:
+        async with self._lock:
+            self._running.append(nodeid)
+            await asyncio.sleep(0.02)
+            self._running.remove(nodeid)
+            if nodeid == 3:
+                raise RuntimeError("commissioning failed")
+            return nodeid
+
+    async def CommissionOnNetwork(self, nodeId: int, setupPinCode: int, filterType, filter) -> int:
+        async with self._lock:
+            self._running.append(nodeId)
+            await asyncio.sleep(0.02)
+            self._running.remove(nodeId)
+            return nodeId
+
+    def Shutdown(self):
+        self.isShutdown = True
+
+
+class TestCommissioningFarm(unittest.TestCase):
+    def test_parallel_commissioning(self):
+        async def run():
+            running = []
+            maxRunning = 0
+            controllers = [_FakeController(112233 + i, running) for i in range(3)]
+            farm = CommissioningFarm(controllers, owns_controllers=True)
+            futures = [farm.submit_code(f'MT:{nodeId}', nodeId) for nodeId in range(1, 7)]
+
+            while not all(future.done() for future in futures):
+                maxRunning = max(maxRunning, len(running))
+                await asyncio.sleep(0.001)
+            await farm.join()
+            stats = farm.stats
+            await farm.shutdown()
+            return [future.result() for future in futures], maxRunning, stats, controllers
+
+        results, maxRunning, stats, controllers = asyncio.run(run())
+        self.assertEqual(maxRunning, 3)
+        self.assertEqual([result.effective_node_id for result in results], [1, 2, None, 4, 5, 6])
+        self.assertIsInstance(results[2].error, RuntimeError)
+        self.assertEqual(set(results[0].stage_seconds), {STAGE_QUEUED, STAGE_PASE, STAGE_COMMISSIONING})
+        # The last jobs waited for a free controller.
+        self.assertGreater(results[5].stage_seconds[STAGE_QUEUED], results[0].stage_seconds[STAGE_QUEUED])
+        self.assertEqual((stats.submitted, stats.succeeded, stats.failed, stats.in_progress), (6, 5, 1, 0))
+        self.assertGreater(stats.throughput_per_minute, 0)
+        self.assertGreater(stats.mean_stage_seconds[STAGE_COMMISSIONING], 0.015)
+        self.assertTrue(all(controller.isShutdown for controller in controllers))
+
+    def test_on_network_jobs_one_at_a_time(self):
+        async def run():
+            running = []
+            maxRunning = 0
+            farm = CommissioningFarm([_FakeController(112233 + i, running) for i in range(3)])
+            futures = [farm.submit_on_network(nodeId, 20202021) for nodeId in range(1, 4)]
+            while not all(future.done() for future in futures):
+                maxRunning = max(maxRunning, len(running))
+                await asyncio.sleep(0.001)
+            await farm.shutdown()
+            return [future.result() for future in futures], maxRunning
+
+        results, maxRunning = asyncio.run(run())
+        # The SDK binding shares its discovery state between the controllers.
+        self.assertEqual(maxRunning, 1)
+        self.assertEqual([result.effective_node_id for result in results], [1, 2, 3])
+        self.assertGreater(results[2].stage_seconds[STAGE_WAIT_ON_NETWORK], 0.03)
+
+    def test_shutdown_cancels_queued_jobs(self):
+        async def run():
+            farm = CommissioningFarm([_FakeController(112233, [])])
+            futures = [farm.submit_code('MT:0', nodeId) for nodeId in (1, 2)]
+            await asyncio.sleep(0)
+            await farm.shutdown()
+            return futures
+
+        futures = asyncio.run(run())
+        self.assertTrue(all(future.cancelled() for future in futures))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from chip.ChipDeviceCtrl import ChipDeviceControllerBase, MultiNodeRead, NodeReadResult
+
+'''
+This file contains tests for the parts of the device controller which do not need the Matter stack.
+'''
+
+
+class TestMultiNodeRead(unittest.TestCase):
+    def test_results_as_completed(self):
+        running = 0
+        maxRunning = 0
+        # Each node answers once its event is set.
+        answers = {}
+
+        async def readNode(nodeid: int):
+            nonlocal running, maxRunning
+            running += 1
+            maxRunning = max(maxRunning, running)
+            await answers[nodeid].wait()
+            running -= 1
+            if nodeid == 3:
+                raise asyncio.TimeoutError()
+            return f'response of {nodeid}'
+
+        async def run():
+            answers.update((nodeid, asyncio.Event()) for nodeid in range(1, 7))
+            reads = MultiNodeRead(readNode, [1, 2, 3, 4, 5, 6, 6], concurrency=3)
+            results = []
+            for nodeid in (3, 2):
+                answers[nodeid].set()
+                results.append(await reads.__anext__())
+            for answer in answers.values():
+                answer.set()
+            results += [result async for result in reads]
+            return reads, results
+
+        reads, results = asyncio.run(run())
+        self.assertEqual(maxRunning, 3)
+        self.assertEqual(sorted(result.nodeId for result in results), [1, 2, 3, 4, 5, 6])
+        # The first three nodes are read first, the third one fails first.
+        self.assertEqual([result.nodeId for result in results[:2]], [3, 2])
+        self.assertEqual(results[1], NodeReadResult(nodeId=2, result='response of 2'))
+        self.assertEqual(sorted(reads.succeeded), [1, 2, 4, 5, 6])
+        self.assertEqual(list(reads.failures), [3])
+        self.assertIsInstance(reads.failures[3], asyncio.TimeoutError)
+
+    def test_wait_and_cancel(self):
+        async def readNode(nodeid: int):
+            if nodeid > 2:
+                await asyncio.sleep(10)
+            return nodeid
+
+        async def run():
+            reads = MultiNodeRead(readNode, [1, 2], concurrency=16)
+            self.assertEqual(await reads.Wait(), {})
+            self.assertEqual(sorted(reads.succeeded), [1, 2])
+
+            reads = MultiNodeRead(readNode, [1, 3, 4], concurrency=2)
+            first = await reads.__anext__()
+            reads.Cancel()
+            return first, [result async for result in reads]
+
+        first, rest = asyncio.run(run())
+        self.assertEqual(first.nodeId, 1)
+        self.assertEqual(rest, [])
+
+
+class TestReadMany(unittest.TestCase):
+    def test_session_reused(self):
+        controller = mock.Mock()
+        controller.GetConnectedDevice = mock.AsyncMock(side_effect=lambda nodeid, **kwargs: f'device of {nodeid}')
+        controller.Read = mock.AsyncMock(side_effect=lambda nodeid, **kwargs: f'response of {nodeid}')
+
+        async def run():
+            reads = ChipDeviceControllerBase.ReadMany(controller, [1, 2], attributes=[()], readTimeoutMs=1000)
+            return sorted(result.result for result in [result async for result in reads])
+
+        self.assertEqual(asyncio.run(run()), ['response of 1', 'response of 2'])
+        # The session got for the timeout is the one read over.
+        self.assertEqual(controller.GetConnectedDevice.await_count, 2)
+        controller.Read.assert_any_await(1, attributes=[()], events=None, device='device of 1')
+        controller.Read.assert_any_await(2, attributes=[()], events=None, device='device of 2')
+
+
+if __name__ == '__main__':
+    unittest.main()
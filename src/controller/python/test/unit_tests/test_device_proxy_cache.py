@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from chip.ChipDeviceCtrl import ChipDeviceControllerBase, DeviceProxyWrapper
+from chip.DeviceProxyCache import DeviceProxyCache
+from chip.native import PyChipError
+
+'''
+This file contains tests for the cache of the operational device proxies of the nodes.
+'''
+
+MRP_PAYLOAD = 0
+LARGE_PAYLOAD = 1
+
+
+class _FakeDevice:
+    def __init__(self):
+        self.active = True
+        self.checks = 0
+
+    @property
+    def isActiveSession(self) -> bool:
+        self.checks += 1
+        return self.active
+
+
+class TestDeviceProxyCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.cache = DeviceProxyCache(ttl=60, livenessCheckInterval=5, clock=lambda: self.now)
+
+    def test_hits_and_liveness(self):
+        device = _FakeDevice()
+        self.assertIsNone(self.cache.Get(1, MRP_PAYLOAD))
+        self.cache.Put(1, MRP_PAYLOAD, device)
+        self.assertIs(self.cache.Get(1, MRP_PAYLOAD), device)
+        self.assertIsNone(self.cache.Get(1, LARGE_PAYLOAD))
+        # The session is not checked again before livenessCheckInterval.
+        self.assertEqual(device.checks, 0)
+        self.now = 6
+        self.assertIs(self.cache.Get(1, MRP_PAYLOAD), device)
+        self.assertEqual(device.checks, 1)
+
+        device.active = False
+        self.now = 12
+        self.assertIsNone(self.cache.Get(1, MRP_PAYLOAD))
+        self.cache.Put(1, MRP_PAYLOAD, _FakeDevice())
+
+        stats = self.cache.stats
+        self.assertEqual((stats.hits, stats.misses, stats.livenessFailures, stats.reestablishments), (2, 3, 1, 1))
+
+    def test_ttl_and_invalidation(self):
+        self.cache.Put(1, MRP_PAYLOAD, _FakeDevice())
+        self.cache.Put(1, LARGE_PAYLOAD, _FakeDevice())
+        self.cache.Put(2, MRP_PAYLOAD, _FakeDevice())
+        self.now = 60
+        self.assertIsNone(self.cache.Get(2, MRP_PAYLOAD))
+        self.cache.Invalidate(1)
+        self.assertIsNone(self.cache.Get(1, LARGE_PAYLOAD))
+        # Nothing left to invalidate.
+        self.cache.Invalidate(1)
+
+        stats = self.cache.stats
+        self.assertEqual((stats.expirations, stats.invalidations, stats.misses), (1, 1, 2))
+
+
+class TestGetConnectedDevice(unittest.TestCase):
+    def setUp(self):
+        self.controller = mock.Mock()
+        self.controller._paseNodeIds = set()
+        # The node has a PASE session.
+        self.controller._ChipStack.CallAsyncWithResult = mock.AsyncMock(return_value=PyChipError.from_code(0))
+        self.controller._deviceProxyCache = DeviceProxyCache()
+        self.cached = _FakeDevice()
+        self.controller._deviceProxyCache.Put(1, MRP_PAYLOAD, self.cached)
+
+    def _get(self, **kwargs):
+        return asyncio.run(ChipDeviceControllerBase.GetConnectedDevice(self.controller, 1, **kwargs))
+
+    def test_cache_first(self):
+        # The session is not looked up on the Matter thread.
+        self.assertIs(self._get(), self.cached)
+        self.assertEqual(self.controller._ChipStack.CallAsyncWithResult.await_count, 0)
+
+    def test_pase_session_first(self):
+        self.controller._paseNodeIds.add(1)
+        self.assertEqual(self._get()._proxyType, DeviceProxyWrapper.DeviceProxyType.COMMISSIONEE)
+        self.assertIs(self._get(allowPASE=False), self.cached)
+        self.assertEqual(self.controller._ChipStack.CallAsyncWithResult.await_count, 1)
+
+        # The cache is used again once the PASE session is gone.
+        self.controller._ChipStack.CallAsyncWithResult.return_value = PyChipError.from_code(0x32)
+        self.controller._deviceProxyCache.Put(1, MRP_PAYLOAD, self.cached)
+        # Looked up on the Matter thread instead, which is left failing here.
+        self.controller._ChipStack.CallAsync = mock.AsyncMock(side_effect=RuntimeError())
+        with self.assertRaises(RuntimeError):
+            self._get()
+        self.assertIs(self._get(), self.cached)
+        self.assertEqual(self.controller._paseNodeIds, set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+
+import chip.clusters as Clusters
+import chip.interaction_model
+from chip.clusters.Attribute import AsyncReadTransaction, EventHeader, EventPath, EventReadResult, ValueDecodeFailure
+from chip.clusters.EventStore import EventStore, NodeEventStore
+
+'''
+This file contains tests for the handling of the events received by reads and subscriptions.
+'''
+
+
+class TestEventDecoding(unittest.TestCase):
+    def test_handle_event_data(self):
+        event = Clusters.Switch.Events.MultiPressComplete(previousPosition=1, totalNumberOfPressesCounted=2)
+        transaction = AsyncReadTransaction(None, None, None, returnClusterObject=False)
+        status = chip.interaction_model.Status.Success.value
+        transaction.handleEventData(None, EventPath(ClusterId=event.cluster_id, EventId=event.event_id), event.ToTLV(), status)
+        transaction.handleEventData(None, EventPath(ClusterId=0xFFF1FC31, EventId=0), event.ToTLV(), status)
+
+        known, unknown = transaction.GetAllEventValues()
+        self.assertEqual(known.Data, event)
+        self.assertIsInstance(unknown.Data, ValueDecodeFailure)
+        self.assertEqual(unknown.Data.TLVValue, {0: 1, 1: 2})
+
+
+class TestEventStore(unittest.TestCase):
+    def _event(self, number: int, eventType, endpoint: int = 1):
+        return EventReadResult(Header=EventHeader(EndpointId=endpoint, ClusterId=eventType.cluster_id, EventId=eventType.event_id,
+                                                  EventNumber=number),
+                               Status=chip.interaction_model.Status.Success)
+
+    def test_ring_buffer(self):
+        StartUp = Clusters.BasicInformation.Events.StartUp
+        ShutDown = Clusters.BasicInformation.Events.ShutDown
+        SwitchLatched = Clusters.Switch.Events.SwitchLatched
+        store = EventStore(capacity=4).GetNodeStore(1)
+        paths = [EventPath()]
+        store.Add(paths, [self._event(10, StartUp, endpoint=0), self._event(11, SwitchLatched), self._event(12, SwitchLatched)])
+        # Re-delivered events are skipped.
+        store.Add(paths, [self._event(12, SwitchLatched), self._event(13, ShutDown, endpoint=0),
+                          self._event(14, SwitchLatched, endpoint=2)])
+
+        self.assertEqual(len(store), 4)
+        self.assertEqual(store.highestEventNumber, 14)
+        self.assertIsNone(store.GetEvent(10))
+        self.assertEqual(store.GetEvent(13).Header.EventId, ShutDown.event_id)
+        self.assertEqual([e.Header.EventNumber for e in store.GetEvents()], [11, 12, 13, 14])
+        latched = store.GetEvents(clusterId=SwitchLatched.cluster_id, eventId=SwitchLatched.event_id, endpointId=1)
+        self.assertEqual([e.Header.EventNumber for e in latched], [11, 12])
+        self.assertEqual([e.Header.EventNumber for e in store.GetEvents(clusterId=Clusters.BasicInformation.id)], [13])
+        self.assertEqual([e.Header.EventNumber for e in store.GetEvents(minEventNumber=13)], [13, 14])
+
+    def test_event_number_filter(self):
+        SwitchLatched = Clusters.Switch.Events.SwitchLatched
+        switch = EventPath.from_cluster(EndpointId=1, Cluster=Clusters.Switch)
+        basicInformation = EventPath.from_cluster(EndpointId=0, Cluster=Clusters.BasicInformation)
+        store = NodeEventStore(capacity=10)
+        self.assertIsNone(store.EventNumberFilter([switch]))
+
+        store.Add([switch], [self._event(20, SwitchLatched), self._event(25, SwitchLatched)])
+        self.assertEqual(store.EventNumberFilter([switch]), 26)
+        self.assertEqual(store.EventNumberFilter([EventPath.from_event(EndpointId=1, Event=SwitchLatched, Urgent=True)]), 26)
+        # The events of the other cluster were never read.
+        self.assertIsNone(store.EventNumberFilter([switch, basicInformation]))
+        store.Add([basicInformation], [self._event(22, Clusters.BasicInformation.Events.StartUp, endpoint=0)])
+        self.assertEqual(store.EventNumberFilter([switch, basicInformation]), 23)
+
+    def test_transaction(self):
+        StartUp = Clusters.BasicInformation.Events.StartUp
+        store = NodeEventStore(capacity=10)
+
+        async def run():
+            eventLoop = asyncio.get_running_loop()
+            transaction = AsyncReadTransaction(eventLoop.create_future(), eventLoop, None, returnClusterObject=False,
+                                               maxEvents=2)
+            transaction.UseEventStore(store, [EventPath()])
+            for number in range(3):
+                event = self._event(number, StartUp, endpoint=0)
+                transaction.handleEventData(event.Header, EventPath(EndpointId=0, ClusterId=StartUp.cluster_id,
+                                                                    EventId=StartUp.event_id),
+                                            StartUp(softwareVersion=number).ToTLV(), chip.interaction_model.Status.Success.value)
+            transaction.handleReportEnd()
+            await asyncio.sleep(0)
+            return transaction.GetAllEventValues()
+
+        events = asyncio.run(run())
+        self.assertEqual([event.Data.softwareVersion for event in events], [1, 2])
+        self.assertEqual([event.Header.EventNumber for event in store.GetEvents()], [0, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import json
+import unittest
+
+import chip.clusters as Clusters
+import chip.interaction_model
+from chip.clusters.Attribute import AsyncReadTransaction, AttributePath
+from chip.metrics import Histogram, ReadMetrics, ReadPhase
+
+'''
+This file contains tests for the instrumentation of reads and subscriptions, and its exporters.
+'''
+
+
+class TestReadMetrics(unittest.TestCase):
+    def test_histogram(self):
+        histogram = Histogram([0.1, 1, 10])
+        for value in (0.05, 0.1, 0.5, 20):
+            histogram.Observe(value)
+        self.assertEqual(histogram.CumulativeCounts(), [(0.1, 2), (1, 3), (10, 3), (float('inf'), 4)])
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.sum, 20.65)
+
+    def test_exporters(self):
+        metrics = ReadMetrics(buckets=[0.01, 0.1])
+        metrics.OnPhase(1, ReadPhase.SESSION, 0.05)
+        metrics.OnPhase(2, ReadPhase.SESSION, 0.2)
+        metrics.OnDecoded(1, 'attribute', 3, 120)
+        metrics.OnTransaction(1, 'read', True)
+        metrics.OnTransaction(2, 'read', False)
+
+        text = metrics.PrometheusText()
+        self.assertIn('# TYPE chip_read_phase_seconds histogram', text)
+        self.assertIn('chip_read_phase_seconds_bucket{phase="session",le="0.1"} 1', text)
+        self.assertIn('chip_read_phase_seconds_bucket{phase="session",le="+Inf"} 2', text)
+        self.assertIn('chip_read_phase_seconds_count{phase="session"} 2', text)
+        self.assertIn('chip_read_transactions_total{interaction="read",outcome="failure"} 1', text)
+        self.assertIn('chip_read_decoded_bytes_total{kind="attribute"} 120', text)
+        self.assertIn('chip_read_node_phase_seconds_total{node="0x0000000000000002",phase="session"} 0.2', text)
+
+        snapshot = json.loads(metrics.Json())
+        self.assertEqual(snapshot['phases']['session']['buckets'], [[0.01, 0], [0.1, 1], [None, 2]])
+        self.assertEqual(snapshot['decoded'], {'attribute': {'elements': 3, 'bytes': 120}})
+        self.assertEqual(snapshot['nodes']['0x0000000000000001']['transactions'],
+                         [{'interaction': 'read', 'outcome': 'success', 'count': 1}])
+
+        metrics.Reset()
+        self.assertEqual(metrics.PrometheusText(), '')
+
+    def test_transaction_phases(self):
+        OnOff = Clusters.OnOff
+        metrics = ReadMetrics()
+
+        async def run():
+            eventLoop = asyncio.get_running_loop()
+            transaction = AsyncReadTransaction(eventLoop.create_future(), eventLoop, None, returnClusterObject=True)
+            transaction.UseMetrics(metrics, 7)
+            for attribute, value in ((OnOff.Attributes.OnOff, True), (OnOff.Attributes.OnTime, 10)):
+                path = AttributePath(EndpointId=1, ClusterId=OnOff.id, AttributeId=attribute.attribute_id)
+                transaction.handleAttributeData(path, 1, chip.interaction_model.Status.Success.value,
+                                                attribute.ToTLV(None, value))
+            transaction.handleReportEnd()
+            return transaction.GetReadResponse()
+
+        response = asyncio.run(run())
+        self.assertTrue(response.attributes[1][OnOff].onOff)
+        snapshot = metrics.Snapshot()
+        self.assertEqual(snapshot['phases']['decode']['count'], 2)
+        self.assertEqual(snapshot['phases']['cache']['count'], 1)
+        self.assertEqual(snapshot['nodes']['0x0000000000000007']['decoded']['attribute']['elements'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+
+import chip.clusters as Clusters
+from chip.clusters.Attribute import AsyncReadTransaction, AttributePath, DataVersion, ReadCoalescer
+
+'''
+This file contains tests for the coalescing of concurrent reads of a node.
+'''
+
+
+class TestReadCoalescer(unittest.TestCase):
+    def _response(self):
+        OnOff = Clusters.OnOff
+        return AsyncReadTransaction.ReadResponse(
+            attributes={1: {OnOff: {DataVersion: 7, OnOff.Attributes.OnOff: True, OnOff.Attributes.OnTime: 10}},
+                        2: {OnOff: {DataVersion: 3, OnOff.Attributes.OnOff: False}}},
+            events=[],
+            tlvAttributes={1: {OnOff.id: {OnOff.Attributes.OnOff.attribute_id: True,
+                                          OnOff.Attributes.OnTime.attribute_id: 10}},
+                           2: {OnOff.id: {OnOff.Attributes.OnOff.attribute_id: False}}})
+
+    def test_subset(self):
+        OnOff = Clusters.OnOff
+        subset = self._response().Subset([AttributePath(EndpointId=1, ClusterId=OnOff.id,
+                                                        AttributeId=OnOff.Attributes.OnTime.attribute_id)])
+        self.assertEqual(subset.attributes, {1: {OnOff: {DataVersion: 7, OnOff.Attributes.OnTime: 10}}})
+        self.assertEqual(subset.tlvAttributes, {1: {OnOff.id: {OnOff.Attributes.OnTime.attribute_id: 10}}})
+
+    def test_merges_identical_and_subset_reads(self):
+        OnOff = Clusters.OnOff
+        wildcard = [AttributePath(ClusterId=OnOff.id)]
+        onTime = [AttributePath(EndpointId=1, ClusterId=OnOff.id, AttributeId=OnOff.Attributes.OnTime.attribute_id)]
+        reads = []
+
+        async def read():
+            reads.append(None)
+            await asyncio.sleep(0.01)
+            return self._response()
+
+        async def run():
+            coalescer = ReadCoalescer()
+            responses = await asyncio.gather(
+                coalescer.Read(1, wildcard, None, None, (), read),
+                coalescer.Read(1, wildcard, None, None, (), read),
+                coalescer.Read(1, onTime, None, None, (), read),
+                # Not merged: other node, other options.
+                coalescer.Read(2, onTime, None, None, (), read),
+                coalescer.Read(1, onTime, None, None, (True,), read))
+            return coalescer, responses
+
+        coalescer, responses = asyncio.run(run())
+        self.assertEqual(len(reads), 3)
+        self.assertEqual((coalescer.metrics.reads, coalescer.metrics.identicalMerged, coalescer.metrics.subsetMerged),
+                         (3, 1, 1))
+        self.assertIs(responses[0], responses[1])
+        self.assertEqual(list(responses[2].tlvAttributes), [1])
+        self.assertEqual(coalescer._inflight, {})
+
+    def test_failure_is_shared(self):
+        paths = [AttributePath(ClusterId=Clusters.OnOff.id)]
+
+        async def read():
+            await asyncio.sleep(0.01)
+            raise asyncio.TimeoutError()
+
+        async def run():
+            coalescer = ReadCoalescer()
+            return await asyncio.gather(coalescer.Read(1, paths, None, None, (), read),
+                                        coalescer.Read(1, paths, None, None, (), read), return_exceptions=True)
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(result, asyncio.TimeoutError) for result in results))
+
+    def test_cancelled_callers(self):
+        paths = [AttributePath(ClusterId=Clusters.OnOff.id)]
+        cancelled = []
+
+        async def read():
+            try:
+                await asyncio.sleep(0.02)
+            except asyncio.CancelledError:
+                cancelled.append(None)
+                raise
+            return self._response()
+
+        async def run():
+            coalescer = ReadCoalescer()
+            # The caller which started the read is cancelled, the merged one still gets the response.
+            first = asyncio.ensure_future(coalescer.Read(1, paths, None, None, (), read))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(coalescer.Read(1, paths, None, None, (), read))
+            await asyncio.sleep(0)
+            first.cancel()
+            response = await second
+            self.assertTrue(first.cancelled())
+            self.assertEqual(cancelled, [])
+
+            # The read is cancelled once all its callers are, and is not merged into afterwards.
+            third = asyncio.ensure_future(coalescer.Read(1, paths, None, None, (), read))
+            await asyncio.sleep(0)
+            third.cancel()
+            await asyncio.sleep(0)
+            self.assertEqual(coalescer._inflight, {})
+            await asyncio.sleep(0)
+            self.assertEqual(cancelled, [None])
+            return response
+
+        self.assertEqual(list(asyncio.run(run()).tlvAttributes), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,335 @@
+import asyncio
+import ctypes
+import threading
+import unittest
+from unittest import mock
+
+import chip.clusters as Clusters
+import chip.interaction_model
+from chip.clusters.Attribute import (AsyncReadTransaction, AttributePath, DataVersion, EventHeader, EventPath, ReportOverflowPolicy,
+                                     SubscriptionReport, SubscriptionTransaction, TypedAttributePath)
+from chip.clusters.SubscriptionMultiplexer import SubscriptionMultiplexer
+from chip.native import PyChipError
+
+'''
+This file contains tests for the subscriptions of attributes and events, without the stack.
+'''
+
+
+def _subscribe(eventLoop):
+    ''' Returns an AsyncReadTransaction with an established subscription, without the stack. '''
+    transaction = AsyncReadTransaction(eventLoop.create_future(), eventLoop, None, returnClusterObject=False)
+    with mock.patch('builtins.chipStack', create=True):
+        transaction._handleSubscriptionEstablished(1)
+    subscription = transaction.GetSubscriptionHandler()
+    subscription.SetAttributeUpdateCallback(lambda path, transaction: None)
+    subscription.SetEventUpdateCallback(lambda event, transaction: None)
+    return transaction, subscription
+
+
+def _report(transaction, dataVersion: int, *values):
+    ''' Feeds a report of (attribute, value) on endpoint 1 to the transaction. '''
+    for attribute, value in values:
+        path = AttributePath(EndpointId=1, ClusterId=attribute.cluster_id, AttributeId=attribute.attribute_id)
+        transaction.handleAttributeData(path, dataVersion, chip.interaction_model.Status.Success.value,
+                                        attribute.ToTLV(None, value))
+    transaction.handleReportEnd()
+
+
+class TestSubscriptionReports(unittest.TestCase):
+    async def _collect(self, reports, count: int):
+        return [await reports.__anext__() for _ in range(count)]
+
+    async def _collect_all(self, reports):
+        return [report async for report in reports]
+
+    def test_reports(self):
+        OnOff = Clusters.OnOff
+        onOffPath = AttributePath.from_attribute(EndpointId=1, Attribute=OnOff.Attributes.OnOff)
+
+        async def run():
+            transaction, subscription = _subscribe(asyncio.get_running_loop())
+            reports = subscription.Reports()
+            _report(transaction, 7, (OnOff.Attributes.OnOff, True))
+            event = Clusters.Switch.Events.InitialPress(newPosition=1)
+            transaction.handleEventData(EventHeader(EndpointId=1, ClusterId=event.cluster_id, EventId=event.event_id),
+                                        EventPath(EndpointId=1, ClusterId=event.cluster_id, EventId=event.event_id),
+                                        event.ToTLV(), chip.interaction_model.Status.Success.value)
+            transaction.handleReportEnd()
+            received = await self._collect(reports, 2)
+            await reports.aclose()
+            self.assertEqual([report async for report in reports], [])
+            self.assertEqual(subscription._reportQueues, ())
+            return received
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first, SubscriptionReport(Paths=[onOffPath], DataVersions={(1, OnOff.id): 7}, Values={onOffPath: True}))
+        self.assertEqual(second.Paths, [])
+        self.assertEqual([event.Data for event in second.Events], [Clusters.Switch.Events.InitialPress(newPosition=1)])
+
+    def test_report_values(self):
+        OnOff = Clusters.OnOff
+        onTime = AttributePath.from_attribute(EndpointId=1, Attribute=OnOff.Attributes.OnTime)
+
+        async def run():
+            transaction, subscription = _subscribe(asyncio.get_running_loop())
+            reports = subscription.Reports()
+            _report(transaction, 7, (OnOff.Attributes.OnTime, 10))
+            _report(transaction, 8, (OnOff.Attributes.OnTime, 20))
+            received = await self._collect(reports, 2)
+            return received, subscription.GetAttribute(TypedAttributePath(Path=onTime))
+
+        # Each report keeps its own values, while the subscription has the latest ones.
+        (first, second), latest = asyncio.run(run())
+        self.assertEqual(first.Values, {onTime: 10})
+        self.assertEqual(second.Values, {onTime: 20})
+        self.assertEqual(first.Merge(second).Values, {onTime: 20})
+        self.assertEqual(latest, 20)
+
+    def test_subscription_ends(self):
+        async def run(end):
+            transaction, subscription = _subscribe(asyncio.get_running_loop())
+            reports = subscription.Reports()
+            _report(transaction, 7, (Clusters.OnOff.Attributes.OnOff, True))
+            end(transaction)
+            received = await asyncio.wait_for(self._collect_all(reports), 1)
+            # The iteration over the reports asked for afterwards ends right away.
+            self.assertEqual(await asyncio.wait_for(self._collect_all(subscription.Reports()), 1), [])
+            return received
+
+        def done(transaction):
+            # Stands for the reference taken on the transaction by Read().
+            ctypes.pythonapi.Py_IncRef(ctypes.py_object(transaction))
+            transaction._handleDone()
+
+        for end in (lambda transaction: transaction.handleError(PyChipError(0x32)), done):
+            self.assertEqual(len(asyncio.run(run(end))), 1)
+
+    def test_overflow_policies(self):
+        OnOff = Clusters.OnOff
+
+        async def run(overflowPolicy):
+            transaction, subscription = _subscribe(asyncio.get_running_loop())
+            reports = subscription.Reports(maxsize=2, overflowPolicy=overflowPolicy)
+            _report(transaction, 7, (OnOff.Attributes.OnOff, True))
+            _report(transaction, 8, (OnOff.Attributes.OnTime, 10))
+            _report(transaction, 9, (OnOff.Attributes.OnOff, False), (OnOff.Attributes.OffWaitTime, 20))
+            return await self._collect(reports, 2), reports.droppedReports
+
+        (first, second), dropped = asyncio.run(run(ReportOverflowPolicy.DROP_OLDEST))
+        self.assertEqual(dropped, 1)
+        self.assertEqual([path.AttributeId for path in first.Paths], [OnOff.Attributes.OnTime.attribute_id])
+        self.assertEqual(second.DataVersions, {(1, OnOff.id): 9})
+
+        (first, second), dropped = asyncio.run(run(ReportOverflowPolicy.COALESCE))
+        self.assertEqual(dropped, 0)
+        self.assertEqual(first.DataVersions, {(1, OnOff.id): 7})
+        self.assertEqual(sorted(path.AttributeId for path in second.Paths),
+                         [OnOff.Attributes.OnOff.attribute_id, OnOff.Attributes.OnTime.attribute_id,
+                          OnOff.Attributes.OffWaitTime.attribute_id])
+        self.assertEqual(second.DataVersions, {(1, OnOff.id): 9})
+
+    def test_block_policy(self):
+        async def run():
+            _, subscription = _subscribe(asyncio.get_running_loop())
+            reports = subscription.Reports(maxsize=1, overflowPolicy=ReportOverflowPolicy.BLOCK)
+            # Stands for the Matter thread, which waits for room in the queue.
+            producer = threading.Thread(target=lambda: [subscription._PutReport(SubscriptionReport(DataVersions={(1, 6): i}))
+                                                        for i in range(3)])
+            producer.start()
+            received = await self._collect(reports, 3)
+            producer.join()
+            return received
+
+        self.assertEqual([report.DataVersions for report in asyncio.run(run())],
+                         [{(1, 6): 0}, {(1, 6): 1}, {(1, 6): 2}])
+
+
+class TestAttributeBatchUpdate(unittest.TestCase):
+    def test_batch_callback(self):
+        OnOff = Clusters.OnOff
+
+        async def run():
+            transaction, subscription = _subscribe(asyncio.get_running_loop())
+            perPath = mock.Mock()
+            batches = []
+            subscription.SetAttributeUpdateCallback(perPath)
+            subscription.SetAttributeBatchUpdateCallback(lambda paths, transaction: batches.append(paths))
+            _report(transaction, 7, (OnOff.Attributes.OnOff, True), (OnOff.Attributes.OnTime, 10))
+            _report(transaction, 8)
+            await asyncio.sleep(0)
+            perPath.assert_not_called()
+            return batches
+
+        batches = asyncio.run(run())
+        self.assertEqual(len(batches), 1)
+        self.assertEqual({(path.AttributeType, path.AttributeName, path.Path.EndpointId) for path in batches[0]},
+                         {(OnOff.Attributes.OnOff, 'onOff', 1), (OnOff.Attributes.OnTime, 'onTime', 1)})
+        # Resolved from the cache the second time.
+        self.assertEqual(TypedAttributePath(Path=batches[0][0].Path), batches[0][0])
+
+    def test_async_batch_callback(self):
+        async def run():
+            transaction, subscription = _subscribe(asyncio.get_running_loop())
+            received = asyncio.get_running_loop().create_future()
+
+            async def callback(paths, transaction):
+                received.set_result(paths)
+
+            subscription.SetAttributeBatchUpdateCallback(callback, isAsync=True)
+            _report(transaction, 7, (Clusters.OnOff.Attributes.OnOff, True))
+            return await asyncio.wait_for(received, 1)
+
+        self.assertEqual([path.AttributeType for path in asyncio.run(run())], [Clusters.OnOff.Attributes.OnOff])
+
+
+class TestCancelledSubscription(unittest.TestCase):
+    def _run(self, cancelBeforeEstablishment: bool):
+        async def run():
+            eventLoop = asyncio.get_running_loop()
+            transaction = AsyncReadTransaction(eventLoop.create_future(), eventLoop, None, returnClusterObject=False)
+            if cancelBeforeEstablishment:
+                transaction.Cancel()
+            transaction._handleSubscriptionEstablished(1)
+            if not cancelBeforeEstablishment:
+                transaction.Cancel()
+            return transaction
+
+        with mock.patch('builtins.chipStack', create=True) as chipStack, \
+                mock.patch('chip.native.GetLibraryHandle') as getLibraryHandle:
+            chipStack.Call.side_effect = lambda callFunct: callFunct()
+            transaction = asyncio.run(run())
+        getLibraryHandle.return_value.pychip_ReadClient_ShutdownSubscription.assert_called_once()
+        self.assertTrue(transaction.GetSubscriptionHandler()._isDone)
+
+    def test_established_after_cancellation(self):
+        # E.g. ReadMany timed out while the subscription was being established.
+        self._run(cancelBeforeEstablishment=True)
+
+    def test_cancelled_after_establishment(self):
+        self._run(cancelBeforeEstablishment=False)
+
+
+class TestSubscriptionMultiplexer(unittest.TestCase):
+    def test_shared_subscription(self):
+        OnOff = Clusters.OnOff
+        LevelControl = Clusters.LevelControl
+        onOffCluster = AttributePath.from_cluster(EndpointId=1, Cluster=OnOff)
+        onOff = AttributePath.from_attribute(EndpointId=1, Attribute=OnOff.Attributes.OnOff)
+        currentLevel = AttributePath.from_attribute(EndpointId=1, Attribute=LevelControl.Attributes.CurrentLevel)
+        subscribed = []
+        transactions = []
+
+        async def subscribe(nodeid, attributePaths, eventPaths, reportInterval):
+            subscribed.append((nodeid, attributePaths, reportInterval))
+            transaction, subscription = _subscribe(asyncio.get_running_loop())
+            transactions.append(transaction)
+            return subscription
+
+        def changes(consumer):
+            received = []
+            consumer.SetAttributeUpdateCallback(lambda path, transaction: received.append(path.AttributeType))
+            return received
+
+        async def run():
+            multiplexer = SubscriptionMultiplexer(subscribe)
+            cluster = await multiplexer.Subscribe(1, [onOffCluster], reportInterval=(0, 60))
+            attribute = await multiplexer.Subscribe(1, [onOff], reportInterval=(0, 60))
+            # Covered by the subscription of the first consumer.
+            self.assertEqual(len(subscribed), 1)
+            level = await multiplexer.Subscribe(1, [currentLevel], reportInterval=(5, 30))
+            self.assertEqual(subscribed[-1], (1, [onOffCluster, currentLevel], (0, 30)))
+            self.assertEqual(shutdown.call_count, 1)
+
+            clusterChanges, attributeChanges, levelChanges = changes(cluster), changes(attribute), changes(level)
+            levelReports = level.Reports()
+            _report(transactions[-1], 2, (OnOff.Attributes.OnOff, True), (OnOff.Attributes.OnTime, 10))
+            _report(transactions[-1], 3, (LevelControl.Attributes.CurrentLevel, 100))
+            self.assertEqual(sorted(clusterChanges, key=lambda a: a.attribute_id),
+                             [OnOff.Attributes.OnOff, OnOff.Attributes.OnTime])
+            self.assertEqual(attributeChanges, [OnOff.Attributes.OnOff])
+            self.assertEqual(levelChanges, [LevelControl.Attributes.CurrentLevel])
+            report = await asyncio.wait_for(levelReports.__anext__(), 1)
+            self.assertEqual(report.Paths, [currentLevel])
+            self.assertEqual(report.DataVersions, {(1, LevelControl.id): 3})
+            self.assertEqual(report.Values, {currentLevel: 100})
+            self.assertEqual(attribute.GetAttributes(), {1: {OnOff: {DataVersion: 2, OnOff.Attributes.OnOff: True}}})
+
+            level.Shutdown()
+            await asyncio.sleep(0)
+            self.assertEqual(subscribed[-1], (1, [onOffCluster], (0, 60)))
+            self.assertEqual([r async for r in levelReports], [])
+            cluster.Shutdown()
+            attribute.Shutdown()
+            await asyncio.sleep(0)
+            self.assertEqual(len(subscribed), 3)
+            self.assertEqual(shutdown.call_count, 3)
+            self.assertEqual(multiplexer._nodes, {})
+
+        with mock.patch.object(SubscriptionTransaction, 'Shutdown') as shutdown:
+            asyncio.run(run())
+
+    def test_failed_subscription(self):
+        async def subscribe(nodeid, attributePaths, eventPaths, reportInterval):
+            raise asyncio.TimeoutError()
+
+        async def run():
+            multiplexer = SubscriptionMultiplexer(subscribe)
+            with self.assertRaises(asyncio.TimeoutError):
+                await multiplexer.Subscribe(1, [AttributePath.from_cluster(EndpointId=1, Cluster=Clusters.OnOff)])
+            with self.assertRaises(ValueError):
+                await multiplexer.Subscribe(1)
+            return multiplexer
+
+        self.assertEqual(asyncio.run(run())._nodes, {})
+
+    def test_subscription_error(self):
+        OnOff = Clusters.OnOff
+        onOff = AttributePath.from_attribute(EndpointId=1, Attribute=OnOff.Attributes.OnOff)
+        transactions = []
+        failures = []
+
+        async def subscribe(nodeid, attributePaths, eventPaths, reportInterval):
+            if failures:
+                raise failures.pop()
+            transaction, subscription = _subscribe(asyncio.get_running_loop())
+            transactions.append(transaction)
+            return subscription
+
+        async def run():
+            multiplexer = SubscriptionMultiplexer(subscribe)
+            consumer = await multiplexer.Subscribe(1, [onOff])
+            errors = []
+            consumer.SetErrorCallback(lambda chipError, consumer: errors.append(chipError))
+            _report(transactions[-1], 2, (OnOff.Attributes.OnOff, True))
+            self.assertTrue(consumer.GetAttribute(TypedAttributePath(Path=onOff)))
+            with self.assertRaises(KeyError):
+                consumer.GetAttribute(TypedAttributePath(
+                    Path=AttributePath.from_attribute(EndpointId=1, Attribute=OnOff.Attributes.OnTime)))
+
+            # Re-subscribed once the subscription ended on an error.
+            transactions[-1].handleError(PyChipError.from_code(0x32))
+            self.assertEqual(errors, [0x32])
+            await asyncio.sleep(0.01)
+            self.assertEqual(len(transactions), 2)
+            self.assertIs(consumer.subscription, transactions[-1].GetSubscriptionHandler())
+
+            # The re-subscription fails, the next consumer subscribes again rather than attaching to the failed one.
+            failures.append(asyncio.TimeoutError())
+            transactions[-1].handleError(PyChipError.from_code(0x32))
+            await asyncio.sleep(0.01)
+            self.assertIsNone(consumer.subscription)
+            with self.assertRaises(KeyError):
+                consumer.GetAttribute(TypedAttributePath(Path=onOff))
+            await multiplexer.Subscribe(1, [onOff])
+            self.assertEqual(len(transactions), 3)
+            self.assertIs(consumer.subscription, transactions[-1].GetSubscriptionHandler())
+            # The subscriptions which ended on an error are not shut down again.
+            self.assertEqual(shutdown.call_count, 0)
+
+        with mock.patch.object(SubscriptionTransaction, 'Shutdown') as shutdown:
+            asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
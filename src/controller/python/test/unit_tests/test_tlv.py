@@ -17,7 +17,8 @@
 
 import unittest
 
-from chip.tlv import TLVList, TLVReader, TLVWriter
+import chip.tlv
+from chip.tlv import LazyTLVArrayView, LazyTLVStructureView, TLVEventReader, TLVList, TLVReader, TLVWriter, float32, iterElements
 from chip.tlv import uint as tlvUint
 
 
@@ -130,6 +131,38 @@ class TestTLVWriter(unittest.TestCase):
                                                0x18   # End of container
                                                ]))
 
+    def test_fully_qualified_tag(self):
+        writer = TLVWriter()
+        writer.startStructure(None)
+        writer.put((0xfff10001, 0x10000), True)
+        self.assertEqual(writer.encoding, bytearray([0x15, 0b11101001, 0xf1, 0xff, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00]))
+
+    def test_encoded_size(self):
+        writer = TLVWriter()
+        for val in [1, tlvUint(70000), "h\u00e9llo", b"\x00" * 300, [1.5, float32(2.5), None, True], {0: {1: "x"}}]:
+            self.assertEqual(writer.encodedSize(None, val), len(self._getEncoded(val)))
+        self.assertEqual(writer.encoding, bytearray())
+        with self.assertRaises(ValueError):
+            writer.encodedSize(None, {0: object()})
+
+    def test_failed_put_writes_nothing(self):
+        writer = TLVWriter()
+        writer.startStructure(None)
+        with self.assertRaises(ValueError):
+            writer.put(1, [1, 2, {0: 1, 1: object()}])
+        self.assertEqual(writer.encoding, bytearray([0x15]))
+
+    def test_reset(self):
+        writer = TLVWriter()
+        writer.startStructure(None)
+        writer.put(1, "abc")
+        encoding = writer.encoding
+        writer.reset()
+        self.assertIs(writer.encoding, encoding)
+        self.assertEqual(writer.encoding, bytearray())
+        writer.put(None, tlvUint(1))
+        self.assertEqual(writer.encoding, bytearray([0x04, 0x01]))
+
 
 class TestTLVReader(unittest.TestCase):
     def _read_case(self, input, answer):
@@ -195,6 +228,144 @@ class TestTLVReader(unittest.TestCase):
                          0x18   # End of container
                          ], TLVList([(None, 1), (None, TLVList([(None, 2), (3, 4)]))]))
 
+    def test_scalars(self):
+        self._read_case([0b00001000], False)
+        self._read_case([0b00001001], True)
+        self._read_case([0b00001011, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xf8, 0x3f], 1.5)
+        self._read_case([0b00001010, 0x00, 0x00, 0xc0, 0x3f], float32(1.5))
+        self._read_case([0b00001100, 0x05, 0x68, 0x65, 0x6c, 0x6c, 0x6f], 'hello')
+        self._read_case([0b00001101, 0x02, 0x00, 0x68, 0x69], 'hi')
+        self._read_case([0b00010000, 0x02, 0xde, 0xad], b'\xde\xad')
+        # Strings that are not valid UTF-8 are returned as bytes.
+        self._read_case([0b00001100, 0x01, 0xff], b'\xff')
+        self.assertIsNone(TLVReader(bytearray([0b00010100])).get()["Any"])
+
+    def test_profile_tags(self):
+        val = {
+            1: 0,
+            (None, 42): "implicit",
+            (None, 0x12345): "implicit 4-byte",
+            (0, 7): "common",
+            (0x235A0000, 42): "fully qualified",
+        }
+        writer = TLVWriter()
+        writer.put(None, val)
+        self._read_case(writer.encoding, val)
+
+    def test_buffer_types(self):
+        encoding = b'\x15\x24\x00\x01\x2c\x01\x02hi\x18'
+        for buf in (encoding, bytearray(encoding), memoryview(encoding)):
+            self.assertEqual(TLVReader(buf).get()["Any"], {0: 1, 1: 'hi'})
+
+    def test_trace_decoding(self):
+        encoding = b'\x15\x24\x00\x01\x36\x01\x04\x02\x04\x03\x18\x18'
+        reader = TLVReader(encoding)
+        self.assertEqual(reader.get()["Any"], {0: 1, 1: [2, 3]})
+        self.assertEqual(reader.decoding, [])
+
+        tracingReader = TLVReader(encoding, traceDecoding=True)
+        self.assertEqual(tracingReader.get()["Any"], {0: 1, 1: [2, 3]})
+        self.assertEqual(tracingReader.decoding[0]["type"], "Structure")
+        self.assertEqual(tracingReader.decoding[0]["Structure"][1]["tag"], 1)
+
+    def test_malformed(self):
+        with self.assertRaises(ValueError):
+            TLVReader(bytearray([0b00011001])).get()
+        with self.assertRaises(ValueError):
+            TLVReader(bytearray([0b00001100, 0x05, 0x68])).get()
+
+
+class TestLazyTLVView(unittest.TestCase):
+    def _encode(self, val):
+        writer = TLVWriter()
+        writer.put(None, val)
+        return writer.encoding
+
+    def test_matches_eager_decoding(self):
+        val = {1: [1, 2, {3: "x", 4: b"yy"}], 2: {5: None, 6: True}, (0, 7): -3, 8: [[1], [2, [3]]], 9: TLVList([(1, 2)])}
+        encoding = self._encode(val)
+        reader = TLVReader(encoding)
+        lazy = reader.get(lazy=True)
+        self.assertEqual(lazy, TLVReader(encoding).get())
+        self.assertEqual(reader._bytesRead, len(encoding))
+
+        view = lazy["Any"]
+        self.assertIsInstance(view, LazyTLVStructureView)
+        self.assertIsInstance(view[1], LazyTLVArrayView)
+        self.assertIsInstance(view[1][2], LazyTLVStructureView)
+        self.assertIsInstance(view[9], TLVList)
+        self.assertEqual(view[1][2][3], "x")
+        self.assertEqual(view[1][-1][4], b"yy")
+        self.assertEqual(view[1][0:2], [1, 2])
+        self.assertEqual(len(view), 5)
+        self.assertIn((0, 7), view)
+        self.assertEqual(view.materialize(), TLVReader(encoding).get()["Any"])
+        self.assertIs(type(view[8].materialize()), list)
+
+    def test_unaccessed_containers_are_not_decoded(self):
+        view = TLVReader(self._encode({0: 1, 1: {2: [3, 4]}})).get(lazy=True)["Any"]
+        self.assertEqual(view[0], 1)
+        nested = view[1]
+        self.assertIsNone(nested._elements)
+        self.assertEqual(nested[2], [3, 4])
+        with self.assertRaises(IndexError):
+            TLVReader(self._encode([1])).get(lazy=True)["Any"][1]
+
+    def test_malformed(self):
+        with self.assertRaises(ValueError):
+            TLVReader(b'\x15\x24\x00\x01\x35\x01\x1f\x18\x18').get(lazy=True)
+        with self.assertRaises(ValueError):
+            TLVReader(b'\x15\x0c\x05\x68\x18').get(lazy=True)
+
+
+class TestTLVEventReader(unittest.TestCase):
+    def _encode(self, val):
+        writer = TLVWriter()
+        writer.put(None, val)
+        return writer.encoding
+
+    def test_events(self):
+        encoding = self._encode({1: [tlvUint(1), "x"], 2: {3: None}, 4: True})
+        self.assertEqual(list(iterElements(encoding)), [
+            (0, None, chip.tlv.TLV_TYPE_STRUCTURE, None),
+            (1, 1, chip.tlv.TLV_TYPE_ARRAY, None),
+            (2, None, chip.tlv.TLV_TYPE_UNSIGNED_INTEGER, 1),
+            (2, None, chip.tlv.TLV_TYPE_UTF8_STRING, "x"),
+            (1, None, chip.tlv.TLVEndOfContainer, None),
+            (1, 2, chip.tlv.TLV_TYPE_STRUCTURE, None),
+            (2, 3, chip.tlv.TLV_TYPE_NULL, None),
+            (1, None, chip.tlv.TLVEndOfContainer, None),
+            (1, 4, chip.tlv.TLV_TYPE_BOOLEAN, True),
+            (0, None, chip.tlv.TLVEndOfContainer, None),
+        ])
+
+    def test_skip_container(self):
+        encoding = self._encode([{0: tlvUint(i), 1: [b"\x00" * 16] * 4} for i in range(10)] + [{0: tlvUint(100)}])
+        reader = TLVEventReader(encoding)
+        found = []
+        for depth, tag, _, value in reader:
+            if depth == 2 and tag == 0:
+                found.append(value)
+                if value % 2:
+                    reader.skipContainer()
+        self.assertEqual(found, list(range(10)) + [100])
+        self.assertEqual(reader.depth, 0)
+        self.assertEqual(reader.offset, len(encoding))
+
+        reader = TLVEventReader(encoding)
+        next(reader)
+        self.assertEqual(next(reader)[2], chip.tlv.TLV_TYPE_STRUCTURE)
+        reader.skipContainer()
+        self.assertEqual(next(reader), (1, None, chip.tlv.TLV_TYPE_STRUCTURE, None))
+
+    def test_malformed(self):
+        with self.assertRaises(ValueError):
+            list(TLVEventReader(bytearray([0b00011001])))
+        with self.assertRaises(ValueError):
+            list(TLVEventReader(b'\x18'))
+        with self.assertRaises(ValueError):
+            TLVEventReader(b'\x15\x18').skipContainer()
+
 
 class TestTLVTypes(unittest.TestCase):
     def test_list(self):